@@ -1,3 +1,4 @@
+from typing import Dict
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -6,10 +7,39 @@ class Settings(BaseSettings):
     database_name: str = Field(default="job_scraper")
     cors_origins: str = Field(default="http://localhost:3000")
     scrape_interval_hours: int = Field(default=6)
-    verify_interval_hours: int = Field(default=12)
+    verify_interval_hours: int = Field(default=2)  # How often a verification window runs
     rapidapi_key: str = Field(default="")  # JSearch API key
     google_api_key: str = Field(default="")  # Google Custom Search API key
     google_search_engine_id: str = Field(default="")  # Google Custom Search Engine ID
+    linkedin_max_concurrency: int = Field(default=5)  # Max in-flight LinkedIn requests (shared pool)
+    linkedin_per_host_limit: int = Field(default=4)  # Max concurrent requests to a single LinkedIn host
+    linkedin_min_request_interval: float = Field(default=0.25)  # Min seconds between request starts per host
+    description_fetch_workers: int = Field(default=8)  # Workers in the description fetch stage
+    jsearch_timeout_seconds: float = Field(default=60)  # Per-source timeout for a JSearch scrape
+    linkedin_timeout_seconds: float = Field(default=180)  # Per-source timeout for a LinkedIn scrape
+    job_write_batch_size: int = Field(default=500)  # Upserts per bulk_write when storing jobs
+    seen_job_cache_size: int = Field(default=50000)  # job_ids remembered in memory by the pre-fetch dedup stage
+    count_cache_ttl_seconds: float = Field(default=60)  # How long list totals are served from cache
+    response_cache_ttl_seconds: float = Field(default=30)  # How long hot read responses are served from memory
+    response_cache_max_entries: int = Field(default=256)  # Responses kept by the read cache (LRU)
+    export_batch_size: int = Field(default=500)  # Cursor batch size for /api/jobs/export
+    snapshot_dir: str = Field(default="snapshots/jobs")  # Where snapshot_jobs.py writes partitioned Parquet files
+    company_info_ttl_days: float = Field(default=30)  # How long a found company website/description is cached
+    company_info_miss_ttl_hours: float = Field(default=24)  # How long a lookup that found nothing is cached
+    company_info_prewarm_count: int = Field(default=50)  # Top companies whose info is fetched in the background
+    company_info_prewarm_interval_hours: float = Field(default=24)  # How often the company info pre-warm runs
+    verify_max_concurrency: int = Field(default=32)  # In-flight liveness checks during verification
+    verify_per_host_limit: int = Field(default=8)  # Max concurrent liveness checks against one host
+    verify_min_request_interval: float = Field(default=0.05)  # Min seconds between check starts per host
+    verify_request_timeout: float = Field(default=10)  # Seconds before a liveness check counts as inconclusive
+    verify_write_batch_size: int = Field(default=500)  # Verification outcomes per bulk_write
+    verify_budget_per_run: int = Field(default=5000)  # Most jobs checked by one verification window
+    verify_recheck_hours: Dict[str, float] = Field(default={  # Re-check interval per source (hot sources churn faster)
+        'linkedin': 12, 'indeed': 24, 'glassdoor': 24, 'ziprecruiter': 24, 'arbeitnow': 48
+    })
+    verify_default_recheck_hours: float = Field(default=72)  # Re-check interval for sources not listed above
+    verify_retry_hours: float = Field(default=6)  # Wait before re-checking a job whose check was inconclusive
+    search_recency_half_life_days: float = Field(default=14)  # Age at which a search hit's score is halved
     
     class Config:
         env_file = ".env"
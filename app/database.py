@@ -1,5 +1,6 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config import settings
+from app.metrics import MongoCommandMetrics
 
 class Database:
     client: AsyncIOMotorClient = None
@@ -10,9 +11,14 @@ async def get_database():
     return db.client[settings.database_name]
 
 async def connect_to_mongo():
-    db.client = AsyncIOMotorClient(settings.mongodb_url)
+    db.client = AsyncIOMotorClient(settings.mongodb_url, event_listeners=[MongoCommandMetrics()])
     print("Connected to MongoDB")
 
+async def ensure_indexes():
+    """Apply the index registry (app/indexes.py) to the database"""
+    from app.indexes import ensure_indexes as apply_index_registry
+    await apply_index_registry(db.client[settings.database_name])
+
 async def close_mongo_connection():
     db.client.close()
     print("Closed MongoDB connection")
@@ -0,0 +1,23 @@
+from fastapi import Request
+
+from app.services.company_info_service import CompanyInfoService
+from app.services.container import ServiceContainer
+from app.services.job_query_service import JobQueryService
+from app.services.job_service import JobService
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """The ServiceContainer built by the app lifespan"""
+    return request.app.state.services
+
+
+def get_job_queries(request: Request) -> JobQueryService:
+    return get_services(request).job_queries
+
+
+def get_job_service(request: Request) -> JobService:
+    return get_services(request).job_service
+
+
+def get_company_info_service(request: Request) -> CompanyInfoService:
+    return get_services(request).company_info
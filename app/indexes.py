@@ -0,0 +1,103 @@
+"""
+Index registry
+
+Every index the application relies on is declared here, per collection, and
+applied at startup by `ensure_indexes`. Creating an index that already exists
+with the same definition is a no-op in MongoDB, so this is safe to run on
+every boot.
+"""
+
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# "Has a description" predicate shared by every list query. Queries must use
+# exactly this (or something stricter) for MongoDB to pick the partial indexes.
+HAS_DESCRIPTION = {'description': {'$gt': ''}}
+ACTIVE_WITH_DESCRIPTION = {'is_active': True, **HAS_DESCRIPTION}
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    'jobs': [
+        IndexModel([('job_id', ASCENDING)], unique=True),
+        # Listing pages: get_active_jobs, filter_jobs (_id breaks ties for keyset cursors)
+        IndexModel(
+            [('created_at', DESCENDING), ('_id', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # Category tabs: get_jobs_by_category
+        IndexModel(
+            [('search_category', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # Company pages: get_company_jobs, get_companies
+        IndexModel(
+            [('company', ASCENDING), ('created_at', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # filter_jobs salary range (salary_min/salary_max are annual USD)
+        IndexModel(
+            [('salary_max', ASCENDING), ('created_at', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        IndexModel(
+            [('salary_min', ASCENDING), ('created_at', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # filter_jobs location and remote filters (location_keys is multikey)
+        IndexModel(
+            [('location_keys', ASCENDING), ('created_at', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        IndexModel(
+            [('is_remote', ASCENDING), ('created_at', DESCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # get_categories (distinct) and delete_category
+        IndexModel([('search_category', ASCENDING), ('is_active', ASCENDING)]),
+        # Session job lists
+        IndexModel([('scrape_session_id', ASCENDING), ('created_at', DESCENDING)]),
+        # Verification windows: stalest listed jobs first (JobVerifier.verify_window)
+        IndexModel(
+            [('last_verified', ASCENDING), ('posted_date', ASCENDING)],
+            partialFilterExpression=ACTIVE_WITH_DESCRIPTION,
+        ),
+        # Incremental Parquet snapshots (snapshot_jobs.py)
+        IndexModel([('updated_at', ASCENDING)]),
+        # /api/search (a collection can only have one text index)
+        IndexModel(
+            [('title', TEXT), ('company', TEXT), ('search_category', TEXT), ('description', TEXT)],
+            weights={'title': 10, 'company': 5, 'search_category': 5, 'description': 1},
+        ),
+    ],
+    'scrape_sessions': [
+        IndexModel([('session_id', ASCENDING)], unique=True),
+        IndexModel([('scraped_at', DESCENDING), ('_id', DESCENDING)]),
+    ],
+    # Materialized /api/companies read model, one document per company and day
+    'company_stats': [
+        IndexModel([('company', ASCENDING), ('day', ASCENDING)], unique=True),
+        IndexModel([('day', DESCENDING)]),
+    ],
+    # Google Custom Search results for /api/companies/{name}/info
+    'company_info': [
+        IndexModel([('key', ASCENDING)], unique=True),
+        IndexModel([('expires_at', ASCENDING)], expireAfterSeconds=0),
+    ],
+    'search_metadata': [
+        IndexModel([('search_key', ASCENDING)], unique=True),
+    ],
+}
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase):
+    """Create every registered index, reporting (not raising) on failures"""
+    for collection_name, indexes in INDEXES.items():
+        collection = database[collection_name]
+        for index in indexes:
+            try:
+                await collection.create_indexes([index])
+            except Exception as e:
+                # Usually duplicates blocking a unique index, or an old index with the same keys
+                print(f"⚠️ Could not create index {collection_name}.{index.document['name']}: {e}")
+    print("Indexes ensured")
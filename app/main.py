@@ -1,30 +1,49 @@
-from fastapi import FastAPI, Depends, BackgroundTasks, HTTPException, Query
+from fastapi import FastAPI, Depends, BackgroundTasks, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from contextlib import asynccontextmanager
-from app.database import connect_to_mongo, close_mongo_connection, get_database
+import asyncio
+import time
+from app.database import connect_to_mongo, close_mongo_connection, ensure_indexes, get_database
 from app.config import settings
 from app.models import SearchRequest, JobResponse, CategoriesResponse, FilterRequest
 from app.routers import companies, sessions  # Import sessions router
+from app.dependencies import get_job_queries, get_job_service
+from app.services.container import ServiceContainer
+from app.services.job_query_service import JobQueryService
 from app.services.job_service import JobService
 from app.scheduler import scheduler
+from app import metrics
+from app.responses import BSONResponse
+from app.services.projections import build_projection
+from app.services.response_cache import response_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    await ensure_indexes()
     db = await get_database()
-    job_service = JobService(db)
+    services = ServiceContainer(db)
+    await services.job_queries.company_stats.ensure_built()
     
     # Initialize scheduler
-    scheduler.init_scheduler(job_service)
+    scheduler.init_scheduler(services.job_service)
     
-    # Store job_service in app state
-    app.state.job_service = job_service
+    # Shared by all routers (see app.dependencies)
+    app.state.services = services
+    
+    # Pre-warm company info for the top companies
+    prewarm_task = asyncio.create_task(
+        services.company_info.prewarm_top_companies(services.job_queries.company_stats)
+    )
     
     yield
     
     # Shutdown
+    prewarm_task.cancel()
     scheduler.shutdown()
+    await services.close()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -46,6 +65,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Request latency per route template (not per raw path, to keep label cardinality bounded)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        metrics.http_request_duration.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=route.path if route else "unmatched",
+            status=status
+        )
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus metrics (text exposition format)"""
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/")
 async def root():
     return {"message": "Job Scraper API is running"}
@@ -53,11 +95,12 @@ async def root():
 @app.post("/api/scrape", response_model=dict)
 async def trigger_scrape(
     search: SearchRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    job_service: JobService = Depends(get_job_service)
 ):
     """Trigger immediate scrape for specific role"""
     async def scrape_task():
-        await app.state.job_service.scrape_and_store_jobs(
+        await job_service.scrape_and_store_jobs(
             search.role,
             search.location or "",
             search.platforms,
@@ -72,10 +115,31 @@ async def trigger_scrape(
 async def get_jobs(
     skip: int = 0, 
     limit: int = 100,
-    date_filter: str = Query("all", description="Filter by date: 'today', 'yesterday', 'week', 'all'")
+    date_filter: str = Query("all", description="Filter by date: 'today', 'yesterday', 'week', 'all'"),
+    cursor: str = Query(None, description="next_cursor from the previous page (keyset paging, replaces skip)"),
+    exact_total: bool = Query(False, description="Count now instead of returning the cached total"),
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
+    queries: JobQueryService = Depends(get_job_queries)
 ):
     """Get all active jobs with optional date filtering"""
-    jobs, total = await app.state.job_service.get_active_jobs(skip, limit, date_filter)
+    if skip == 0 and not cursor and not exact_total:
+        # First page is what every page load asks for
+        page = await response_cache.get_or_load(
+            "jobs", (limit, date_filter, view, fields),
+            lambda: _load_jobs_page(queries, skip, limit, date_filter, cursor, exact_total, view, fields)
+        )
+    else:
+        page = await _load_jobs_page(queries, skip, limit, date_filter, cursor, exact_total, view, fields)
+    return BSONResponse(page)
+
+async def _load_jobs_page(queries: JobQueryService, skip, limit, date_filter, cursor, exact_total, view, fields):
+    try:
+        jobs, total, next_cursor = await queries.get_active_jobs(
+            skip, limit, date_filter, cursor, exact_total, view, fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # Count new jobs (posted in last 24 hours)
     from datetime import datetime, timedelta
@@ -83,73 +147,95 @@ async def get_jobs(
     new_jobs_count = 0
     for j in jobs:
         created_at = j.get('created_at')
-        if created_at:
-            try:
-                if isinstance(created_at, str):
-                    # Remove timezone info for comparison
-                    clean_date = created_at.split('+')[0].split('Z')[0]
-                    created_dt = datetime.fromisoformat(clean_date)
-                else:
-                    created_dt = created_at
-                if created_dt > new_threshold:
-                    new_jobs_count += 1
-            except Exception:
-                pass
+        if isinstance(created_at, datetime) and created_at > new_threshold:
+            new_jobs_count += 1
     
     return {
         "jobs": jobs,
         "total": total,
-        "new_jobs_count": new_jobs_count
+        "new_jobs_count": new_jobs_count,
+        "next_cursor": next_cursor
     }
 
 @app.post("/api/search", response_model=list)
-async def search_jobs(search: SearchRequest):
-    """Search jobs by role"""
-    jobs = await app.state.job_service.search_jobs_by_role(
+async def search_jobs(
+    search: SearchRequest,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    queries: JobQueryService = Depends(get_job_queries)
+):
+    """Search jobs by role, ranked by relevance and recency"""
+    jobs = await queries.search_jobs_by_role(
         search.role,
-        search.location or ""
+        search.location or "",
+        skip,
+        limit
     )
-    return jobs
+    return BSONResponse(jobs)
 
 @app.post("/api/verify")
-async def verify_jobs(background_tasks: BackgroundTasks):
-    """Trigger job verification"""
+async def verify_jobs(
+    background_tasks: BackgroundTasks,
+    budget: int = Query(None, ge=1, description="Most jobs to check (default: verify_budget_per_run)"),
+    job_service: JobService = Depends(get_job_service)
+):
+    """Trigger verification of the jobs due for a re-check, stalest first"""
     async def verify_task():
-        await app.state.job_service.verify_jobs_status()
+        await job_service.verify_jobs_status(budget)
     
     background_tasks.add_task(verify_task)
     return {"message": "Verification started in background"}
 
 @app.get("/api/categories", response_model=CategoriesResponse)
-async def get_categories():
+async def get_categories(queries: JobQueryService = Depends(get_job_queries)):
     """Get all search categories (tabs)"""
-    categories = await app.state.job_service.get_categories()
-    return {"categories": categories}
+    async def load():
+        categories = await queries.get_categories()
+        return {"categories": categories}
+    
+    return await response_cache.get_or_load("categories", (), load)
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Hit/miss counters for the read response cache"""
+    return response_cache.stats()
 
 @app.get("/api/jobs/category/{category}")
 async def get_jobs_by_category(
     category: str,
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=500)
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str = Query(None, description="next_cursor from the previous page (keyset paging, replaces skip)"),
+    exact_total: bool = Query(False, description="Count now instead of returning the cached total"),
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
+    queries: JobQueryService = Depends(get_job_queries)
 ):
     """Get jobs by category"""
-    jobs, total = await app.state.job_service.get_jobs_by_category(category, skip, limit)
-    return {"jobs": jobs, "total": total}
+    try:
+        jobs, total, next_cursor = await queries.get_jobs_by_category(
+            category, skip, limit, cursor, exact_total, view, fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BSONResponse({"jobs": jobs, "total": total, "next_cursor": next_cursor})
 
 @app.delete("/api/categories/{category}")
-async def delete_category(category: str):
+async def delete_category(category: str, job_service: JobService = Depends(get_job_service)):
     """Delete a category and all its jobs"""
-    deleted_count = await app.state.job_service.delete_category(category)
+    deleted_count = await job_service.delete_category(category)
     return {"message": f"Deleted {deleted_count} jobs from category: {category}"}
 
 @app.get("/api/jobs/detail/{job_id}")
-async def get_job_by_id(job_id: str):
-    """Get single job with full description by job_id"""
+async def get_job_by_id(job_id: str, queries: JobQueryService = Depends(get_job_queries)):
+    """Get single job with full description by job_id (list endpoints may omit it with view=summary)"""
     try:
-        job = await app.state.job_service.get_job_by_id(job_id)
+        job = await queries.get_job_by_id(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
-        return job
+        return BSONResponse(job)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -161,31 +247,82 @@ async def filter_jobs(
     locations: str = None,
     sources: str = None,
     remote_only: bool = False,
-    date_filter: str = "all"
+    date_filter: str = "all",
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
+    queries: JobQueryService = Depends(get_job_queries)
 ):
     """Filter jobs based on various criteria"""
     job_types_list = job_types.split(",") if job_types else None
     locations_list = locations.split(",") if locations else None
     sources_list = sources.split(",") if sources else None
     
-    result = await app.state.job_service.filter_jobs(
+    try:
+        result = await queries.filter_jobs(
+            min_salary=min_salary,
+            max_salary=max_salary,
+            job_types=job_types_list,
+            locations=locations_list,
+            sources=sources_list,
+            remote_only=remote_only,
+            date_filter=date_filter,
+            view=view,
+            fields=fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BSONResponse(result)
+
+@app.get("/api/jobs/export")
+async def export_jobs(
+    min_salary: int = None,
+    max_salary: int = None,
+    job_types: str = None,
+    locations: str = None,
+    sources: str = None,
+    remote_only: bool = False,
+    date_filter: str = "all",
+    session_id: str = Query(None, description="Only jobs from this scrape session"),
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
+    batch_size: int = Query(None, ge=1, le=10000, description="Jobs fetched per cursor batch"),
+    queries: JobQueryService = Depends(get_job_queries)
+):
+    """
+    Stream every matching job as NDJSON (one JSON document per line)
+    
+    Takes the same filters as /api/jobs/filter but has no row cap: jobs are
+    streamed from the database cursor instead of loaded into memory.
+    """
+    try:
+        build_projection(view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    query = queries.build_filter_query(
         min_salary=min_salary,
         max_salary=max_salary,
-        job_types=job_types_list,
-        locations=locations_list,
-        sources=sources_list,
+        job_types=job_types.split(",") if job_types else None,
+        locations=locations.split(",") if locations else None,
+        sources=sources.split(",") if sources else None,
         remote_only=remote_only,
         date_filter=date_filter
     )
-    return result
+    if session_id:
+        query['scrape_session_id'] = session_id
+    
+    return StreamingResponse(
+        queries.export_jobs(query, view, fields, batch_size),
+        media_type="application/x-ndjson"
+    )
 
 @app.get("/api/search/metadata/{search_key}")
-async def get_search_metadata(search_key: str):
+async def get_search_metadata(search_key: str, queries: JobQueryService = Depends(get_job_queries)):
     """Get metadata for a search query to enable pagination"""
-    metadata = await app.state.job_service.get_search_metadata(search_key)
+    metadata = await queries.get_search_metadata(search_key)
     if not metadata:
         return {"search_key": search_key, "last_offset": 0, "total_scraped": 0}
-    return metadata
+    return BSONResponse(metadata)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,212 @@
+"""
+Prometheus metrics
+
+A small in-process registry of labelled counters and histograms, rendered in
+the Prometheus text exposition format at /metrics. Metrics are updated from
+the request middleware, JobService, the HTTP clients, the Mongo command
+listener and the scheduler thread, so every update takes a lock.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from pymongo import monitoring
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SCRAPE_BUCKETS = (1, 5, 10, 30, 60, 120, 180, 300, 600, 1200)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def time(self, **labels):
+        """Context manager observing the duration of its block"""
+        return _Timer(self, labels)
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), series):
+                    cumulative += count
+                    le = 'le="%s"' % ('+Inf' if bound == float('inf') else _number(bound))
+                    lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(series[-1])}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, *args, **kwargs) -> Counter:
+        metric = Counter(*args, **kwargs)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        metric = Histogram(*args, **kwargs)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# API
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "API request latency by route",
+    ["method", "route", "status"]
+)
+
+# Scraping
+scrape_duration = registry.histogram(
+    "scrape_source_duration_seconds", "Time spent scraping one source in a scrape session",
+    ["source", "outcome"], buckets=SCRAPE_BUCKETS
+)
+scrape_jobs_found = registry.counter(
+    "scrape_jobs_found_total", "Jobs returned by a source (before dedup and description checks)",
+    ["source"]
+)
+scrape_jobs_stored = registry.counter(
+    "scrape_jobs_stored_total", "Scraped jobs by storage outcome",
+    ["outcome"]
+)
+
+# Outbound HTTP
+outbound_requests = registry.counter(
+    "outbound_http_requests_total", "Outbound HTTP requests by host and status code ('error' for transport failures)",
+    ["host", "status"]
+)
+outbound_duration = registry.histogram(
+    "outbound_http_request_duration_seconds", "Outbound HTTP request latency by host",
+    ["host"]
+)
+
+# MongoDB
+mongo_command_duration = registry.histogram(
+    "mongo_command_duration_seconds", "MongoDB command latency by command",
+    ["command"]
+)
+mongo_command_failures = registry.counter(
+    "mongo_command_failures_total", "Failed MongoDB commands by command",
+    ["command"]
+)
+
+# Verification
+jobs_verified = registry.counter(
+    "jobs_verified_total", "Job liveness checks by source and outcome (active/expired/unknown)",
+    ["source", "outcome"]
+)
+
+# Scheduler
+scheduler_runs = registry.counter(
+    "scheduler_runs_total", "Scheduled job runs by outcome",
+    ["job", "outcome"]
+)
+scheduler_run_duration = registry.histogram(
+    "scheduler_run_duration_seconds", "Scheduled job run time",
+    ["job"], buckets=SCRAPE_BUCKETS
+)
+
+
+def observe_outbound(host: str, status, seconds: float):
+    """Record one outbound HTTP request (status is the code, or 'error')"""
+    outbound_requests.inc(host=host, status=status)
+    outbound_duration.observe(seconds, host=host)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo listener feeding mongo_command_* metrics (pass via event_listeners)"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        mongo_command_duration.observe(event.duration_micros / 1e6, command=event.command_name)
+
+    def failed(self, event):
+        mongo_command_duration.observe(event.duration_micros / 1e6, command=event.command_name)
+        mongo_command_failures.inc(command=event.command_name)
@@ -7,6 +7,10 @@ class JobPosting(BaseModel):
     title: str
     company: str
     location: str
+    city: Optional[str] = None  # Parsed from location at ingest
+    region: Optional[str] = None
+    country: Optional[str] = None  # ISO 3166-1 alpha-2
+    is_remote: bool = False
     url: str
     description: Optional[str] = None
     source: str  # "linkedin" or "indeed"
@@ -17,6 +21,8 @@ class JobPosting(BaseModel):
     expired_date: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     salary: Optional[str] = None
+    salary_min: Optional[int] = None  # Annual USD, parsed from salary at ingest
+    salary_max: Optional[int] = None
     job_type: Optional[str] = None
     search_category: Optional[str] = None  # e.g., "Spring Boot", "Frontend"
 
@@ -65,6 +71,7 @@ class JobResponse(BaseModel):
     jobs: list
     total: int
     new_jobs_count: int
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
 
 class CategoriesResponse(BaseModel):
     categories: List[str]
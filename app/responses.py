@@ -0,0 +1,29 @@
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any):
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode raw Mongo documents (ObjectId, datetime) straight to JSON bytes"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class BSONResponse(JSONResponse):
+    """
+    JSON response for raw Mongo documents
+
+    Endpoints return this directly so FastAPI skips response_model validation
+    and jsonable_encoder. datetimes are encoded by orjson in the same ISO
+    8601 format `isoformat()` produces; ObjectIds become strings.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
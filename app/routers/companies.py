@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.database import get_database
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.dependencies import get_company_info_service, get_job_queries
+from app.responses import BSONResponse
+from app.services.company_info_service import CompanyInfoService
+from app.services.job_query_service import JobQueryService
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 
@@ -8,7 +11,7 @@ router = APIRouter()
 async def get_companies(
     search_role: str = None,
     date_filter: str = "all",
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    queries: JobQueryService = Depends(get_job_queries)
 ):
     """
     Get companies aggregated by job count
@@ -17,34 +20,41 @@ async def get_companies(
         search_role: Filter by role/title (optional)
         date_filter: Filter by date - 'today', 'yesterday', 'week', 'all'
     """
-    from app.services.job_service import JobService
+    async def load():
+        return await queries.get_companies(search_role, date_filter)
     
-    job_service = JobService(db)
-    return await job_service.get_companies(search_role, date_filter)
+    return BSONResponse(await response_cache.get_or_load("companies", (search_role, date_filter), load))
 
 @router.get("/api/companies/{company_name}/jobs")
 async def get_company_jobs(
     company_name: str,
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
+    queries: JobQueryService = Depends(get_job_queries)
 ):
     """
     Get all jobs from a specific company
     
     Args:
         company_name: Name of the company
+        view: 'full' or 'summary'
+        fields: Comma-separated fields to return instead of a view
     """
-    from app.services.job_service import JobService
-    
-    job_service = JobService(db)
-    result = await job_service.get_company_jobs(company_name)
+    try:
+        result = await queries.get_company_jobs(company_name, view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if result['total_jobs'] == 0:
         raise HTTPException(status_code=404, detail=f"No jobs found for company: {company_name}")
     
-    return result
+    return BSONResponse(result)
 
 @router.get("/api/companies/{company_name}/info")
-async def get_company_info(company_name: str):
+async def get_company_info(
+    company_name: str,
+    company_info: CompanyInfoService = Depends(get_company_info_service)
+):
     """
     Get company information (website and description) using Google Custom Search API
     
@@ -53,17 +63,7 @@ async def get_company_info(company_name: str):
             "website": "https://www.company.com",
             "description": "Actual company description from Google"
         }
-    """
-    from app.services.company_info_service import CompanyInfoService
     
-    company_info_service = CompanyInfoService()
-    info = await company_info_service.get_company_info(company_name)
-    
-    # If we got a website, try to fetch a better About description
-    if info['website'] and not info['description']:
-        about = await company_info_service.get_company_about(company_name, info['website'])
-        if about:
-            info['description'] = about
-    
-    return info
-
+    Results are cached (see CompanyInfoService), so repeat views cost no quota.
+    """
+    return await company_info.get_info(company_name)
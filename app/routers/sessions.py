@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.database import get_database
+from app.responses import BSONResponse
+from app.services.pagination import apply_cursor, next_cursor
+from app.services.projections import build_projection
 from typing import List
 from datetime import datetime
 
@@ -9,33 +12,41 @@ router = APIRouter()
 @router.get("/api/scrape-sessions")
 async def get_scrape_sessions(
     limit: int = 20,
+    cursor: str = None,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
     Get list of recent scrape sessions
     
-    Returns sessions sorted by scraped_at (newest first)
+    Returns sessions sorted by scraped_at (newest first). Pass `next_cursor`
+    back as `cursor` to get the following page.
+    
+    Completed sessions carry `timings`: per platform/stage durations, HTTP
+    request counts and bytes downloaded, slowest stage first.
     """
     sessions_collection = db.scrape_sessions
     
-    # Get sessions, sorted by date
-    cursor = sessions_collection.find({}).sort("scraped_at", -1).limit(limit)
-    sessions = await cursor.to_list(length=limit)
+    try:
+        query = apply_cursor({}, cursor, field="scraped_at")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Convert ObjectId and datetime to string
-    for session in sessions:
-        session['_id'] = str(session['_id'])
-        if session.get('scraped_at'):
-            session['scraped_at'] = session['scraped_at'].isoformat()
+    # Get sessions, sorted by date
+    sessions_cursor = sessions_collection.find(query).sort([("scraped_at", -1), ("_id", -1)]).limit(limit)
+    sessions = await sessions_cursor.to_list(length=limit)
+    page_cursor = next_cursor(sessions, limit, field="scraped_at")
     
-    return {
+    return BSONResponse({
         "sessions": sessions,
-        "total": len(sessions)
-    }
+        "total": len(sessions),
+        "next_cursor": page_cursor
+    })
 
 @router.get("/api/scrape-sessions/{session_id}/jobs")
 async def get_session_jobs(
     session_id: str,
+    view: str = Query("full", description="'full' or 'summary' (omits description, highlights, skills)"),
+    fields: str = Query(None, description="Comma-separated fields to return instead of a view"),
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
@@ -43,22 +54,17 @@ async def get_session_jobs(
     """
     jobs_collection = db.jobs
     
+    try:
+        projection = build_projection(view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     # Find all jobs with this session_id
-    cursor = jobs_collection.find({"scrape_session_id": session_id}).sort("created_at", -1)
+    cursor = jobs_collection.find({"scrape_session_id": session_id}, projection).sort("created_at", -1)
     jobs = await cursor.to_list(length=1000)
     
-    # Convert ObjectId and datetime to string
-    for job in jobs:
-        job['_id'] = str(job['_id'])
-        if job.get('posted_date'):
-            job['posted_date'] = job['posted_date'].isoformat()
-        if job.get('last_verified'):
-            job['last_verified'] = job['last_verified'].isoformat()
-        if job.get('created_at'):
-            job['created_at'] = job['created_at'].isoformat()
-    
-    return {
+    return BSONResponse({
         "jobs": jobs,
         "total": len(jobs),
         "session_id": session_id
-    }
+    })
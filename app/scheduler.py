@@ -1,7 +1,9 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from app.config import settings
+from app import metrics
 import asyncio
+import time
 
 class JobScheduler:
     def __init__(self):
@@ -33,7 +35,26 @@ class JobScheduler:
         self.scheduler.start()
         print("Scheduler started")
     
+    def _instrumented(self, job: str, run):
+        """Run a scheduled job, recording its duration and outcome"""
+        start = time.perf_counter()
+        outcome = "success"
+        try:
+            run()
+        except Exception as e:
+            outcome = "failure"
+            print(f"❌ Scheduled {job} failed: {e}")
+        finally:
+            metrics.scheduler_runs.inc(job=job, outcome=outcome)
+            metrics.scheduler_run_duration.observe(time.perf_counter() - start, job=job)
+    
     def _run_scrape_job(self):
+        self._instrumented("scrape_jobs", self._scrape)
+    
+    def _run_verify_job(self):
+        self._instrumented("verify_jobs", self._verify)
+    
+    def _scrape(self):
         """Run scraping in async context"""
         # Default search terms (you can make this configurable)
         search_terms = [
@@ -45,20 +66,26 @@ class JobScheduler:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         
-        for role, location in search_terms:
-            loop.run_until_complete(
-                self.job_service.scrape_and_store_jobs(role, location)
-            )
-        
-        loop.close()
+        try:
+            for role, location in search_terms:
+                loop.run_until_complete(
+                    self.job_service.scrape_and_store_jobs(role, location)
+                )
+        finally:
+            # Close the connection pools the scrapers opened on this loop
+            loop.run_until_complete(self.job_service.cleanup())
+            loop.close()
     
-    def _run_verify_job(self):
+    def _verify(self):
         """Run verification in async context"""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         
-        loop.run_until_complete(self.job_service.verify_jobs_status())
-        loop.close()
+        try:
+            loop.run_until_complete(self.job_service.verify_jobs_status())
+        finally:
+            loop.run_until_complete(self.job_service.cleanup())
+            loop.close()
     
     def shutdown(self):
         """Shutdown scheduler"""
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.metrics import observe_outbound
+from app.services.scrape_trace import record_request
+
+
+class _LoopState:
+    """Connection pool and request budgets bound to one event loop"""
+
+    def __init__(self, client: httpx.AsyncClient, max_concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.host_next_start: Dict[str, float] = {}
+
+
+class PooledHttpClient:
+    """
+    Shared, connection-pooled async HTTP client for scrapers
+
+    Wraps a single httpx.AsyncClient (keep-alive connection pool) and an
+    asyncio.Semaphore that bounds the number of in-flight requests. Each host
+    additionally gets its own request budget: at most `per_host_limit`
+    concurrent requests, started no closer than `min_interval` seconds apart.
+    All of this is bound to an event loop, so each loop that uses the client
+    (the API loop, the scheduler thread's loops) gets its own pool and
+    budgets; `aclose()` closes the pool of the loop it is awaited on.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = 5,
+        max_keepalive: int = 10,
+        timeout: float = 15.0,
+        per_host_limit: Optional[int] = None,
+        min_interval: float = 0.0,
+    ):
+        self.headers = headers or {}
+        self.max_concurrency = max_concurrency
+        self.max_keepalive = max_keepalive
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit or max_concurrency
+        self.min_interval = min_interval
+        # Event loop -> its pool and budgets (dropped with the loop)
+        self._states = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                client = httpx.AsyncClient(
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_keepalive,
+                    ),
+                )
+                state = self._states[loop] = _LoopState(client, self.max_concurrency)
+        return state
+
+    @asynccontextmanager
+    async def _slot(self, state: _LoopState, url: str):
+        """Acquire a global slot plus a slot in the target host's budget"""
+        host = urlsplit(url).netloc
+        host_semaphore = state.host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(self.per_host_limit)
+            state.host_semaphores[host] = host_semaphore
+
+        async with host_semaphore:
+            if self.min_interval > 0:
+                now = time.monotonic()
+                start_at = max(now, state.host_next_start.get(host, now))
+                state.host_next_start[host] = start_at + self.min_interval
+                if start_at > now:
+                    await asyncio.sleep(start_at - now)
+            async with state.semaphore:
+                yield
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL through the shared pool, waiting for a free slot in the host budget"""
+        return await self._request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        """HEAD a URL through the shared pool, waiting for a free slot in the host budget"""
+        return await self._request("HEAD", url, **kwargs)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        state = self._state()
+        async with self._slot(state, url):
+            # Timed from when the request leaves, so budget waits don't count as latency
+            start = time.perf_counter()
+            status = "error"
+            try:
+                response = await state.client.request(method, url, **kwargs)
+                status = response.status_code
+                record_request(response.num_bytes_downloaded or len(response.content))
+                return response
+            finally:
+                observe_outbound(urlsplit(url).netloc, status, time.perf_counter() - start)
+
+    async def aclose(self):
+        """Close the connection pool of the running event loop"""
+        with self._lock:
+            state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+
+async def polite_delay(min_seconds: float, max_seconds: float):
+    """Non-blocking random delay between requests"""
+    if max_seconds > 0:
+        await asyncio.sleep(random.uniform(min_seconds, max_seconds))
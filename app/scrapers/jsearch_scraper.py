@@ -1,8 +1,10 @@
-import requests
-import os
 from typing import List, Dict
 from datetime import datetime
 from app.config import settings
+from app.scrapers.http_client import PooledHttpClient
+from app.services.scrape_trace import span
+from app.services.location_parser import structured_location
+from app.services.salary_parser import annualize
 
 class JSearchScraper:
     """JSearch API scraper for job listings from Indeed, LinkedIn, Glassdoor, etc."""
@@ -22,8 +24,9 @@ class JSearchScraper:
             "X-RapidAPI-Key": self.api_key or "",
             "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
         }
+        self.client = PooledHttpClient(headers=self.headers, max_concurrency=2)
     
-    def search_jobs(self, keywords: str, location: str = "", max_pages: int = 1) -> List[Dict]:
+    async def search_jobs(self, keywords: str, location: str = "", max_pages: int = 1, first_page: int = 1) -> List[Dict]:
         """
         Search jobs using JSearch API
         
@@ -31,6 +34,7 @@ class JSearchScraper:
             keywords: Job search keywords (e.g., "Python Developer")
             location: Location (e.g., "San Francisco, CA" or empty for remote/all)
             max_pages: Number of pages to fetch (1 page = ~10 jobs, max 10 pages)
+            first_page: Page to start from (to continue an earlier search)
         
         Returns:
             List of job dictionaries
@@ -42,7 +46,7 @@ class JSearchScraper:
         all_jobs = []
         
         # JSearch uses pages 1-10
-        for page in range(1, min(max_pages + 1, 11)):  # Max 10 pages
+        for page in range(first_page, min(first_page + max_pages, 11)):  # Max 10 pages
             try:
                 # Construct query
                 query = keywords
@@ -56,29 +60,25 @@ class JSearchScraper:
                     "date_posted": "month"  # Jobs from last 30 days
                 }
                 
-                print(f"  📡 Fetching JSearch page {page}/{max_pages}...")
+                print(f"  📡 Fetching JSearch page {page}/{first_page + max_pages - 1}...")
                 
-                response = requests.get(
-                    self.BASE_URL,
-                    headers=self.headers,
-                    params=params,
-                    timeout=15
-                )
+                response = await self.client.get(self.BASE_URL, params=params)
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    jobs_data = data.get('data', [])
+                    with span("parse"):
+                        data = response.json()
+                        jobs_data = data.get('data', [])
+                        
+                        # Parse jobs
+                        for job in jobs_data:
+                            parsed_job = self._parse_job(job)
+                            if parsed_job:
+                                all_jobs.append(parsed_job)
                     
                     if not jobs_data:
                         print(f"  No more jobs found on page {page}")
                         break
                     
-                    # Parse jobs
-                    for job in jobs_data:
-                        parsed_job = self._parse_job(job)
-                        if parsed_job:
-                            all_jobs.append(parsed_job)
-                    
                     print(f"  ✅ Found {len(jobs_data)} jobs on page {page} (Total: {len(all_jobs)})")
                 
                 elif response.status_code == 429:
@@ -113,8 +113,17 @@ class JSearchScraper:
             if job_data.get('job_is_remote'):
                 location = 'Remote'
             
+            # Structured location straight from the API fields
+            location_fields = structured_location(
+                job_data.get('job_city'),
+                job_data.get('job_state'),
+                job_data.get('job_country'),
+                job_data.get('job_is_remote', False)
+            )
+            
             # Extract salary
             salary = None
+            salary_range = {}
             if job_data.get('job_min_salary') and job_data.get('job_max_salary'):
                 min_sal = job_data['job_min_salary']
                 max_sal = job_data['job_max_salary']
@@ -129,6 +138,9 @@ class JSearchScraper:
                         salary = f"${min_sal:,.0f} - ${max_sal:,.0f}/month"
                     elif period == 'HOUR':
                         salary = f"${min_sal:.2f} - ${max_sal:.2f}/hour"
+                
+                # Numeric annual USD range, straight from the API values
+                salary_range = annualize(min_sal, max_sal, period, currency)
             
             # Extract job type
             job_type = None
@@ -198,9 +210,11 @@ class JSearchScraper:
                 'title': job_data.get('job_title', 'No Title'),
                 'company': job_data.get('employer_name', 'Unknown Company'),
                 'location': location,
+                **location_fields,
                 'url': job_data.get('job_apply_link', ''),
                 'source': source,
                 'salary': salary,
+                **salary_range,
                 'job_type': job_type,
                 'description': job_data.get('job_description', ''),
                 'posted_date': posted_date,
@@ -216,3 +230,7 @@ class JSearchScraper:
         except Exception as e:
             print(f"  ⚠️ Error parsing job: {e}")
             return None
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
@@ -1,30 +1,36 @@
-import requests
 from typing import List, Dict
-from datetime import datetime, timedelta
-import time
-import random
+from datetime import datetime
+import asyncio
 import re
+from bs4 import BeautifulSoup
+from app.config import settings
+from app.scrapers.http_client import PooledHttpClient, polite_delay
+from app.services.scrape_trace import span
 
 class LinkedInScraper:
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        })
+        self.client = PooledHttpClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            },
+            max_concurrency=settings.linkedin_max_concurrency,
+            per_host_limit=settings.linkedin_per_host_limit,
+            min_interval=settings.linkedin_min_request_interval,
+        )
     
-    def search_jobs(self, keywords: str, location: str = "", max_pages: int = 5) -> List[Dict]:
-        """Search LinkedIn jobs with pagination to get more results"""
+    async def search_jobs(self, keywords: str, location: str = "", max_pages: int = 5, first_page: int = 0) -> List[Dict]:
+        """Search LinkedIn jobs with pagination to get more results (from `first_page`, 0-based)"""
         all_jobs = []
         
         # Fetch multiple pages (each page has ~10-25 jobs)
-        for page in range(max_pages):
+        for page in range(first_page, first_page + max_pages):
             start = page * 25  # LinkedIn uses 25 jobs per page
             
-            jobs = self._fetch_page(keywords, location, start)
+            jobs = await self._fetch_page(keywords, location, start)
             
             if not jobs:
                 print(f"No more jobs found at page {page + 1}")
@@ -33,12 +39,12 @@ class LinkedInScraper:
             all_jobs.extend(jobs)
             print(f"Page {page + 1}: Found {len(jobs)} jobs (Total: {len(all_jobs)})")
             
-            # Reduced delay from 2-4 seconds to 0.5-1 second for faster scraping
-            time.sleep(random.uniform(0.5, 1))
+            # Non-blocking delay between pages so other requests keep being served
+            await polite_delay(0.5, 1)
         
         return all_jobs
     
-    def _fetch_page(self, keywords: str, location: str, start: int) -> List[Dict]:
+    async def _fetch_page(self, keywords: str, location: str, start: int) -> List[Dict]:
         """Fetch a single page of job results"""
         params = {
             'keywords': keywords,
@@ -48,29 +54,34 @@ class LinkedInScraper:
         }
         
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=15)
+            response = await self.client.get(self.BASE_URL, params=params)
             response.raise_for_status()
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            job_cards = soup.find_all('li')
-            jobs = []
-            
-            for card in job_cards:
-                try:
-                    job_data = self._parse_job_card(card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    continue
-            
-            return jobs
+            # HTML parsing is CPU-bound, keep it off the event loop
+            with span("parse"):
+                return await asyncio.to_thread(self._parse_search_page, response.content)
             
         except Exception as e:
             print(f"LinkedIn page fetch error: {e}")
             return []
     
+    def _parse_search_page(self, content: bytes) -> List[Dict]:
+        """Parse a search results page into job dicts"""
+        soup = BeautifulSoup(content, 'lxml')
+        
+        job_cards = soup.find_all('li')
+        jobs = []
+        
+        for card in job_cards:
+            try:
+                job_data = self._parse_job_card(card)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                continue
+        
+        return jobs
+    
     def _parse_job_card(self, card) -> Dict:
         """Parse individual job card"""
         try:
@@ -113,50 +124,57 @@ class LinkedInScraper:
             print(f"Parse error: {e}")
             return None
     
-    def get_job_details(self, job_url: str) -> Dict:
+    async def get_job_details(self, job_url: str) -> Dict:
         """Get full job description from job page"""
         try:
-            response = self.session.get(job_url, timeout=10)
+            response = await self.client.get(job_url, timeout=10)
             response.raise_for_status()
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            description_elem = soup.find('div', class_='show-more-less-html__markup')
-            description = None
-            
-            if description_elem:
-                # Remove "Apply" buttons and links
-                for tag in description_elem.find_all(['button', 'a'], text=re.compile(r'apply|easy apply', re.I)):
-                    tag.decompose()
-                
-                # Remove script and style tags
-                for tag in description_elem.find_all(['script', 'style']):
-                    tag.decompose()
-                
-                # Remove LinkedIn-specific promotional elements
-                for tag in description_elem.find_all(class_=re.compile(r'.*apply.*|.*button.*', re.I)):
-                    tag.decompose()
-                
-                # Get clean text
-                description = description_elem.get_text(separator='\n', strip=True)
-                
-                # Clean up extra whitespace
-                description = re.sub(r'\n{3,}', '\n\n', description)
-                description = re.sub(r' {2,}', ' ', description)
-            
-            criteria_items = soup.find_all('li', class_='description__job-criteria-item')
-            job_type = None
-            for item in criteria_items:
-                header = item.find('h3')
-                if header and 'Employment type' in header.text:
-                    job_type = item.find('span').text.strip()
-            
-            time.sleep(2)
-            return {
-                'description': description,
-                'job_type': job_type
-            }
+            with span("parse"):
+                return await asyncio.to_thread(self._parse_job_details, response.content)
         except Exception as e:
             print(f"Error fetching job details: {e}")
             return {}
+    
+    def _parse_job_details(self, content: bytes) -> Dict:
+        """Parse description and employment type from a job page"""
+        soup = BeautifulSoup(content, 'lxml')
+        
+        description_elem = soup.find('div', class_='show-more-less-html__markup')
+        description = None
+        
+        if description_elem:
+            # Remove "Apply" buttons and links
+            for tag in description_elem.find_all(['button', 'a'], text=re.compile(r'apply|easy apply', re.I)):
+                tag.decompose()
+            
+            # Remove script and style tags
+            for tag in description_elem.find_all(['script', 'style']):
+                tag.decompose()
+            
+            # Remove LinkedIn-specific promotional elements
+            for tag in description_elem.find_all(class_=re.compile(r'.*apply.*|.*button.*', re.I)):
+                tag.decompose()
+            
+            # Get clean text
+            description = description_elem.get_text(separator='\n', strip=True)
+            
+            # Clean up extra whitespace
+            description = re.sub(r'\n{3,}', '\n\n', description)
+            description = re.sub(r' {2,}', ' ', description)
+        
+        criteria_items = soup.find_all('li', class_='description__job-criteria-item')
+        job_type = None
+        for item in criteria_items:
+            header = item.find('h3')
+            if header and 'Employment type' in header.text:
+                job_type = item.find('span').text.strip()
+        
+        return {
+            'description': description,
+            'job_type': job_type
+        }
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
@@ -1,20 +1,167 @@
 import aiohttp
-import os
-from typing import Optional, Dict
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List
 from urllib.parse import quote_plus
 
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.config import settings
+from app.metrics import observe_outbound
+
 class CompanyInfoService:
-    """Service to fetch company information using Google Custom Search API"""
-    
-    def __init__(self):
-        self.api_key = os.getenv('GOOGLE_API_KEY', '')
-        self.search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID', '')
+    """
+    Service to fetch company information using Google Custom Search API
+
+    Lookups are cached in the `company_info` collection (expired by a TTL
+    index), share one aiohttp session, and concurrent lookups of the same
+    company wait for a single search instead of each spending quota.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase = None):
+        self.api_key = settings.google_api_key
+        self.search_engine_id = settings.google_search_engine_id
         self.base_url = "https://www.googleapis.com/customsearch/v1"
-    
+        self.cache = db.company_info if db is not None else None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    @staticmethod
+    def _cache_key(company_name: str) -> str:
+        return " ".join(company_name.lower().split())
+
+    async def get_info(self, company_name: str) -> Dict[str, Optional[str]]:
+        """
+        Company website and description, from cache when possible
+
+        Returns:
+            {'website': ..., 'description': ...} (plus 'fallback': True when
+            Google credentials are not configured)
+        """
+        if not self.api_key or not self.search_engine_id:
+            return await self.get_company_info(company_name)
+
+        key = self._cache_key(company_name)
+        if self.cache is not None:
+            cached = await self.cache.find_one({'key': key})
+            if cached and cached['expires_at'] > datetime.utcnow():
+                return {'website': cached.get('website'), 'description': cached.get('description')}
+
+        pending = self._in_flight.get(key)
+        if pending:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            info = await self._lookup(company_name)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(info)
+        return info
+
+    async def _lookup(self, company_name: str) -> Dict[str, Optional[str]]:
+        """Search Google and cache what was found (search errors are not cached)"""
+        info = await self.get_company_info(company_name)
+        failed = info.pop('error', False)
+
+        # If we got a website, try to fetch a better About description
+        if info['website'] and not info['description']:
+            about = await self.get_company_about(company_name, info['website'])
+            if about:
+                info['description'] = about
+
+        if self.cache is not None and not failed:
+            if info['website']:
+                ttl = timedelta(days=settings.company_info_ttl_days)
+            else:
+                ttl = timedelta(hours=settings.company_info_miss_ttl_hours)
+            now = datetime.utcnow()
+            await self.cache.update_one(
+                {'key': self._cache_key(company_name)},
+                {'$set': {
+                    'company_name': company_name,
+                    'website': info['website'],
+                    'description': info['description'],
+                    'fetched_at': now,
+                    'expires_at': now + ttl
+                }},
+                upsert=True
+            )
+        return info
+
+    async def prewarm(self, company_names: List[str]) -> int:
+        """
+        Fill the cache for companies that aren't cached yet, one at a time
+
+        Returns:
+            Number of companies looked up
+        """
+        if self.cache is None or not self.api_key or not self.search_engine_id:
+            return 0
+
+        keys = {self._cache_key(name): name for name in company_names if name}
+        cached = await self.cache.distinct('key', {
+            'key': {'$in': list(keys)},
+            'expires_at': {'$gt': datetime.utcnow()}
+        })
+        missing = [name for key, name in keys.items() if key not in set(cached)]
+
+        for company_name in missing:
+            await self.get_info(company_name)
+        return len(missing)
+
+    async def prewarm_top_companies(self, company_stats, interval_hours: float = None):
+        """Background loop: pre-warm the most-viewed companies (the top of /api/companies)"""
+        interval_hours = interval_hours or settings.company_info_prewarm_interval_hours
+        while True:
+            try:
+                companies = await company_stats.top_companies("all", limit=settings.company_info_prewarm_count)
+                fetched = await self.prewarm([company['_id'] for company in companies])
+                if fetched:
+                    print(f"🏢 Pre-warmed company info for {fetched} companies")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Company info pre-warm failed: {e}")
+            await asyncio.sleep(interval_hours * 3600)
+
+    async def _search(self, query: str, num: int) -> Optional[List[Dict]]:
+        """Google Custom Search results, or None if the request failed"""
+        url = f"{self.base_url}?key={self.api_key}&cx={self.search_engine_id}&q={quote_plus(query)}&num={num}"
+        start = time.perf_counter()
+        status = "error"
+        try:
+            async with self._get_session().get(url) as response:
+                status = response.status
+                if response.status != 200:
+                    print(f"Google API error: {response.status}")
+                    return None
+                data = await response.json()
+                return data.get('items') or []
+        finally:
+            observe_outbound("www.googleapis.com", status, time.perf_counter() - start)
+
     async def get_company_info(self, company_name: str) -> Dict[str, Optional[str]]:
         """
         Fetch company website and description using Google Custom Search
-        
+
         Returns:
             {
                 'website': 'https://www.company.com',
@@ -29,75 +176,62 @@ class CompanyInfoService:
                 'description': None,
                 'fallback': True  # Signal that this is fallback mode
             }
-        
+
         try:
             # Search for company official website
-            search_query = f"{company_name} official website"
-            url = f"{self.base_url}?key={self.api_key}&cx={self.search_engine_id}&q={quote_plus(search_query)}&num=1"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if 'items' in data and len(data['items']) > 0:
-                            first_result = data['items'][0]
-                            website = first_result.get('link', '')
-                            snippet = first_result.get('snippet', '')
-                            
-                            # Clean up the snippet to make it a proper description
-                            description = snippet.replace('...', '').strip()
-                            
-                            return {
-                                'website': website,
-                                'description': description
-                            }
-                    else:
-                        print(f"Google API error: {response.status}")
-                        return {'website': None, 'description': None}
-        
+            items = await self._search(f"{company_name} official website", 1)
         except Exception as e:
             print(f"Error fetching company info: {str(e)}")
-            return {'website': None, 'description': None}
-        
+            items = None
+
+        if items is None:
+            return {'website': None, 'description': None, 'error': True}
+
+        if items:
+            first_result = items[0]
+            website = first_result.get('link', '')
+            snippet = first_result.get('snippet', '')
+
+            # Clean up the snippet to make it a proper description
+            description = snippet.replace('...', '').strip()
+
+            return {
+                'website': website,
+                'description': description
+            }
+
         return {'website': None, 'description': None}
-    
+
     async def get_company_about(self, company_name: str, website: str) -> Optional[str]:
         """
         Fetch company About/Description from their website
-        
+
         Args:
             company_name: Name of the company
             website: Company website URL
-            
+
         Returns:
             Company description or None
         """
         try:
             # Search for "About [Company]" content
-            search_query = f"{company_name} about company description"
-            url = f"{self.base_url}?key={self.api_key}&cx={self.search_engine_id}&q={quote_plus(search_query)}&num=3"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if 'items' in data and len(data['items']) > 0:
-                            # Combine snippets from top results for better description
-                            snippets = []
-                            for item in data['items'][:3]:
-                                if website in item.get('link', ''):
-                                    snippet = item.get('snippet', '').strip()
-                                    if snippet and len(snippet) > 50:
-                                        snippets.append(snippet)
-                            
-                            if snippets:
-                                # Return the longest, most descriptive snippet
-                                return max(snippets, key=len)
-        
+            items = await self._search(f"{company_name} about company description", 3)
+
+            if items:
+                # Combine snippets from top results for better description
+                snippets = []
+                for item in items[:3]:
+                    if website in item.get('link', ''):
+                        snippet = item.get('snippet', '').strip()
+                        if snippet and len(snippet) > 50:
+                            snippets.append(snippet)
+
+                if snippets:
+                    # Return the longest, most descriptive snippet
+                    return max(snippets, key=len)
+
         except Exception as e:
             print(f"Error fetching company about: {str(e)}")
             return None
-        
+
         return None
@@ -0,0 +1,259 @@
+import asyncio
+from typing import List, Dict, Iterable
+from datetime import datetime, timedelta
+
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.indexes import ACTIVE_WITH_DESCRIPTION, INDEXES
+
+# Per-bucket caps; the companies endpoint only shows 5 titles and 3 locations
+MAX_TITLES_PER_BUCKET = 20
+MAX_LOCATIONS_PER_BUCKET = 10
+
+# rebuild() aggregates into this collection, then renames it over company_stats
+REBUILD_COLLECTION = 'company_stats_rebuild'
+REFRESH_BATCH_SIZE = 500  # buckets per refresh aggregation
+
+
+def day_bucket(value: datetime) -> datetime:
+    """Midnight UTC of the day `value` falls on"""
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class CompanyStatsStore:
+    """
+    Materialized per-company, per-day job statistics (`company_stats`)
+
+    The job writer feeds newly listed jobs (inserted, or an existing job
+    given its description) in through `record`, and verify
+    runs take expired ones out through `remove`. `/api/companies` then merges
+    a handful of day buckets instead of grouping the whole jobs collection.
+    `rebuild` recomputes everything from `jobs` and is only needed for a
+    fresh deployment or after bulk deletes.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.jobs = db.jobs
+        self.collection = db.company_stats
+        self._rebuild_task = None
+        self._rebuild_requested = False
+
+    async def record(self, jobs: Iterable[Dict]):
+        """Add newly stored jobs to their company/day buckets"""
+        buckets = self._group(jobs)
+        if not buckets:
+            return
+
+        # Job values go in as $literal: in a pipeline update a string starting
+        # with '$' would otherwise be read as a field path
+        operations = []
+        for (company, day), bucket in buckets.items():
+            operations.append(UpdateOne(
+                {'company': company, 'day': day},
+                [{'$set': {
+                    'total_jobs': {'$add': [{'$ifNull': ['$total_jobs', 0]}, bucket['count']]},
+                    'latest_date': {'$max': ['$latest_date', bucket['latest']]},
+                    'oldest_date': {'$min': ['$oldest_date', bucket['oldest']]},
+                    'job_titles': {'$slice': [
+                        {'$setUnion': [{'$ifNull': ['$job_titles', []]}, {'$literal': bucket['titles']}]},
+                        MAX_TITLES_PER_BUCKET
+                    ]},
+                    'sources': {'$setUnion': [{'$ifNull': ['$sources', []]}, {'$literal': bucket['sources']}]},
+                    'locations': {'$slice': [
+                        {'$setUnion': [{'$ifNull': ['$locations', []]}, {'$literal': bucket['locations']}]},
+                        MAX_LOCATIONS_PER_BUCKET
+                    ]},
+                }}],
+                upsert=True
+            ))
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def remove(self, jobs: Iterable[Dict]):
+        """Take jobs that stopped being listed (expired) out of their buckets"""
+        buckets = self._group(jobs)
+        if not buckets:
+            return
+
+        operations = [
+            UpdateOne({'company': company, 'day': day}, {'$inc': {'total_jobs': -bucket['count']}})
+            for (company, day), bucket in buckets.items()
+        ]
+        await self.collection.bulk_write(operations, ordered=False)
+        await self.collection.delete_many({'total_jobs': {'$lte': 0}})
+
+    async def top_companies(self, date_filter: str = "all", limit: int = 100) -> List[Dict]:
+        """
+        Companies by job count, merged from day buckets
+
+        Returns the same shape as a `$group` by company over `jobs`. Date
+        windows are whole UTC days: 'week' covers today and the 6 days before.
+        """
+        today = day_bucket(datetime.utcnow())
+        query = {}
+        if date_filter == "today":
+            query['day'] = today
+        elif date_filter == "yesterday":
+            query['day'] = today - timedelta(days=1)
+        elif date_filter == "week":
+            query['day'] = {'$gte': today - timedelta(days=6)}
+
+        pipeline = [
+            {'$match': query},
+            {
+                '$group': {
+                    '_id': '$company',
+                    'total_jobs': {'$sum': '$total_jobs'},
+                    'latest_date': {'$max': '$latest_date'},
+                    'oldest_date': {'$min': '$oldest_date'},
+                    'job_titles': {'$push': '$job_titles'},
+                    'sources': {'$push': '$sources'},
+                    'locations': {'$push': '$locations'}
+                }
+            },
+            {'$match': {'total_jobs': {'$gt': 0}}},
+            {'$sort': {'total_jobs': -1}},
+            {'$limit': limit}
+        ]
+        companies = await self.collection.aggregate(pipeline).to_list(length=limit)
+
+        # Flatten the per-bucket lists, keeping first-seen order
+        for company in companies:
+            for field in ('job_titles', 'sources', 'locations'):
+                company[field] = list(dict.fromkeys(
+                    value for bucket in company[field] for value in (bucket or [])
+                ))
+        return companies
+
+    async def ensure_built(self):
+        """Rebuild from jobs when the read model is empty (first start after deploy)"""
+        if await self.collection.estimated_document_count() == 0:
+            if await self.jobs.estimated_document_count() > 0:
+                await self.rebuild()
+
+    def rebuild_in_background(self):
+        """
+        Schedule a rebuild on the running event loop
+
+        Requests made while a rebuild is running are coalesced into one more
+        rebuild after it, so at most one runs at a time.
+        """
+        if self._rebuild_task and not self._rebuild_task.done():
+            self._rebuild_requested = True
+            return
+        self._rebuild_task = asyncio.create_task(self._rebuild_until_current())
+
+    async def _rebuild_until_current(self):
+        while True:
+            self._rebuild_requested = False
+            try:
+                await self.rebuild()
+            except Exception as e:
+                print(f"⚠️ company_stats rebuild failed: {e}")
+            if not self._rebuild_requested:
+                return
+
+    async def rebuild(self):
+        """
+        Recompute every bucket from the jobs collection
+
+        The aggregation writes into REBUILD_COLLECTION (created with the
+        company_stats indexes), which is then renamed over company_stats in
+        one step, so readers never see a half-built read model. `record` and
+        `remove` calls made meanwhile went to the collection the rename
+        replaces; the buckets of jobs written since the rebuild started
+        (`updated_at` moves on insert, description fill-up and expiry) are
+        recomputed afterwards to put them back.
+        """
+        print("Rebuilding company_stats from jobs...")
+        # A second early: MongoDB stores dates at millisecond precision
+        started = datetime.utcnow() - timedelta(seconds=1)
+        scratch = self.collection.database[REBUILD_COLLECTION]
+        await scratch.drop()
+        await scratch.create_indexes(INDEXES['company_stats'])
+        pipeline = self._bucket_pipeline(ACTIVE_WITH_DESCRIPTION) + [{'$out': REBUILD_COLLECTION}]
+        await self.jobs.aggregate(pipeline).to_list(length=None)
+        await scratch.rename(self.collection.name, dropTarget=True)
+
+        changed = self.jobs.find({'updated_at': {'$gte': started}}, {'company': 1, 'created_at': 1})
+        keys = {
+            (job['company'], day_bucket(job['created_at']))
+            async for job in changed
+            if job.get('company') and job.get('created_at')
+        }
+        await self.refresh(keys)
+        print(f"company_stats rebuilt ({len(keys)} buckets written during the rebuild refreshed)")
+
+    async def refresh(self, keys: Iterable[tuple]):
+        """Recompute the given (company, day) buckets from the jobs collection"""
+        keys = list(keys)
+        for i in range(0, len(keys), REFRESH_BATCH_SIZE):
+            batch = keys[i:i + REFRESH_BATCH_SIZE]
+            match = {**ACTIVE_WITH_DESCRIPTION, '$or': [
+                {'company': company, 'created_at': {'$gte': day, '$lt': day + timedelta(days=1)}}
+                for company, day in batch
+            ]}
+            buckets = {
+                (bucket['company'], bucket['day']): bucket
+                async for bucket in self.jobs.aggregate(self._bucket_pipeline(match))
+            }
+            operations = [
+                ReplaceOne({'company': company, 'day': day}, buckets[(company, day)], upsert=True)
+                if (company, day) in buckets else DeleteOne({'company': company, 'day': day})
+                for company, day in batch
+            ]
+            await self.collection.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    def _bucket_pipeline(match: Dict) -> List[Dict]:
+        """Group matching jobs into company/day bucket documents"""
+        return [
+            {'$match': match},
+            {
+                '$group': {
+                    '_id': {
+                        'company': '$company',
+                        'day': {'$dateFromString': {
+                            'dateString': {'$dateToString': {'format': '%Y-%m-%d', 'date': '$created_at'}}
+                        }}
+                    },
+                    'total_jobs': {'$sum': 1},
+                    'latest_date': {'$max': '$created_at'},
+                    'oldest_date': {'$min': '$created_at'},
+                    'job_titles': {'$addToSet': '$title'},
+                    'sources': {'$addToSet': '$source'},
+                    'locations': {'$addToSet': '$location'}
+                }
+            },
+            {
+                '$project': {
+                    '_id': 0,
+                    'company': '$_id.company',
+                    'day': '$_id.day',
+                    'total_jobs': 1,
+                    'latest_date': 1,
+                    'oldest_date': 1,
+                    'job_titles': {'$slice': ['$job_titles', MAX_TITLES_PER_BUCKET]},
+                    'sources': 1,
+                    'locations': {'$slice': ['$locations', MAX_LOCATIONS_PER_BUCKET]}
+                }
+            }
+        ]
+
+    def _group(self, jobs: Iterable[Dict]) -> Dict:
+        buckets = {}
+        for job in jobs:
+            created_at = job.get('created_at')
+            if not job.get('company') or not created_at:
+                continue
+            bucket = buckets.setdefault((job['company'], day_bucket(created_at)), {
+                'count': 0, 'latest': created_at, 'oldest': created_at,
+                'titles': [], 'sources': [], 'locations': []
+            })
+            bucket['count'] += 1
+            bucket['latest'] = max(bucket['latest'], created_at)
+            bucket['oldest'] = min(bucket['oldest'], created_at)
+            for field, key in (('titles', 'title'), ('sources', 'source'), ('locations', 'location')):
+                if job.get(key) and job[key] not in bucket[field]:
+                    bucket[field].append(job[key])
+        return buckets
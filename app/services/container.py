@@ -0,0 +1,26 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.services.company_info_service import CompanyInfoService
+from app.services.job_query_service import JobQueryService
+from app.services.job_service import JobService
+
+
+class ServiceContainer:
+    """
+    App-scoped services, built once at startup and shared by every router
+
+    Read endpoints get `job_queries`, which holds no HTTP clients. Only the
+    scrape/verify/delete endpoints and the scheduler use `job_service`,
+    the one place scrapers are constructed.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.job_queries = JobQueryService(db)
+        self.job_service = JobService(db)
+        self.company_info = CompanyInfoService(db)
+
+    async def close(self):
+        """Close the HTTP clients owned by the services"""
+        await self.job_service.cleanup()
+        await self.company_info.close()
@@ -0,0 +1,56 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import settings
+
+
+class CountCache:
+    """
+    TTL cache for list totals
+
+    `count_documents` has to walk every matching index entry, which is most
+    of the cost of a list page. Totals are cached per logical query (e.g.
+    ("active", "week")) for a short TTL and dropped whenever jobs are
+    written or deleted, so a page request normally costs a dict lookup.
+    """
+
+    def __init__(self, ttl_seconds: float = None, max_entries: int = 1024):
+        self.ttl_seconds = settings.count_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    async def count(
+        self,
+        collection: AsyncIOMotorCollection,
+        key: Hashable,
+        query: Dict,
+        exact: bool = False
+    ) -> int:
+        """
+        Total for `query`, cached under `key`
+
+        Args:
+            key: Stable description of the query (date windows move, so don't key on the query itself)
+            exact: Skip the cache and count now (the fresh value is cached)
+        """
+        if not exact:
+            entry = self._entries.get(key)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+
+        total = await collection.count_documents(query)
+        self._entries[key] = (total, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return total
+
+    def invalidate(self):
+        """Drop every cached total (call after jobs are inserted, expired or deleted)"""
+        self._entries.clear()
+
+
+count_cache = CountCache()
@@ -0,0 +1,59 @@
+import asyncio
+from typing import List, Dict
+
+from app.config import settings
+
+
+class DescriptionFetcher:
+    """
+    Description fetch stage for scraped jobs
+
+    Runs a fixed pool of workers over a queue of jobs and fills in
+    `description` (and `job_type` when missing) from the scraper's detail
+    page. Politeness towards the job board is enforced by the scraper's
+    per-host request budget, not by sleeping between jobs.
+    """
+
+    def __init__(self, scraper, workers: int = None):
+        self.scraper = scraper
+        self.workers = workers or settings.description_fetch_workers
+
+    async def fetch_all(self, jobs: List[Dict]) -> int:
+        """
+        Fetch details for every job in parallel
+
+        Args:
+            jobs: Job dicts with a `url`, updated in place
+
+        Returns:
+            Number of jobs that received a description
+        """
+        if not jobs:
+            return 0
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        fetched = 0
+
+        async def worker():
+            nonlocal fetched
+            while True:
+                try:
+                    job = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    details = await self.scraper.get_job_details(job['url'])
+                    if details.get('description'):
+                        job['description'] = details['description']
+                        fetched += 1
+                    if details.get('job_type') and not job.get('job_type'):
+                        job['job_type'] = details['job_type']
+                except Exception as e:
+                    print(f"  ⚠️ Error fetching details for {job.get('job_id')}: {e}")
+
+        worker_count = min(self.workers, len(jobs))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+        return fetched
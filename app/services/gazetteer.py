@@ -0,0 +1,296 @@
+"""
+Bundled offline gazetteer for location parsing
+
+Small on purpose: countries, first-level regions for the countries we see
+most, and the cities that make up the bulk of scraped postings. Anything
+not listed still parses, it just isn't enriched with a region/country.
+"""
+
+# ISO 3166-1 alpha-2 code -> (canonical name, aliases)
+COUNTRIES = {
+    'US': ('United States', ['usa', 'u.s.', 'u.s.a.', 'united states of america', 'america']),
+    'CA': ('Canada', []),
+    'GB': ('United Kingdom', ['uk', 'u.k.', 'great britain', 'britain']),
+    'IE': ('Ireland', []),
+    'DE': ('Germany', ['deutschland']),
+    'FR': ('France', []),
+    'NL': ('Netherlands', ['the netherlands', 'holland']),
+    'BE': ('Belgium', []),
+    'LU': ('Luxembourg', []),
+    'CH': ('Switzerland', []),
+    'AT': ('Austria', []),
+    'ES': ('Spain', []),
+    'PT': ('Portugal', []),
+    'IT': ('Italy', []),
+    'SE': ('Sweden', []),
+    'NO': ('Norway', []),
+    'DK': ('Denmark', []),
+    'FI': ('Finland', []),
+    'PL': ('Poland', []),
+    'CZ': ('Czechia', ['czech republic']),
+    'RO': ('Romania', []),
+    'HU': ('Hungary', []),
+    'GR': ('Greece', []),
+    'UA': ('Ukraine', []),
+    'TR': ('Turkey', ['türkiye', 'turkiye']),
+    'IL': ('Israel', []),
+    'AE': ('United Arab Emirates', ['uae', 'u.a.e.']),
+    'SA': ('Saudi Arabia', []),
+    'QA': ('Qatar', []),
+    'EG': ('Egypt', []),
+    'ZA': ('South Africa', []),
+    'NG': ('Nigeria', []),
+    'KE': ('Kenya', []),
+    'IN': ('India', []),
+    'PK': ('Pakistan', []),
+    'BD': ('Bangladesh', []),
+    'LK': ('Sri Lanka', []),
+    'SG': ('Singapore', []),
+    'MY': ('Malaysia', []),
+    'ID': ('Indonesia', []),
+    'PH': ('Philippines', []),
+    'VN': ('Vietnam', ['viet nam']),
+    'TH': ('Thailand', []),
+    'CN': ('China', []),
+    'HK': ('Hong Kong', ['hong kong sar']),
+    'TW': ('Taiwan', []),
+    'JP': ('Japan', []),
+    'KR': ('South Korea', ['korea', 'republic of korea']),
+    'AU': ('Australia', []),
+    'NZ': ('New Zealand', []),
+    'MX': ('Mexico', ['méxico']),
+    'BR': ('Brazil', ['brasil']),
+    'AR': ('Argentina', []),
+    'CL': ('Chile', []),
+    'CO': ('Colombia', []),
+    'PE': ('Peru', []),
+    'CR': ('Costa Rica', []),
+}
+
+# Country code -> {region code: region name}
+REGIONS = {
+    'US': {
+        'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+        'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'DC': 'District of Columbia',
+        'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois',
+        'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana',
+        'ME': 'Maine', 'MD': 'Maryland', 'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota',
+        'MS': 'Mississippi', 'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+        'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+        'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma', 'OR': 'Oregon',
+        'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota',
+        'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont', 'VA': 'Virginia',
+        'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+        'PR': 'Puerto Rico',
+    },
+    'CA': {
+        'AB': 'Alberta', 'BC': 'British Columbia', 'MB': 'Manitoba', 'NB': 'New Brunswick',
+        'NL': 'Newfoundland and Labrador', 'NS': 'Nova Scotia', 'NT': 'Northwest Territories',
+        'NU': 'Nunavut', 'ON': 'Ontario', 'PE': 'Prince Edward Island', 'QC': 'Quebec',
+        'SK': 'Saskatchewan', 'YT': 'Yukon',
+    },
+    'AU': {
+        'ACT': 'Australian Capital Territory', 'NSW': 'New South Wales', 'NT': 'Northern Territory',
+        'QLD': 'Queensland', 'SA': 'South Australia', 'TAS': 'Tasmania', 'VIC': 'Victoria',
+        'WA': 'Western Australia',
+    },
+    'GB': {
+        'ENG': 'England', 'SCT': 'Scotland', 'WLS': 'Wales', 'NIR': 'Northern Ireland',
+    },
+    'IN': {
+        'KA': 'Karnataka', 'MH': 'Maharashtra', 'TG': 'Telangana', 'TN': 'Tamil Nadu',
+        'DL': 'Delhi', 'HR': 'Haryana', 'UP': 'Uttar Pradesh', 'GJ': 'Gujarat', 'WB': 'West Bengal',
+        'KL': 'Kerala', 'RJ': 'Rajasthan',
+    },
+    'DE': {
+        'BE': 'Berlin', 'BY': 'Bavaria', 'BW': 'Baden-Württemberg', 'HE': 'Hesse', 'HH': 'Hamburg',
+        'NW': 'North Rhine-Westphalia',
+    },
+}
+
+# Lower-cased city (or metro alias) -> (canonical city, region name or None, country code)
+CITIES = {
+    # United States
+    'new york': ('New York', 'New York', 'US'),
+    'new york city': ('New York', 'New York', 'US'),
+    'nyc': ('New York', 'New York', 'US'),
+    'brooklyn': ('Brooklyn', 'New York', 'US'),
+    'san francisco': ('San Francisco', 'California', 'US'),
+    'san francisco bay area': ('San Francisco', 'California', 'US'),
+    'bay area': ('San Francisco', 'California', 'US'),
+    'san jose': ('San Jose', 'California', 'US'),
+    'palo alto': ('Palo Alto', 'California', 'US'),
+    'mountain view': ('Mountain View', 'California', 'US'),
+    'sunnyvale': ('Sunnyvale', 'California', 'US'),
+    'santa clara': ('Santa Clara', 'California', 'US'),
+    'oakland': ('Oakland', 'California', 'US'),
+    'los angeles': ('Los Angeles', 'California', 'US'),
+    'san diego': ('San Diego', 'California', 'US'),
+    'irvine': ('Irvine', 'California', 'US'),
+    'sacramento': ('Sacramento', 'California', 'US'),
+    'seattle': ('Seattle', 'Washington', 'US'),
+    'bellevue': ('Bellevue', 'Washington', 'US'),
+    'redmond': ('Redmond', 'Washington', 'US'),
+    'portland': ('Portland', 'Oregon', 'US'),
+    'austin': ('Austin', 'Texas', 'US'),
+    'dallas': ('Dallas', 'Texas', 'US'),
+    'dallas-fort worth': ('Dallas', 'Texas', 'US'),
+    'dfw': ('Dallas', 'Texas', 'US'),
+    'houston': ('Houston', 'Texas', 'US'),
+    'san antonio': ('San Antonio', 'Texas', 'US'),
+    'plano': ('Plano', 'Texas', 'US'),
+    'chicago': ('Chicago', 'Illinois', 'US'),
+    'boston': ('Boston', 'Massachusetts', 'US'),
+    'cambridge, ma': ('Cambridge', 'Massachusetts', 'US'),
+    'washington dc': ('Washington', 'District of Columbia', 'US'),
+    'washington, dc': ('Washington', 'District of Columbia', 'US'),
+    'washington d.c.': ('Washington', 'District of Columbia', 'US'),
+    'arlington': ('Arlington', 'Virginia', 'US'),
+    'mclean': ('McLean', 'Virginia', 'US'),
+    'reston': ('Reston', 'Virginia', 'US'),
+    'baltimore': ('Baltimore', 'Maryland', 'US'),
+    'philadelphia': ('Philadelphia', 'Pennsylvania', 'US'),
+    'pittsburgh': ('Pittsburgh', 'Pennsylvania', 'US'),
+    'atlanta': ('Atlanta', 'Georgia', 'US'),
+    'miami': ('Miami', 'Florida', 'US'),
+    'tampa': ('Tampa', 'Florida', 'US'),
+    'orlando': ('Orlando', 'Florida', 'US'),
+    'jacksonville': ('Jacksonville', 'Florida', 'US'),
+    'charlotte': ('Charlotte', 'North Carolina', 'US'),
+    'raleigh': ('Raleigh', 'North Carolina', 'US'),
+    'durham': ('Durham', 'North Carolina', 'US'),
+    'nashville': ('Nashville', 'Tennessee', 'US'),
+    'denver': ('Denver', 'Colorado', 'US'),
+    'boulder': ('Boulder', 'Colorado', 'US'),
+    'phoenix': ('Phoenix', 'Arizona', 'US'),
+    'scottsdale': ('Scottsdale', 'Arizona', 'US'),
+    'salt lake city': ('Salt Lake City', 'Utah', 'US'),
+    'las vegas': ('Las Vegas', 'Nevada', 'US'),
+    'minneapolis': ('Minneapolis', 'Minnesota', 'US'),
+    'detroit': ('Detroit', 'Michigan', 'US'),
+    'columbus': ('Columbus', 'Ohio', 'US'),
+    'cleveland': ('Cleveland', 'Ohio', 'US'),
+    'cincinnati': ('Cincinnati', 'Ohio', 'US'),
+    'indianapolis': ('Indianapolis', 'Indiana', 'US'),
+    'st. louis': ('St. Louis', 'Missouri', 'US'),
+    'kansas city': ('Kansas City', 'Missouri', 'US'),
+    'milwaukee': ('Milwaukee', 'Wisconsin', 'US'),
+    'jersey city': ('Jersey City', 'New Jersey', 'US'),
+    'newark': ('Newark', 'New Jersey', 'US'),
+    'stamford': ('Stamford', 'Connecticut', 'US'),
+    # Canada
+    'toronto': ('Toronto', 'Ontario', 'CA'),
+    'ottawa': ('Ottawa', 'Ontario', 'CA'),
+    'waterloo': ('Waterloo', 'Ontario', 'CA'),
+    'vancouver': ('Vancouver', 'British Columbia', 'CA'),
+    'montreal': ('Montreal', 'Quebec', 'CA'),
+    'montréal': ('Montreal', 'Quebec', 'CA'),
+    'calgary': ('Calgary', 'Alberta', 'CA'),
+    'edmonton': ('Edmonton', 'Alberta', 'CA'),
+    # Europe
+    'london': ('London', 'England', 'GB'),
+    'manchester': ('Manchester', 'England', 'GB'),
+    'cambridge': ('Cambridge', 'England', 'GB'),
+    'oxford': ('Oxford', 'England', 'GB'),
+    'bristol': ('Bristol', 'England', 'GB'),
+    'edinburgh': ('Edinburgh', 'Scotland', 'GB'),
+    'glasgow': ('Glasgow', 'Scotland', 'GB'),
+    'belfast': ('Belfast', 'Northern Ireland', 'GB'),
+    'dublin': ('Dublin', None, 'IE'),
+    'berlin': ('Berlin', 'Berlin', 'DE'),
+    'munich': ('Munich', 'Bavaria', 'DE'),
+    'münchen': ('Munich', 'Bavaria', 'DE'),
+    'hamburg': ('Hamburg', 'Hamburg', 'DE'),
+    'frankfurt': ('Frankfurt', 'Hesse', 'DE'),
+    'cologne': ('Cologne', 'North Rhine-Westphalia', 'DE'),
+    'stuttgart': ('Stuttgart', 'Baden-Württemberg', 'DE'),
+    'paris': ('Paris', None, 'FR'),
+    'amsterdam': ('Amsterdam', None, 'NL'),
+    'rotterdam': ('Rotterdam', None, 'NL'),
+    'brussels': ('Brussels', None, 'BE'),
+    'zurich': ('Zurich', None, 'CH'),
+    'zürich': ('Zurich', None, 'CH'),
+    'geneva': ('Geneva', None, 'CH'),
+    'vienna': ('Vienna', None, 'AT'),
+    'madrid': ('Madrid', None, 'ES'),
+    'barcelona': ('Barcelona', None, 'ES'),
+    'lisbon': ('Lisbon', None, 'PT'),
+    'milan': ('Milan', None, 'IT'),
+    'rome': ('Rome', None, 'IT'),
+    'stockholm': ('Stockholm', None, 'SE'),
+    'oslo': ('Oslo', None, 'NO'),
+    'copenhagen': ('Copenhagen', None, 'DK'),
+    'helsinki': ('Helsinki', None, 'FI'),
+    'warsaw': ('Warsaw', None, 'PL'),
+    'krakow': ('Krakow', None, 'PL'),
+    'kraków': ('Krakow', None, 'PL'),
+    'prague': ('Prague', None, 'CZ'),
+    'bucharest': ('Bucharest', None, 'RO'),
+    'budapest': ('Budapest', None, 'HU'),
+    'athens': ('Athens', None, 'GR'),
+    'kyiv': ('Kyiv', None, 'UA'),
+    'istanbul': ('Istanbul', None, 'TR'),
+    # Middle East and Africa
+    'tel aviv': ('Tel Aviv', None, 'IL'),
+    'dubai': ('Dubai', None, 'AE'),
+    'abu dhabi': ('Abu Dhabi', None, 'AE'),
+    'riyadh': ('Riyadh', None, 'SA'),
+    'doha': ('Doha', None, 'QA'),
+    'cairo': ('Cairo', None, 'EG'),
+    'cape town': ('Cape Town', None, 'ZA'),
+    'johannesburg': ('Johannesburg', None, 'ZA'),
+    'lagos': ('Lagos', None, 'NG'),
+    'nairobi': ('Nairobi', None, 'KE'),
+    # Asia Pacific
+    'bengaluru': ('Bengaluru', 'Karnataka', 'IN'),
+    'bangalore': ('Bengaluru', 'Karnataka', 'IN'),
+    'mumbai': ('Mumbai', 'Maharashtra', 'IN'),
+    'pune': ('Pune', 'Maharashtra', 'IN'),
+    'hyderabad': ('Hyderabad', 'Telangana', 'IN'),
+    'chennai': ('Chennai', 'Tamil Nadu', 'IN'),
+    'new delhi': ('New Delhi', 'Delhi', 'IN'),
+    'delhi': ('New Delhi', 'Delhi', 'IN'),
+    'gurugram': ('Gurugram', 'Haryana', 'IN'),
+    'gurgaon': ('Gurugram', 'Haryana', 'IN'),
+    'noida': ('Noida', 'Uttar Pradesh', 'IN'),
+    'kolkata': ('Kolkata', 'West Bengal', 'IN'),
+    'ahmedabad': ('Ahmedabad', 'Gujarat', 'IN'),
+    'karachi': ('Karachi', None, 'PK'),
+    'lahore': ('Lahore', None, 'PK'),
+    'islamabad': ('Islamabad', None, 'PK'),
+    'dhaka': ('Dhaka', None, 'BD'),
+    'singapore': ('Singapore', None, 'SG'),
+    'kuala lumpur': ('Kuala Lumpur', None, 'MY'),
+    'jakarta': ('Jakarta', None, 'ID'),
+    'manila': ('Manila', None, 'PH'),
+    'ho chi minh city': ('Ho Chi Minh City', None, 'VN'),
+    'hanoi': ('Hanoi', None, 'VN'),
+    'bangkok': ('Bangkok', None, 'TH'),
+    'shanghai': ('Shanghai', None, 'CN'),
+    'beijing': ('Beijing', None, 'CN'),
+    'shenzhen': ('Shenzhen', None, 'CN'),
+    'taipei': ('Taipei', None, 'TW'),
+    'tokyo': ('Tokyo', None, 'JP'),
+    'osaka': ('Osaka', None, 'JP'),
+    'seoul': ('Seoul', None, 'KR'),
+    'sydney': ('Sydney', 'New South Wales', 'AU'),
+    'melbourne': ('Melbourne', 'Victoria', 'AU'),
+    'brisbane': ('Brisbane', 'Queensland', 'AU'),
+    'perth': ('Perth', 'Western Australia', 'AU'),
+    'auckland': ('Auckland', None, 'NZ'),
+    'wellington': ('Wellington', None, 'NZ'),
+    # Americas
+    'mexico city': ('Mexico City', None, 'MX'),
+    'guadalajara': ('Guadalajara', None, 'MX'),
+    'são paulo': ('São Paulo', None, 'BR'),
+    'sao paulo': ('São Paulo', None, 'BR'),
+    'rio de janeiro': ('Rio de Janeiro', None, 'BR'),
+    'buenos aires': ('Buenos Aires', None, 'AR'),
+    'santiago': ('Santiago', None, 'CL'),
+    'bogotá': ('Bogotá', None, 'CO'),
+    'bogota': ('Bogotá', None, 'CO'),
+    'medellín': ('Medellín', None, 'CO'),
+    'medellin': ('Medellín', None, 'CO'),
+    'lima': ('Lima', None, 'PE'),
+    'san josé': ('San José', None, 'CR'),
+}
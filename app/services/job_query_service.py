@@ -0,0 +1,382 @@
+from typing import List, Dict
+from datetime import datetime
+import re
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.config import settings
+from app.indexes import HAS_DESCRIPTION
+from app.responses import dumps
+from app.services.company_stats import CompanyStatsStore
+from app.services.count_cache import count_cache
+from app.services.location_parser import filter_keys
+from app.services.pagination import apply_cursor, next_cursor
+from app.services.projections import build_projection
+
+class JobQueryService:
+    """
+    Read-only queries behind the API endpoints
+    
+    Owns no scrapers or HTTP clients, so it is cheap to construct and safe to
+    share across requests. Scraping and anything that writes jobs lives in
+    JobService.
+    """
+    
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db.jobs
+        self.company_stats = CompanyStatsStore(db)
+    
+    async def get_active_jobs(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        date_filter: str = "all",
+        cursor: str = None,
+        exact_total: bool = False,
+        view: str = "full",
+        fields: str = None
+    ):
+        """
+        Get all active jobs with descriptions
+        
+        Args:
+            skip: Number of jobs to skip (ignored when `cursor` is given)
+            limit: Number of jobs to return
+            date_filter: Filter by date - 'today', 'yesterday', 'week', 'all'
+            cursor: Opaque token from a previous page's `next_cursor`
+            exact_total: Count now instead of using the cached total
+            view: 'full' or 'summary' (no description/highlights/skills)
+            fields: Comma-separated fields to return instead of a view
+        
+        Returns:
+            (jobs, total, next_cursor)
+        """
+        from datetime import datetime, timedelta
+        
+        # Build base query
+        query = {
+            'is_active': True,
+            **HAS_DESCRIPTION
+        }
+        
+        # Add date filter
+        if date_filter == "today":
+            # Jobs scraped today (since midnight UTC)
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            query['created_at'] = {'$gte': today_start}
+        elif date_filter == "yesterday":
+            # Jobs scraped yesterday
+            yesterday_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            query['created_at'] = {'$gte': yesterday_start, '$lt': today_start}
+        elif date_filter == "week":
+            # Jobs scraped in the last 7 days
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            query['created_at'] = {'$gte': week_ago}
+        # If "all", no date filter is applied
+        
+        jobs = await self._find_page(query, skip, limit, cursor, build_projection(view, fields))
+        total = await count_cache.count(self.collection, ('active', date_filter), query, exact_total)
+        page_cursor = next_cursor(jobs, limit)
+        
+        return jobs, total, page_cursor
+    
+    async def _find_page(
+        self,
+        query: Dict,
+        skip: int,
+        limit: int,
+        cursor: str = None,
+        projection: Dict = None
+    ) -> List[Dict]:
+        """
+        Fetch one page newest-first, by keyset cursor when given, else by skip
+        
+        Raises:
+            ValueError if the cursor is malformed
+        """
+        sort = [('created_at', -1), ('_id', -1)]
+        if cursor:
+            page_query = apply_cursor(dict(query), cursor)
+            return await self.collection.find(page_query, projection).sort(sort).limit(limit).to_list(length=limit)
+        return await self.collection.find(query, projection).sort(sort).skip(skip).limit(limit).to_list(length=limit)
+    
+    async def search_jobs_by_role(self, role: str, location: str = "", skip: int = 0, limit: int = 50):
+        """
+        Full-text search over title, company, category and description
+        
+        Uses the `jobs` text index. Results are ranked by text relevance
+        damped by age: a job SEARCH_RECENCY_HALF_LIFE_DAYS old scores half
+        as much as an equally relevant job posted now.
+        
+        Args:
+            role: Search terms
+            location: Case-insensitive substring match on location (taken literally)
+            skip: Number of results to skip
+            limit: Number of results to return
+        """
+        query = {
+            '$text': {'$search': role},
+            'is_active': True,
+            **HAS_DESCRIPTION
+        }
+        
+        if location:
+            query['location'] = {'$regex': re.escape(location), '$options': 'i'}
+        
+        half_life_ms = settings.search_recency_half_life_days * 24 * 60 * 60 * 1000
+        pipeline = [
+            {'$match': query},
+            {'$addFields': {'relevance': {'$meta': 'textScore'}}},
+            {'$addFields': {
+                # Age clamped at 0 so a created_at in the future can't zero or flip the denominator
+                '_rank': {'$divide': [
+                    '$relevance',
+                    {'$add': [1, {'$divide': [
+                        {'$max': [0, {'$subtract': [datetime.utcnow(), '$created_at']}]},
+                        half_life_ms
+                    ]}]}
+                ]}
+            }},
+            {'$sort': {'_rank': -1, 'created_at': -1}},
+            {'$skip': skip},
+            {'$limit': limit},
+            {'$project': {'_rank': 0}}
+        ]
+        jobs = await self.collection.aggregate(pipeline).to_list(length=limit)
+        
+        return jobs
+    
+    async def get_categories(self):
+        """Get all unique search categories"""
+        categories = await self.collection.distinct('search_category', {'is_active': True})
+        # Filter out None values and sort
+        return sorted([c for c in categories if c])
+    
+    async def get_jobs_by_category(
+        self,
+        category: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str = None,
+        exact_total: bool = False,
+        view: str = "full",
+        fields: str = None
+    ):
+        """
+        Get jobs by search category (with descriptions only)
+        
+        Totals come from the count cache unless `exact_total` is set.
+        `view`/`fields` select the projection as in get_active_jobs.
+        
+        Returns:
+            (jobs, total, next_cursor)
+        """
+        query = {
+            'is_active': True,
+            **HAS_DESCRIPTION
+        }
+        if category and category != 'All':
+            query['search_category'] = category
+        
+        jobs = await self._find_page(query, skip, limit, cursor, build_projection(view, fields))
+        total = await count_cache.count(self.collection, ('category', category), query, exact_total)
+        page_cursor = next_cursor(jobs, limit)
+        
+        return jobs, total, page_cursor
+    
+    async def get_job_by_id(self, job_id: str):
+        """Get single job by job_id with full description"""
+        job = await self.collection.find_one({'job_id': job_id})
+        
+        if not job:
+            return None
+        
+        return job
+    
+    async def get_companies(self, search_role: str = None, date_filter: str = "all"):
+        """Get companies aggregated by job count"""
+        if search_role:
+            # Role filters need the job titles, so they still aggregate over jobs
+            companies = await self._aggregate_companies(search_role, date_filter)
+        else:
+            companies = await self.company_stats.top_companies(date_filter)
+        
+        # Format results
+        formatted_companies = []
+        for company in companies:
+            formatted_companies.append({
+                'company_name': company['_id'],
+                'total_jobs': company['total_jobs'],
+                'latest_job_date': company.get('latest_date'),
+                'oldest_job_date': company.get('oldest_date'),
+                'job_titles': company['job_titles'][:5],  # Limit to 5 titles
+                'sources': company['sources'],
+                'locations': company['locations'][:3]  # Limit to 3 locations
+            })
+        
+        return {
+            'companies': formatted_companies,
+            'total': len(formatted_companies)
+        }
+    
+    async def _aggregate_companies(self, search_role: str, date_filter: str):
+        """Live company aggregation over jobs matching a role"""
+        from datetime import timedelta
+        
+        # Build date filter
+        query = {'is_active': True, **HAS_DESCRIPTION}
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        if date_filter == "today":
+            query['created_at'] = {'$gte': today_start}
+        elif date_filter == "yesterday":
+            query['created_at'] = {'$gte': today_start - timedelta(days=1), '$lt': today_start}
+        elif date_filter == "week":
+            query['created_at'] = {'$gte': today_start - timedelta(days=6)}
+        
+        role_pattern = re.escape(search_role)
+        query['$or'] = [
+            {'title': {'$regex': role_pattern, '$options': 'i'}},
+            {'search_category': {'$regex': role_pattern, '$options': 'i'}}
+        ]
+        
+        # Aggregate by company
+        pipeline = [
+            {'$match': query},
+            {
+                '$group': {
+                    '_id': '$company',
+                    'total_jobs': {'$sum': 1},
+                    'latest_date': {'$max': '$created_at'},
+                    'oldest_date': {'$min': '$created_at'},
+                    'job_titles': {'$addToSet': '$title'},
+                    'sources': {'$addToSet': '$source'},
+                    'locations': {'$addToSet': '$location'}
+                }
+            },
+            {'$sort': {'total_jobs': -1}},
+            {'$limit': 100}
+        ]
+        return await self.collection.aggregate(pipeline).to_list(length=100)
+    
+    async def get_company_jobs(self, company_name: str, view: str = "full", fields: str = None):
+        """Get all jobs from a specific company"""
+        jobs = await self.collection.find({
+            'company': company_name,
+            'is_active': True,
+            **HAS_DESCRIPTION
+        }, build_projection(view, fields)).sort('created_at', -1).to_list(length=100)
+        
+        return {
+            'company_name': company_name,
+            'total_jobs': len(jobs),
+            'jobs': jobs
+        }
+    
+    async def filter_jobs(
+        self,
+        min_salary: int = None,
+        max_salary: int = None,
+        job_types: List[str] = None,
+        locations: List[str] = None,
+        sources: List[str] = None,
+        remote_only: bool = False,
+        date_filter: str = "all",
+        view: str = "full",
+        fields: str = None
+    ):
+        """Filter jobs based on various criteria"""
+        query = self.build_filter_query(
+            min_salary, max_salary, job_types, locations, sources, remote_only, date_filter
+        )
+        jobs = await self.collection.find(query, build_projection(view, fields)).sort('created_at', -1).to_list(length=1000)
+        
+        return {
+            'jobs': jobs,
+            'total': len(jobs)
+        }
+    
+    async def export_jobs(
+        self,
+        query: Dict,
+        view: str = "full",
+        fields: str = None,
+        batch_size: int = None
+    ):
+        """
+        Stream jobs matching `query` as NDJSON chunks (one chunk per cursor batch)
+        
+        Documents go from the Motor cursor straight to bytes, so memory stays
+        bounded by `batch_size` however many jobs match.
+        """
+        batch_size = batch_size or settings.export_batch_size
+        cursor = self.collection.find(query, build_projection(view, fields)).sort(
+            [('created_at', -1), ('_id', -1)]
+        ).batch_size(batch_size)
+        
+        lines = []
+        async for job in cursor:
+            lines.append(dumps(job))
+            if len(lines) >= batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+    
+    def build_filter_query(
+        self,
+        min_salary: int = None,
+        max_salary: int = None,
+        job_types: List[str] = None,
+        locations: List[str] = None,
+        sources: List[str] = None,
+        remote_only: bool = False,
+        date_filter: str = "all"
+    ) -> Dict:
+        """Mongo query for the filter_jobs / export criteria"""
+        from datetime import timedelta
+        
+        query = {
+            'is_active': True,
+            **HAS_DESCRIPTION
+        }
+        
+        # Date filter
+        if date_filter == "today":
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            query['created_at'] = {'$gte': today_start}
+        elif date_filter == "yesterday":
+            yesterday_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            query['created_at'] = {'$gte': yesterday_start, '$lt': today_start}
+        elif date_filter == "week":
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            query['created_at'] = {'$gte': week_ago}
+        
+        # Location filter: any of city / region / country matches (e.g. "Austin, TX", "California", "USA")
+        if locations and len(locations) > 0:
+            query['location_keys'] = {'$in': filter_keys(locations)}
+        
+        if remote_only:
+            query['is_remote'] = True
+        
+        # Job type filter
+        if job_types and len(job_types) > 0:
+            query['job_type'] = {'$in': job_types}
+        
+        # Source filter
+        if sources and len(sources) > 0:
+            query['source'] = {'$in': sources}
+        
+        # Salary filter on the normalized annual USD range (overlap with the requested range)
+        if min_salary is not None:
+            query['salary_max'] = {'$gte': min_salary}
+        if max_salary is not None:
+            query['salary_min'] = {'$lte': max_salary}
+        
+        return query
+    
+    async def get_search_metadata(self, search_key: str):
+        """Get metadata for a search query"""
+        metadata_col = self.db.search_metadata
+        return await metadata_col.find_one({'search_key': search_key})
@@ -1,5 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Set, Tuple
 from datetime import datetime
+import asyncio
 import time
 import uuid  # For generating session IDs
 
@@ -22,11 +23,27 @@ except ImportError as e:
     JSEARCH_AVAILABLE = False
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.config import settings
+from app.services.description_fetcher import DescriptionFetcher
+from app.services.job_writer import JobWriter
+from app.services.job_verifier import JobVerifier
+from app.services.company_stats import CompanyStatsStore
+from app.services.count_cache import count_cache
+from app.services.response_cache import response_cache
+from app.services.known_jobs import KnownJobFilter
+from app import metrics
+from app.services.scrape_trace import ScrapeTrace, bind_platform, span
 
 class JobService:
+    """Scraping, verification and job writes (read queries live in JobQueryService)"""
+    
     def __init__(self, db: AsyncIOMotorDatabase, use_brave: bool = True):
         self.db = db
         self.collection = db.jobs
+        self.company_stats = CompanyStatsStore(db)
+        self.job_writer = JobWriter(self.collection, company_stats=self.company_stats)
+        self.known_jobs = KnownJobFilter(self.collection)
+        self.verifier = JobVerifier(self.collection, self.company_stats)
         
         # Initialize JSearch scraper FIRST (works everywhere - API-based)
         if JSEARCH_AVAILABLE and JSearchScraper:
@@ -39,9 +56,11 @@ class JobService:
         # Initialize LinkedIn scraper (works on Railway - uses requests only)
         if LINKEDIN_AVAILABLE and LinkedInScraper:
             self.linkedin_scraper = LinkedInScraper()
+            self.description_fetcher = DescriptionFetcher(self.linkedin_scraper)
             print("✅ LinkedIn scraper initialized")
         else:
             self.linkedin_scraper = None
+            self.description_fetcher = None
             print("ℹ️ LinkedIn scraper not available")
         
         # Check if we have at least one scraper
@@ -87,487 +106,280 @@ class JobService:
         }
         await sessions_collection.insert_one(session_data)
         
-        print(f"\n{'='*60}")
-        print(f"🔍 Starting Scrape Session: {session_id[:8]}...")
-        print(f"📝 Query: {keywords}")
-        if location:
-            print(f"📍 Location: {location}")
-        print(f"🔘 Platforms: {', '.join(platforms)}")
-        print(f"🎯 Max Jobs: {max_jobs}")
-        print(f"{'='*60}\n")
-        
-        # Normalize the search category
-        search_category = keywords.strip().title()
-        search_key = f"{keywords}_{location}".lower().replace(" ", "_")
-        
-        # Get offset if continuing from last
-        offset = 0
-        if continue_from_last:
-            search_metadata_col = self.db.search_metadata
-            metadata = await search_metadata_col.find_one({"search_key": search_key})
-            if metadata:
-                offset = metadata.get("last_offset", 0)
-                print(f"▶️  Continuing from job #{offset + 1}\n")
-        
-        all_jobs = []
-        jobs_needed = max_jobs
-        
-        # Calculate jobs per platform
-        active_platforms = [p for p in platforms if p in ["linkedin", "jsearch", "indeed"]]
-        jobs_per_platform = max_jobs // len(active_platforms) if active_platforms else max_jobs
-        
-        # 1. Scrape with JSearch API if selected
-        if "jsearch" in platforms and self.jsearch_scraper and jobs_needed > 0:
-            print("🚀 Scraping with JSearch API (Indeed, LinkedIn, Glassdoor, etc.)...")
-            pages_needed = min((jobs_per_platform // 10) + 1, 10)
-            jsearch_jobs = self.jsearch_scraper.search_jobs(keywords, location, max_pages=pages_needed)
-            jsearch_jobs = jsearch_jobs[:min(len(jsearch_jobs), jobs_per_platform)]
-            all_jobs.extend(jsearch_jobs)
-            jobs_needed -= len(jsearch_jobs)
-            print(f"✅ Found {len(jsearch_jobs)} jobs from JSearch API\n")
-        
-        # 2. Scrape LinkedIn directly if selected
-        if "linkedin" in platforms and self.linkedin_scraper and jobs_needed > 0:
-            print("📘 Scraping LinkedIn directly...")
-            pages_needed = min((jobs_per_platform // 25) + 1, 10)
-            linkedin_jobs = self.linkedin_scraper.search_jobs(keywords, location, max_pages=pages_needed)
-            linkedin_jobs = linkedin_jobs[:min(len(linkedin_jobs), jobs_per_platform)]
+        # Stage timings for this session (see ScrapeTrace)
+        trace = ScrapeTrace()
+        with trace.activate():
+            print(f"\n{'='*60}")
+            print(f"🔍 Starting Scrape Session: {session_id[:8]}...")
+            print(f"📝 Query: {keywords}")
+            if location:
+                print(f"📍 Location: {location}")
+            print(f"🔘 Platforms: {', '.join(platforms)}")
+            print(f"🎯 Max Jobs: {max_jobs}")
+            print(f"{'='*60}\n")
             
-            # Fetch descriptions for limited jobs
-            if linkedin_jobs:
-                print(f"📄 Fetching descriptions for LinkedIn jobs (max {min(len(linkedin_jobs), 10)})...")
-                for idx, job in enumerate(linkedin_jobs[:10], 1):
-                    try:
-                        print(f"  [{idx}/{min(len(linkedin_jobs), 10)}] {job['title'][:40]}...")
-                        details = self.linkedin_scraper.get_job_details(job['url'])
-                        if details.get('description'):
-                            job['description'] = details['description']
-                        time.sleep(0.2)  # Reduced from 1 to 0.2 seconds
-                    except Exception as e:
-                        print(f"  ⚠️ Error: {e}")
-                print(f"✅ LinkedIn descriptions fetched\n")
+            # Normalize the search category
+            search_category = keywords.strip().title()
+            search_key = f"{keywords}_{location}".lower().replace(" ", "_")
             
-            all_jobs.extend(linkedin_jobs)
-            jobs_needed -= len(linkedin_jobs)
-            print(f"✅ Found {len(linkedin_jobs)} LinkedIn jobs\n")
-        
-        # Limit to max_jobs
-        all_jobs = all_jobs[:max_jobs]
-        
-        new_jobs_count = 0
-        skipped_no_description = 0
-        
-        print(f"💾 Storing jobs in database...")
-        for job in all_jobs:
-            # Skip jobs without descriptions
-            if not job.get('description') or len(job.get('description', '').strip()) < 50:
-                skipped_no_description += 1
-                continue
+            # Get offset if continuing from last
+            offset = 0
+            if continue_from_last:
+                search_metadata_col = self.db.search_metadata
+                metadata = await search_metadata_col.find_one({"search_key": search_key})
+                if metadata:
+                    offset = metadata.get("last_offset", 0)
+                    print(f"▶️  Continuing from job #{offset + 1}\n")
+            
+            # Run the selected platforms concurrently, splitting the max_jobs budget between them
+            scrapers = {
+                "jsearch": (self._scrape_jsearch, settings.jsearch_timeout_seconds),
+                "linkedin": (self._scrape_linkedin, settings.linkedin_timeout_seconds),
+            }
+            active_platforms = [
+                p for p in platforms
+                if p in scrapers and getattr(self, f"{p}_scraper", None)
+            ]
+            budgets = {
+                p: max_jobs // len(active_platforms) + (1 if i < max_jobs % len(active_platforms) else 0)
+                for i, p in enumerate(active_platforms)
+            }
             
-            existing = await self.collection.find_one({'job_id': job['job_id']})
+            # Where each source's search got to, so a refill round continues from there
+            progress = {p: {'next_page': None, 'overflow': []} for p in active_platforms}
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            results = await asyncio.gather(*(
+                self._run_source(p, scrapers[p][0], scrapers[p][1], keywords, location, budgets[p], progress[p])
+                for p in active_platforms
+            ))
+            found = dict(zip(active_platforms, results))
             
-            if not existing:
-                job['search_category'] = search_category
-                job['scrape_session_id'] = session_id  # Link to session
-                await self.collection.insert_one(job)
-                new_jobs_count += 1
-            else:
-                update_data = {'last_verified': datetime.utcnow()}
-                if not existing.get('search_category'):
-                    update_data['search_category'] = search_category
-                if job.get('description') and not existing.get('description'):
-                    update_data['description'] = job['description']
-                if not existing.get('scrape_session_id'):
-                    update_data['scrape_session_id'] = session_id
-                await self.collection.update_one(
-                    {'job_id': job['job_id']},
-                    {'$set': update_data}
-                )
-        
-        # Update search metadata
-        search_metadata_col = self.db.search_metadata
-        await search_metadata_col.update_one(
-            {"search_key": search_key},
-            {
-                "$set": {
-                    "last_offset": offset + len(all_jobs),
-                    "total_scraped": offset + len(all_jobs),
-                    "last_scrape_date": datetime.utcnow(),
-                    "platforms_used": platforms,
-                    "search_query": keywords,
-                    "search_location": location
+            # Budget a source left unused (timed out, rate limited, ran out of
+            # results) goes to the sources that filled theirs. They continue from
+            # the results and pages they already reached, within what is left of
+            # their own timeout, so no page is requested twice.
+            shortfall = max_jobs - sum(len(jobs) + len(known) for jobs, known in found.values())
+            full_platforms = [
+                p for p in active_platforms
+                if len(found[p][0]) + len(found[p][1]) >= budgets[p] and loop.time() - started < scrapers[p][1]
+            ]
+            if shortfall > 0 and full_platforms:
+                print(f"🔁 Giving {shortfall} unused jobs of budget to {', '.join(full_platforms)}\n")
+                extra = {
+                    p: shortfall // len(full_platforms) + (1 if i < shortfall % len(full_platforms) else 0)
+                    for i, p in enumerate(full_platforms)
                 }
-            },
-            upsert=True
-        )
-        
-        # Update scrape session with final counts
-        duplicate_count = len(all_jobs) - new_jobs_count - skipped_no_description
-        await sessions_collection.update_one(
-            {"session_id": session_id},
-            {
-                "$set": {
-                    "total_jobs": len(all_jobs),
-                    "new_jobs": new_jobs_count,
-                    "duplicate_jobs": duplicate_count,
-                    "status": "completed"
+                more = await asyncio.gather(*(
+                    self._run_source(
+                        p, scrapers[p][0], scrapers[p][1] - (loop.time() - started),
+                        keywords, location, extra[p], progress[p]
+                    )
+                    for p in full_platforms
+                ))
+                for p, (jobs, known) in zip(full_platforms, more):
+                    found[p][0].extend(jobs)
+                    found[p][1].update(known)
+            
+            # job_ids found by a source but already stored with a description (no detail fetch needed)
+            known_job_ids = set()
+            all_jobs = []
+            for jobs, known in found.values():
+                all_jobs.extend(jobs)
+                known_job_ids.update(known)
+            
+            # Limit to max_jobs; known ids only count for the budget new jobs leave
+            all_jobs = all_jobs[:max_jobs]
+            known_count = min(len(known_job_ids), max_jobs - len(all_jobs))
+            total_found = len(all_jobs) + known_count
+            
+            # Skip jobs without descriptions
+            storable_jobs = [
+                job for job in all_jobs
+                if job.get('description') and len(job['description'].strip()) >= 50
+            ]
+            skipped_no_description = len(all_jobs) - len(storable_jobs)
+            
+            print(f"💾 Storing jobs in database...")
+            with span("store"):
+                write_counts = await self.job_writer.write(storable_jobs, search_category, session_id)
+                await self.job_writer.touch(known_job_ids)
+            self.known_jobs.remember(job['job_id'] for job in storable_jobs)
+            new_jobs_count = write_counts['new']
+            metrics.scrape_jobs_stored.inc(new_jobs_count, outcome="new")
+            metrics.scrape_jobs_stored.inc(write_counts['duplicate'] + known_count, outcome="duplicate")
+            metrics.scrape_jobs_stored.inc(skipped_no_description, outcome="no_description")
+            if new_jobs_count:
+                count_cache.invalidate()
+                response_cache.invalidate()
+            
+            # Update search metadata
+            search_metadata_col = self.db.search_metadata
+            await search_metadata_col.update_one(
+                {"search_key": search_key},
+                {
+                    "$set": {
+                        "last_offset": offset + total_found,
+                        "total_scraped": offset + total_found,
+                        "last_scrape_date": datetime.utcnow(),
+                        "platforms_used": platforms,
+                        "search_query": keywords,
+                        "search_location": location
+                    }
+                },
+                upsert=True
+            )
+            
+            # Update scrape session with final counts
+            duplicate_count = write_counts['duplicate'] + known_count
+            await sessions_collection.update_one(
+                {"session_id": session_id},
+                {
+                    "$set": {
+                        "total_jobs": total_found,
+                        "new_jobs": new_jobs_count,
+                        "duplicate_jobs": duplicate_count,
+                        "status": "completed",
+                        "timings": trace.summary()
+                    }
                 }
+            )
+            
+            print(f"\n{'='*60}")
+            print(f"✅ Stored {new_jobs_count} new jobs in category: {search_category}")
+            if skipped_no_description > 0:
+                print(f"ℹ️  Skipped {skipped_no_description} jobs without descriptions")
+            if duplicate_count > 0:
+                print(f"ℹ️  Skipped {duplicate_count} duplicate jobs")
+            print(f"📊 Total jobs found: {total_found}")
+            print(f"📍 Next scrape will start from job #{offset + total_found + 1}")
+            print(f"🆔 Session ID: {session_id[:8]}...")
+            print(f"{'='*60}\n")
+            
+            return {
+                "session_id": session_id,
+                "new_jobs": new_jobs_count,
+                "total_jobs": total_found,
+                "duplicate_jobs": duplicate_count
             }
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"✅ Stored {new_jobs_count} new jobs in category: {search_category}")
-        if skipped_no_description > 0:
-            print(f"ℹ️  Skipped {skipped_no_description} jobs without descriptions")
-        if duplicate_count > 0:
-            print(f"ℹ️  Skipped {duplicate_count} duplicate jobs")
-        print(f"📊 Total jobs found: {len(all_jobs)}")
-        print(f"📍 Next scrape will start from job #{offset + len(all_jobs) + 1}")
-        print(f"🆔 Session ID: {session_id[:8]}...")
-        print(f"{'='*60}\n")
-        
-        return {
-            "session_id": session_id,
-            "new_jobs": new_jobs_count,
-            "total_jobs": len(all_jobs),
-            "duplicate_jobs": duplicate_count
-        }
     
-    async def get_active_jobs(self, skip: int = 0, limit: int = 100, date_filter: str = "all"):
+    async def _run_source(
+        self, platform: str, scrape, timeout: float, keywords: str, location: str, budget: int, progress: Dict
+    ) -> Tuple[List[Dict], Set[str]]:
         """
-        Get all active jobs with descriptions
+        Run one platform scraper under its own timeout
         
-        Args:
-            skip: Number of jobs to skip
-            limit: Number of jobs to return
-            date_filter: Filter by date - 'today', 'yesterday', 'week', 'all'
-        """
-        from datetime import datetime, timedelta
-        
-        # Build base query
-        query = {
-            'is_active': True,
-            'description': {'$exists': True, '$ne': '', '$ne': None}
-        }
-        
-        # Add date filter
-        if date_filter == "today":
-            # Jobs scraped today (since midnight UTC)
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': today_start}
-        elif date_filter == "yesterday":
-            # Jobs scraped yesterday
-            yesterday_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': yesterday_start, '$lt': today_start}
-        elif date_filter == "week":
-            # Jobs scraped in the last 7 days
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            query['created_at'] = {'$gte': week_ago}
-        # If "all", no date filter is applied
-        
-        cursor = self.collection.find(query).sort('created_at', -1).skip(skip).limit(limit)
-        
-        jobs = await cursor.to_list(length=limit)
-        total = await self.collection.count_documents(query)
-        
-        # Convert ObjectId and dates to string
-        for job in jobs:
-            job['_id'] = str(job['_id'])
-            if job.get('posted_date'):
-                job['posted_date'] = job['posted_date'].isoformat()
-            if job.get('last_verified'):
-                job['last_verified'] = job['last_verified'].isoformat()
-            if job.get('created_at'):
-                job['created_at'] = job['created_at'].isoformat()
+        Scrapers append into `collected` as they go, so whatever a source
+        produced before timing out or failing is still returned. `progress`
+        carries where the source's search got to between calls.
         
-        return jobs, total
+        Returns:
+            (new jobs, job_ids already stored with a description)
+        """
+        collected: List[Dict] = []
+        known_job_ids: Set[str] = set()
+        outcome = "ok"
+        bind_platform(platform)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(scrape(keywords, location, budget, collected, known_job_ids, progress), timeout=timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            print(f"⏱️ {platform} timed out after {timeout:.0f}s, keeping {len(collected)} jobs")
+        except Exception as e:
+            outcome = "error"
+            print(f"❌ {platform} scrape failed: {e}")
+        metrics.scrape_duration.observe(time.perf_counter() - start, source=platform, outcome=outcome)
+        metrics.scrape_jobs_found.inc(len(collected[:budget]), source=platform)
+        return collected[:budget], known_job_ids
     
-    async def verify_jobs_status(self):
-        """Verify if stored jobs are still active"""
-        print("Starting job verification...")
-        jobs = await self.collection.find({'is_active': True}).to_list(length=None)
-        
-        expired_count = 0
-        for job in jobs:
-            is_active = False
-            
-            if job['source'] == 'indeed':
-                is_active = self.indeed_scraper.verify_job_active(job['url'])
-            else:
-                # For LinkedIn, try to access the URL
-                import requests
-                try:
-                    response = requests.head(job['url'], timeout=5, allow_redirects=True)
-                    is_active = response.status_code == 200
-                except:
-                    is_active = False
-            
-            if not is_active:
-                await self.collection.update_one(
-                    {'job_id': job['job_id']},
-                    {
-                        '$set': {
-                            'is_active': False,
-                            'expired_date': datetime.utcnow()
-                        }
-                    }
-                )
-                expired_count += 1
-            else:
-                await self.collection.update_one(
-                    {'job_id': job['job_id']},
-                    {'$set': {'last_verified': datetime.utcnow()}}
+    async def _next_results(
+        self, scraper, keywords: str, location: str, budget: int, progress: Dict,
+        page_size: int, first_page: int, max_pages: int
+    ) -> List[Dict]:
+        """
+        Up to `budget` search results, continuing where the previous call for
+        this search stopped: results it fetched beyond its budget first, then
+        the pages after the ones it requested
+        """
+        candidates = progress['overflow']
+        next_page = first_page if progress['next_page'] is None else progress['next_page']
+        missing = budget - len(candidates)
+        pages_needed = min((missing // page_size) + 1, first_page + max_pages - next_page) if missing > 0 else 0
+        if pages_needed > 0:
+            with span("fetch"):
+                candidates = candidates + await scraper.search_jobs(
+                    keywords, location, max_pages=pages_needed, first_page=next_page
                 )
-        
-        print(f"Marked {expired_count} jobs as expired")
-        return expired_count
+            progress['next_page'] = next_page + pages_needed
+        progress['overflow'] = candidates[budget:]
+        return candidates[:budget]
     
-    async def search_jobs_by_role(self, role: str, location: str = ""):
-        """Search jobs by role in database (with descriptions only)"""
-        query = {
-            'is_active': True,
-            'title': {'$regex': role, '$options': 'i'},
-            'description': {'$exists': True, '$ne': '', '$ne': None}
-        }
-        
-        if location:
-            query['location'] = {'$regex': location, '$options': 'i'}
-        
-        cursor = self.collection.find(query).sort('created_at', -1)
-        jobs = await cursor.to_list(length=None)
-        
-        for job in jobs:
-            job['_id'] = str(job['_id'])
-            if job.get('posted_date'):
-                job['posted_date'] = job['posted_date'].isoformat()
-            if job.get('last_verified'):
-                job['last_verified'] = job['last_verified'].isoformat()
-            if job.get('created_at'):
-                job['created_at'] = job['created_at'].isoformat()
-        
-        return jobs
-    
-    async def get_categories(self):
-        """Get all unique search categories"""
-        categories = await self.collection.distinct('search_category', {'is_active': True})
-        # Filter out None values and sort
-        return sorted([c for c in categories if c])
+    async def _scrape_jsearch(self, keywords: str, location: str, budget: int, collected: List[Dict], known_job_ids: set, progress: Dict):
+        """Scrape with JSearch API (Indeed, LinkedIn, Glassdoor, etc.)"""
+        print("🚀 Scraping with JSearch API (Indeed, LinkedIn, Glassdoor, etc.)...")
+        # ~10 jobs per page, pages 1-10
+        jsearch_jobs = await self._next_results(
+            self.jsearch_scraper, keywords, location, budget, progress, page_size=10, first_page=1, max_pages=10
+        )
+        collected.extend(jsearch_jobs)
+        print(f"✅ Found {len(collected)} jobs from JSearch API\n")
     
-    async def get_jobs_by_category(self, category: str, skip: int = 0, limit: int = 100):
-        """Get jobs by search category (with descriptions only)"""
-        query = {
-            'is_active': True,
-            'description': {'$exists': True, '$ne': '', '$ne': None}
-        }
-        if category and category != 'All':
-            query['search_category'] = category
-        
-        cursor = self.collection.find(query).sort('created_at', -1).skip(skip).limit(limit)
-        jobs = await cursor.to_list(length=limit)
-        total = await self.collection.count_documents(query)
-        
-        for job in jobs:
-            job['_id'] = str(job['_id'])
-            if job.get('posted_date'):
-                job['posted_date'] = job['posted_date'].isoformat()
-            if job.get('last_verified'):
-                job['last_verified'] = job['last_verified'].isoformat()
-            if job.get('created_at'):
-                job['created_at'] = job['created_at'].isoformat()
+    async def _scrape_linkedin(self, keywords: str, location: str, budget: int, collected: List[Dict], known_job_ids: set, progress: Dict):
+        """Scrape LinkedIn directly, then fetch descriptions for jobs we don't already have"""
+        print("📘 Scraping LinkedIn directly...")
+        # 25 jobs per page, at most 10 pages
+        linkedin_jobs = await self._next_results(
+            self.linkedin_scraper, keywords, location, budget, progress, page_size=25, first_page=0, max_pages=10
+        )
         
-        return jobs, total
+        # Skip detail fetches for jobs already stored with a description
+        found_count = len(linkedin_jobs)
+        with span("dedup"):
+            linkedin_jobs, known_ids = await self.known_jobs.split(linkedin_jobs)
+        known_job_ids.update(known_ids)
+        if known_ids:
+            print(f"♻️  {len(known_ids)} LinkedIn jobs already stored, skipping their detail pages")
+        
+        # Descriptions are filled in place, so a timeout keeps the ones already fetched
+        collected.extend(linkedin_jobs)
+        
+        # Fetch descriptions for every candidate job in parallel
+        if linkedin_jobs:
+            print(f"📄 Fetching descriptions for {len(linkedin_jobs)} LinkedIn jobs ({self.description_fetcher.workers} workers)...")
+            with span("description"):
+                fetched = await self.description_fetcher.fetch_all(linkedin_jobs)
+            print(f"✅ LinkedIn descriptions fetched: {fetched}/{len(linkedin_jobs)}\n")
+        
+        print(f"✅ Found {found_count} LinkedIn jobs\n")
+    
+    async def verify_jobs_status(self, budget: int = None):
+        """Verify that the jobs due for a re-check are still active (see JobVerifier.verify_window)"""
+        print("Starting job verification...")
+        counts = await self.verifier.verify_window(budget)
+        
+        if counts['expired']:
+            count_cache.invalidate()
+            response_cache.invalidate()
+        print(f"Marked {counts['expired']} jobs as expired "
+              f"({counts['checked']} checked, {counts['unknown']} inconclusive)")
+        return counts['expired']
     
     async def delete_category(self, category: str):
         """Delete all jobs in a category"""
         result = await self.collection.delete_many({'search_category': category})
+        self.known_jobs.clear()
+        count_cache.invalidate()
+        response_cache.invalidate()
+        if result.deleted_count:
+            # A full rebuild is too slow to hold the request for
+            self.company_stats.rebuild_in_background()
         return result.deleted_count
     
-    async def get_job_by_id(self, job_id: str):
-        """Get single job by job_id with full description"""
-        job = await self.collection.find_one({'job_id': job_id})
-        
-        if not job:
-            return None
-        
-        # Convert ObjectId and dates to string
-        job['_id'] = str(job['_id'])
-        if job.get('posted_date'):
-            job['posted_date'] = job['posted_date'].isoformat()
-        if job.get('last_verified'):
-            job['last_verified'] = job['last_verified'].isoformat()
-        if job.get('created_at'):
-            job['created_at'] = job['created_at'].isoformat()
-        if job.get('expired_date'):
-            job['expired_date'] = job['expired_date'].isoformat()
-        
-        return job
-    
-    def cleanup(self):
-        """Cleanup scrapers"""
-        if self.indeed_scraper:
-            self.indeed_scraper.close()
-    
-    async def get_companies(self, search_role: str = None, date_filter: str = "all"):
-        """Get companies aggregated by job count"""
-        from datetime import datetime, timedelta
-        
-        # Build date filter
-        query = {'is_active': True, 'description': {'$exists': True, '$ne': '', '$ne': None}}
-        if date_filter == "today":
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': today_start}
-        elif date_filter == "yesterday":
-            yesterday_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': yesterday_start, '$lt': today_start}
-        elif date_filter == "week":
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            query['created_at'] = {'$gte': week_ago}
-        
-        # Add role filter if specified
-        if search_role:
-            query['$or'] = [
-                {'title': {'$regex': search_role, '$options': 'i'}},
-                {'search_category': {'$regex': search_role, '$options': 'i'}}
-            ]
-        
-        # Aggregate by company
-        pipeline = [
-            {'$match': query},
-            {
-                '$group': {
-                    '_id': '$company',
-                    'total_jobs': {'$sum': 1},
-                    'latest_date': {'$max': '$created_at'},
-                    'oldest_date': {'$min': '$created_at'},
-                    'job_titles': {'$addToSet': '$title'},
-                    'sources': {'$addToSet': '$source'},
-                    'locations': {'$addToSet': '$location'},
-                    'salaries': {'$push': '$salary'}
-                }
-            },
-            {'$sort': {'total_jobs': -1}},
-            {'$limit': 100}
-        ]
-        
-        companies = await self.collection.aggregate(pipeline).to_list(length=100)
-        
-        # Format results
-        formatted_companies = []
-        for company in companies:
-            formatted_companies.append({
-                'company_name': company['_id'],
-                'total_jobs': company['total_jobs'],
-                'latest_job_date': company['latest_date'].isoformat() if company.get('latest_date') else None,
-                'oldest_job_date': company['oldest_date'].isoformat() if company.get('oldest_date') else None,
-                'job_titles': company['job_titles'][:5],  # Limit to 5 titles
-                'sources': company['sources'],
-                'locations': company['locations'][:3]  # Limit to 3 locations
-            })
-        
-        return {
-            'companies': formatted_companies,
-            'total': len(formatted_companies)
-        }
-    
-    async def get_company_jobs(self, company_name: str):
-        """Get all jobs from a specific company"""
-        jobs = await self.collection.find({
-            'company': company_name,
-            'is_active': True,
-            'description': {'$exists': True, '$ne': '', '$ne': None}
-        }).sort('created_at', -1).to_list(length=100)
-        
-        # Convert dates to strings
-        for job in jobs:
-            job['_id'] = str(job['_id'])
-            if job.get('posted_date'):
-                job['posted_date'] = job['posted_date'].isoformat()
-            if job.get('last_verified'):
-                job['last_verified'] = job['last_verified'].isoformat()
-            if job.get('created_at'):
-                job['created_at'] = job['created_at'].isoformat()
-        
-        return {
-            'company_name': company_name,
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }
-    
-    async def filter_jobs(
-        self,
-        min_salary: int = None,
-        max_salary: int = None,
-        job_types: List[str] = None,
-        locations: List[str] = None,
-        sources: List[str] = None,
-        remote_only: bool = False,
-        date_filter: str = "all"
-    ):
-        """Filter jobs based on various criteria"""
-        from datetime import datetime, timedelta
-        
-        query = {
-            'is_active': True,
-            'description': {'$exists': True, '$ne': '', '$ne': None}
-        }
-        
-        # Date filter
-        if date_filter == "today":
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': today_start}
-        elif date_filter == "yesterday":
-            yesterday_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            query['created_at'] = {'$gte': yesterday_start, '$lt': today_start}
-        elif date_filter == "week":
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            query['created_at'] = {'$gte': week_ago}
-        
-        # Location filter
-        if locations and len(locations) > 0:
-            query['location'] = {'$in': locations}
-        
-        if remote_only:
-            query['location'] = {'$regex': 'remote', '$options': 'i'}
-        
-        # Job type filter
-        if job_types and len(job_types) > 0:
-            query['job_type'] = {'$in': job_types}
-        
-        # Source filter
-        if sources and len(sources) > 0:
-            query['source'] = {'$in': sources}
-        
-        # Salary filter (requires parsing salary strings - simplified for now)
-        # This would need more sophisticated parsing in production
-        
-        jobs = await self.collection.find(query).sort('created_at', -1).to_list(length=1000)
-        
-        # Convert dates
-        for job in jobs:
-            job['_id'] = str(job['_id'])
-            if job.get('posted_date'):
-                job['posted_date'] = job['posted_date'].isoformat()
-            if job.get('last_verified'):
-                job['last_verified'] = job['last_verified'].isoformat()
-            if job.get('created_at'):
-                job['created_at'] = job['created_at'].isoformat()
-        
-        return {
-            'jobs': jobs,
-            'total': len(jobs)
-        }
-    
-    async def get_search_metadata(self, search_key: str):
-        """Get metadata for a search query"""
-        metadata_col = self.db.search_metadata
-        metadata = await metadata_col.find_one({'search_key': search_key})
-        
-        if metadata and metadata.get('_id'):
-            metadata['_id'] = str(metadata['_id'])
-        if metadata and metadata.get('last_scrape_date'):
-            metadata['last_scrape_date'] = metadata['last_scrape_date'].isoformat()
-        
-        return metadata
+    async def cleanup(self):
+        """Close the scrapers' and the verifier's HTTP clients (for the running event loop)"""
+        await self.verifier.close()
+        if self.jsearch_scraper:
+            await self.jsearch_scraper.close()
+        if self.linkedin_scraper:
+            await self.linkedin_scraper.close()
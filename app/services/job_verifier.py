@@ -0,0 +1,275 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import settings
+from app.indexes import ACTIVE_WITH_DESCRIPTION
+from app.scrapers.http_client import PooledHttpClient
+from app import metrics
+
+# What verification needs from a job (company_stats.remove uses company/created_at/title/source/location)
+VERIFY_PROJECTION = {
+    'job_id': 1, 'url': 1, 'source': 1, 'company': 1,
+    'created_at': 1, 'title': 1, 'location': 1
+}
+
+# Stalest first; among equally stale jobs, the oldest postings (likeliest to be gone)
+STALENESS_ORDER = [('last_verified', 1), ('posted_date', 1)]
+
+# Statuses that mean the posting is gone; anything else that isn't a success
+# (403 bot walls, 429, 5xx, LinkedIn's 999) says nothing about the job
+GONE_STATUSES = {404, 410}
+
+# Shown on LinkedIn job pages that are still up but closed
+LINKEDIN_CLOSED_MARKERS = (b'closed-job', b'No longer accepting applications')
+
+
+def _status_alive(response: httpx.Response) -> Optional[bool]:
+    """Generic check: 2xx is live, 404/410 is gone, anything else is unknown"""
+    if response.status_code in GONE_STATUSES:
+        return False
+    if response.is_success:
+        return True
+    return None
+
+
+def _linkedin_alive(response: httpx.Response) -> Optional[bool]:
+    """
+    LinkedIn keeps closed postings up (200) with a "No longer accepting
+    applications" banner. A page that ends up anywhere but /jobs/view/
+    (authwall, login, an unexpected redirect) says nothing about the job.
+    """
+    alive = _status_alive(response)
+    if not alive:
+        return alive
+    if '/jobs/view/' not in response.url.path:
+        return None
+    return not any(marker in response.content for marker in LINKEDIN_CLOSED_MARKERS)
+
+
+# URL domain -> (HTTP method, check). Chosen by the URL's host, not the job's
+# source: JSearch jobs tagged 'linkedin' often link to a company ATS page.
+# Other URLs use a HEAD and the status code.
+LIVENESS_CHECKS = {
+    'linkedin.com': ('get', _linkedin_alive),
+}
+DEFAULT_CHECK = ('head', _status_alive)
+
+
+def liveness_check(url: str) -> tuple:
+    """(HTTP method, check) for a job URL"""
+    host = (urlsplit(url).hostname or '').lower()
+    for domain, check in LIVENESS_CHECKS.items():
+        if host == domain or host.endswith('.' + domain):
+            return check
+    return DEFAULT_CHECK
+
+
+class JobVerifier:
+    """
+    Streaming liveness check for stored jobs
+
+    Listed jobs (active, with a description) are read from a Motor cursor
+    into a bounded queue, so memory stays flat however many jobs there are.
+    A pool of workers checks each job's URL through one pooled HTTP client
+    that caps concurrency overall and per host, using the check registered
+    for the URL's host. Outcomes go back to MongoDB as batched
+    `bulk_write`s: live jobs get `last_verified`, gone ones are expired and
+    taken out of company_stats. Jobs whose check was inconclusive (blocked,
+    rate limited, timed out) only get `verify_attempted_at`, which holds
+    them back for `verify_retry_hours`.
+
+    Scheduled runs use `verify_window`, which checks only the most stale
+    jobs, up to a budget, so outbound traffic follows churn rather than the
+    size of the jobs collection.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, company_stats=None, client: PooledHttpClient = None):
+        self.collection = collection
+        self.company_stats = company_stats
+        self.workers = settings.verify_max_concurrency
+        self.batch_size = settings.verify_write_batch_size
+        self.client = client or PooledHttpClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept-Language': 'en-US,en;q=0.9',
+            },
+            max_concurrency=settings.verify_max_concurrency,
+            per_host_limit=settings.verify_per_host_limit,
+            min_interval=settings.verify_min_request_interval,
+            timeout=settings.verify_request_timeout,
+        )
+
+    async def check(self, job: Dict) -> Optional[bool]:
+        """True if the job is still listed, False if it is gone, None if unknown"""
+        url = job.get('url')
+        if not url:
+            return None
+        try:
+            method, alive = liveness_check(url)
+            response = await getattr(self.client, method)(url)
+            if method == 'head' and response.status_code == 405:
+                response = await self.client.get(url)
+            return alive(response)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+            # Network errors, timeouts, and URLs httpx can't parse or request
+            return None
+
+    @staticmethod
+    def stale_query(now: datetime) -> Dict:
+        """
+        Listed jobs due for a re-check
+
+        A job is due once its source's re-check interval has passed since
+        `last_verified` (hot sources have shorter intervals), unless its
+        last check was inconclusive less than `verify_retry_hours` ago.
+        """
+        intervals = settings.verify_recheck_hours
+
+        def not_verified_since(hours: float) -> Dict:
+            # $not also matches jobs that were never verified
+            return {'last_verified': {'$not': {'$gte': now - timedelta(hours=hours)}}}
+
+        due = [
+            {'source': source, **not_verified_since(hours)}
+            for source, hours in intervals.items()
+        ]
+        due.append({'source': {'$nin': list(intervals)}, **not_verified_since(settings.verify_default_recheck_hours)})
+        return {
+            '$or': due,
+            'verify_attempted_at': {'$not': {'$gte': now - timedelta(hours=settings.verify_retry_hours)}}
+        }
+
+    async def verify_window(self, budget: int = None) -> Dict[str, int]:
+        """Check the most stale listed jobs, at most `budget` of them (default: verify_budget_per_run)"""
+        budget = budget or settings.verify_budget_per_run
+        return await self.verify(self.stale_query(datetime.utcnow()), sort=STALENESS_ORDER, limit=budget)
+
+    async def verify(self, query: Dict = None, sort: List[tuple] = None, limit: int = 0) -> Dict[str, int]:
+        """
+        Check every listed job matching `query` (in `sort` order, at most `limit`)
+
+        Returns:
+            {'checked': n, 'active': n, 'expired': n, 'unknown': n}
+        """
+        query = {**ACTIVE_WITH_DESCRIPTION, **(query or {})}
+        counts = {'checked': 0, 'active': 0, 'expired': 0, 'unknown': 0}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        pending: List[tuple] = []  # (job, alive) waiting for the next bulk_write
+
+        writes = set()  # in-flight _write calls
+
+        async def flush():
+            nonlocal pending
+            batch, pending = pending, []
+            write = asyncio.ensure_future(self._write(batch))
+            writes.add(write)
+            write.add_done_callback(writes.discard)
+            # Shielded: cancelling the worker must not drop a batch already taken out of pending
+            await asyncio.shield(write)
+
+        async def worker():
+            while True:
+                job = await queue.get()
+                if job is None:
+                    return
+                try:
+                    alive = await self.check(job)
+                except Exception as e:
+                    # A failing liveness check must not take the worker down
+                    print(f"⚠️ Verify check failed for {job.get('job_id')}: {e}")
+                    alive = None
+                outcome = 'unknown' if alive is None else 'active' if alive else 'expired'
+                counts['checked'] += 1
+                counts[outcome] += 1
+                metrics.jobs_verified.inc(source=job.get('source') or 'unknown', outcome=outcome)
+                if counts['checked'] % 1000 == 0:
+                    print(f"  🔎 Verified {counts['checked']} jobs ({counts['expired']} expired)...")
+                pending.append((job, alive))
+                if len(pending) >= self.batch_size:
+                    await flush()
+
+        async def put(job):
+            if not queue.full():
+                queue.put_nowait(job)
+                return
+            # Wait for room, unless a worker died (a failed write): the rest
+            # may never drain the queue, so stop and surface its error
+            put_task = asyncio.ensure_future(queue.put(job))
+            done, _ = await asyncio.wait([put_task, *workers], return_when=asyncio.FIRST_COMPLETED)
+            if put_task not in done:
+                put_task.cancel()
+                for task in done:
+                    task.result()
+                raise RuntimeError("Verify worker exited early")
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.workers)]
+        try:
+            cursor = self.collection.find(query, VERIFY_PROJECTION).batch_size(self.batch_size)
+            if sort:
+                cursor = cursor.sort(sort)
+            if limit:
+                cursor = cursor.limit(limit)
+            async for job in cursor:
+                await put(job)
+            for _ in workers:
+                await put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            # Outcomes already checked are written even if the run failed or was
+            # cancelled: let batches workers were writing finish, then the rest
+            await asyncio.gather(*writes, return_exceptions=True)
+            if pending:
+                await flush()
+        return counts
+
+    async def _write(self, results: List[tuple]):
+        """One bulk_write for a batch of (job, alive) outcomes, then company_stats for the expired jobs"""
+        if not results:
+            return
+        now = datetime.utcnow()
+        operations = []
+        expired_jobs = {}  # operation index -> job
+        for job, alive in results:
+            if alive is None:
+                operations.append(UpdateOne(
+                    {'_id': job['_id']},
+                    {'$set': {'verify_attempted_at': now}}
+                ))
+            elif alive:
+                operations.append(UpdateOne(
+                    {'_id': job['_id']},
+                    {'$set': {'last_verified': now}}
+                ))
+            else:
+                operations.append(UpdateOne(
+                    {'_id': job['_id'], 'is_active': True},
+                    {'$set': {'is_active': False, 'expired_date': now, 'updated_at': now, 'last_verified': now}}
+                ))
+                expired_jobs[len(operations) - 1] = job
+
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: the other updates went through; failed expiries stay listed for the next run
+            errors = e.details.get('writeErrors', [])
+            print(f"⚠️ {len(errors)} verify writes failed: {errors[0].get('errmsg') if errors else e}")
+            for error in errors:
+                expired_jobs.pop(error.get('index'), None)
+        if self.company_stats and expired_jobs:
+            try:
+                await self.company_stats.remove(list(expired_jobs.values()))
+            except Exception as e:
+                print(f"⚠️ Failed to update company stats: {e}")
+
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
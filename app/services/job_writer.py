@@ -0,0 +1,139 @@
+from typing import List, Dict, Iterable
+from datetime import datetime
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import settings
+from app.services.location_parser import location_fields
+from app.services.salary_parser import salary_fields
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class JobWriter:
+    """
+    Batched upsert writer for scraped jobs
+
+    Jobs are normalized on the way in (numeric salary range, structured
+    location). Each job
+    becomes one upsert keyed on `job_id` plus a few conditional
+    updates that fill fields an existing document is missing. A whole batch
+    goes to MongoDB as a single unordered `bulk_write`, and the unique index
+    on `job_id` keeps concurrent scrapes from inserting the same job twice.
+    Jobs that were actually inserted, and stored jobs that become listed
+    because this write fills in their description, are passed on to
+    `company_stats`.
+    `updated_at` only moves when stored content changes (insert or fill-up),
+    not when a job is merely seen again.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, batch_size: int = None, company_stats=None):
+        self.collection = collection
+        self.batch_size = batch_size or settings.job_write_batch_size
+        self.company_stats = company_stats
+
+    async def write(self, jobs: List[Dict], search_category: str, session_id: str) -> Dict[str, int]:
+        """
+        Upsert jobs in batches
+
+        Returns:
+            {'new': inserted job count, 'duplicate': jobs that already existed}
+        """
+        counts = {'new': 0, 'duplicate': 0}
+
+        # Collapse repeats inside this write, the first occurrence wins
+        unique_jobs = {}
+        for job in jobs:
+            if job['job_id'] in unique_jobs:
+                counts['duplicate'] += 1
+            else:
+                unique_jobs[job['job_id']] = job
+        jobs = list(unique_jobs.values())
+
+        for i in range(0, len(jobs), self.batch_size):
+            batch = jobs[i:i + self.batch_size]
+            new_count = await self._write_batch(batch, search_category, session_id)
+            counts['new'] += new_count
+            counts['duplicate'] += len(batch) - new_count
+
+        return counts
+
+    async def touch(self, job_ids: Iterable[str]):
+        """Refresh last_verified for jobs seen again without rewriting them"""
+        job_ids = list(job_ids)
+        if job_ids:
+            await self.collection.update_many(
+                {'job_id': {'$in': job_ids}},
+                {'$set': {'last_verified': datetime.utcnow()}}
+            )
+
+    async def _write_batch(self, jobs: List[Dict], search_category: str, session_id: str) -> int:
+        """Send one bulk_write for a batch and return how many jobs were inserted"""
+        now = datetime.utcnow()
+        operations = []
+        documents = {}  # operation index -> document it inserts
+
+        # Stored, active jobs without a description that this batch fills in
+        # become listed, so they count in company_stats from now on
+        described = [job['job_id'] for job in jobs if job.get('description')]
+        if self.company_stats and described:
+            newly_listed = await self.collection.find(
+                {'job_id': {'$in': described}, 'description': {'$in': [None, '']}, 'is_active': True},
+                {'company': 1, 'created_at': 1, 'title': 1, 'source': 1, 'location': 1}
+            ).to_list(length=None)
+        else:
+            newly_listed = []
+
+        for job in jobs:
+            job_id = job['job_id']
+            document = {k: v for k, v in job.items() if k not in ('last_verified', 'updated_at')}
+            document.update(salary_fields(job))
+            document.update(location_fields(job))
+            document['search_category'] = search_category
+            document['scrape_session_id'] = session_id
+            document['updated_at'] = now
+
+            documents[len(operations)] = document
+            operations.append(UpdateOne(
+                {'job_id': job_id},
+                {'$setOnInsert': document, '$set': {'last_verified': now}},
+                upsert=True
+            ))
+
+            # Fill fields that an already stored job is missing
+            operations.append(UpdateOne(
+                {'job_id': job_id, 'search_category': {'$in': [None, '']}},
+                {'$set': {'search_category': search_category, 'updated_at': now}}
+            ))
+            operations.append(UpdateOne(
+                {'job_id': job_id, 'scrape_session_id': {'$in': [None, '']}},
+                {'$set': {'scrape_session_id': session_id, 'updated_at': now}}
+            ))
+            if job.get('description'):
+                operations.append(UpdateOne(
+                    {'job_id': job_id, 'description': {'$in': [None, '']}},
+                    {'$set': {'description': job['description'], 'updated_at': now}}
+                ))
+
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            upserted_indexes = list(result.upserted_ids)
+        except BulkWriteError as e:
+            # A concurrent scrape inserted the same job_id first: that job is a duplicate
+            other_errors = [
+                err for err in e.details.get('writeErrors', [])
+                if err.get('code') != DUPLICATE_KEY_ERROR
+            ]
+            if other_errors:
+                print(f"⚠️ {len(other_errors)} job writes failed: {other_errors[0].get('errmsg')}")
+            upserted_indexes = [upsert['index'] for upsert in e.details.get('upserted', [])]
+
+        if self.company_stats and (upserted_indexes or newly_listed):
+            inserted = [documents[i] for i in upserted_indexes if i in documents]
+            try:
+                await self.company_stats.record(inserted + newly_listed)
+            except Exception as e:
+                print(f"⚠️ Failed to update company stats: {e}")
+        return len(upserted_indexes)
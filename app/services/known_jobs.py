@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import List, Dict, Iterable, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import settings
+from app.indexes import HAS_DESCRIPTION
+
+
+class KnownJobFilter:
+    """
+    Pre-fetch dedup stage for scraped jobs
+
+    Splits a page of search results into jobs we still need details for and
+    jobs already stored with a description. Lookups hit an in-memory LRU of
+    recently seen job_ids first, and everything else is resolved with a
+    single `$in` query per page.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, cache_size: int = None):
+        self.collection = collection
+        self.cache_size = cache_size or settings.seen_job_cache_size
+        self._seen: OrderedDict = OrderedDict()
+
+    async def split(self, jobs: List[Dict]) -> Tuple[List[Dict], Set[str]]:
+        """
+        Returns:
+            (jobs that still need a detail fetch, job_ids already stored with a description)
+        """
+        known_ids = set()
+        lookup_ids = []
+        for job in jobs:
+            job_id = job['job_id']
+            if job_id in self._seen:
+                self._seen.move_to_end(job_id)
+                known_ids.add(job_id)
+            else:
+                lookup_ids.append(job_id)
+
+        if lookup_ids:
+            cursor = self.collection.find(
+                {'job_id': {'$in': lookup_ids}, **HAS_DESCRIPTION},
+                {'job_id': 1, '_id': 0}
+            )
+            stored_ids = [doc['job_id'] async for doc in cursor]
+            known_ids.update(stored_ids)
+            self.remember(stored_ids)
+
+        unknown_jobs = [job for job in jobs if job['job_id'] not in known_ids]
+        return unknown_jobs, known_ids
+
+    def remember(self, job_ids: Iterable[str]):
+        """Mark job_ids as stored with a description"""
+        for job_id in job_ids:
+            self._seen[job_id] = True
+            self._seen.move_to_end(job_id)
+        while len(self._seen) > self.cache_size:
+            self._seen.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached job_id (call after deleting jobs)"""
+        self._seen.clear()
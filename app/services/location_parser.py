@@ -0,0 +1,175 @@
+"""
+Location normalization
+
+Parses free-text job locations ("Austin, TX", "London, England, United
+Kingdom", "Greater Seattle Area", "Remote") into `city`, `region`,
+`country` (ISO alpha-2) and `is_remote`, using the bundled gazetteer.
+`location_keys` holds the lower-cased values of all of them in one
+multikey-indexed array, so a location filter is a single index lookup.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from app.services.gazetteer import CITIES, COUNTRIES, REGIONS
+
+REMOTE_RE = re.compile(r'\b(remote|anywhere|work from home|wfh|telecommute|distributed)\b', re.I)
+WORK_MODE_RE = re.compile(r'\(?\b(hybrid|on-?site|in-office)\b\)?', re.I)
+METRO_RE = re.compile(r'^greater\s+|\s+(metropolitan|metro|bay)?\s*area$|\s+metroplex$', re.I)
+
+# Lower-cased alias -> country code
+_COUNTRY_LOOKUP = {}
+for _code, (_name, _aliases) in COUNTRIES.items():
+    _COUNTRY_LOOKUP[_name.lower()] = _code
+    for _alias in _aliases:
+        _COUNTRY_LOOKUP[_alias] = _code
+
+# Country code -> {lower-cased region code or name: region name}
+_REGION_LOOKUP = {
+    _country: {
+        **{_region_code.lower(): _region_name for _region_code, _region_name in _regions.items()},
+        **{_region_name.lower(): _region_name for _region_name in _regions.values()},
+    }
+    for _country, _regions in REGIONS.items()
+}
+
+
+def _country_code(text: str) -> Optional[str]:
+    text = text.strip().lower()
+    if len(text) == 2 and text.upper() in COUNTRIES and text.upper() not in REGIONS['US']:
+        # Bare two-letter codes, unless they read as a US state ("CA", "IN", "DE")
+        return text.upper()
+    return _COUNTRY_LOOKUP.get(text)
+
+
+def _known_city(text: str) -> Optional[tuple]:
+    return CITIES.get(METRO_RE.sub('', text).strip().lower())
+
+
+def _region(text: str, country: Optional[str]) -> Optional[tuple]:
+    """(region name, country code) for a region in `country`, or in the US when unknown"""
+    text = text.strip().lower()
+    countries = [country] if country else ['US', 'CA', 'AU', 'GB', 'IN']
+    for code in countries:
+        name = _REGION_LOOKUP.get(code, {}).get(text)
+        if name:
+            return name, code
+    return None
+
+
+def structured_location(
+    city: Optional[str] = None,
+    region: Optional[str] = None,
+    country: Optional[str] = None,
+    is_remote: bool = False
+) -> Dict:
+    """
+    Normalized location fields from already separated parts (e.g. API fields)
+
+    `country` may be an ISO alpha-2 code or a name. Region codes are expanded
+    to names; missing region/country are filled from the city gazetteer.
+    """
+    country_code = None
+    if country:
+        country_code = country.strip().upper() if country.strip().upper() in COUNTRIES else _country_code(country)
+    region_name = None
+    if region:
+        resolved = _region(region, country_code)
+        if resolved:
+            region_name, country_code = resolved[0], country_code or resolved[1]
+        else:
+            region_name = region.strip()
+
+    city_name = city.strip() if city else None
+    if city_name:
+        known = _known_city(city_name)
+        if known and (country_code in (None, known[2])) and (region_name in (None, known[1])):
+            city_name = known[0]
+            region_name = region_name or known[1]
+            country_code = country_code or known[2]
+
+    fields = {
+        'city': city_name,
+        'region': region_name,
+        'country': country_code,
+        'is_remote': bool(is_remote),
+    }
+    fields['location_keys'] = location_keys(fields)
+    return fields
+
+
+def parse_location(text: Optional[str]) -> Dict:
+    """
+    Parse a free-text location
+
+    Returns:
+        {'city', 'region', 'country', 'is_remote', 'location_keys'}; unknown parts are None
+    """
+    text = (text or '').strip()
+    is_remote = bool(REMOTE_RE.search(text))
+    cleaned = WORK_MODE_RE.sub('', text)
+    cleaned = REMOTE_RE.sub('', cleaned)
+
+    parts = [part.strip(' -–|/()') for part in cleaned.split(',')]
+    parts = [part for part in parts if part and part.lower() not in ('not specified', 'various locations')]
+    if text.lower() in CITIES:
+        # Aliases that contain a comma, e.g. "Washington, DC"
+        parts = [text]
+
+    # Read right to left: [city, [region, [country]]]. A lone part that is a
+    # known city ("Singapore", "Berlin") stays a city.
+    city = region = country = None
+    if parts and _country_code(parts[-1]) and (len(parts) > 1 or not _known_city(parts[-1])):
+        country = _country_code(parts.pop())
+    if parts and (len(parts) > 1 or not _known_city(parts[-1])):
+        if _region(parts[-1], country):
+            region = parts.pop()
+    if parts:
+        city = parts[0]
+
+    return structured_location(city, region, country, is_remote)
+
+
+def location_keys(fields: Dict) -> List[str]:
+    """Lower-cased lookup keys for a parsed location (city, region, country code and name, 'remote')"""
+    keys = []
+    for value in (fields.get('city'), fields.get('region')):
+        if value:
+            keys.append(value.lower())
+    country = fields.get('country')
+    if country:
+        keys.append(country.lower())
+        if country in COUNTRIES:
+            keys.append(COUNTRIES[country][0].lower())
+    if fields.get('is_remote'):
+        keys.append('remote')
+    return list(dict.fromkeys(keys))
+
+
+def filter_keys(values: List[str]) -> List[str]:
+    """
+    Lookup keys for user-supplied location filters
+
+    "Austin, TX" matches Austin, "California" or "CA" the state, "USA" the country.
+    """
+    keys = []
+    for value in values:
+        if not value or not value.strip():
+            continue
+        parsed = parse_location(value)
+        if parsed['city']:
+            keys.append(parsed['city'].lower())
+        elif parsed['region']:
+            keys.append(parsed['region'].lower())
+        elif parsed['country']:
+            keys.append(parsed['country'].lower())
+        else:
+            keys.append(value.strip().lower())
+    return list(dict.fromkeys(keys))
+
+
+def location_fields(job: Dict) -> Dict:
+    """Normalized location fields for a job dict, keeping values a scraper already set"""
+    if job.get('location_keys') is not None:
+        return {}
+    return parse_location(job.get('location'))
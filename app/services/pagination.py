@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Optional
+
+from bson import ObjectId
+
+
+def encode_cursor(doc: Dict, field: str = 'created_at') -> str:
+    """Opaque cursor pointing just past `doc` in a (field desc, _id desc) ordering"""
+    value = doc[field]
+    payload = {'v': value.isoformat(), 'i': str(doc['_id'])}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """
+    Returns:
+        (datetime, ObjectId) from a cursor made by encode_cursor
+
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload['v']), ObjectId(payload['i'])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def apply_cursor(query: Dict, cursor: Optional[str], field: str = 'created_at') -> Dict:
+    """
+    Restrict `query` to documents after `cursor` in (field desc, _id desc) order
+
+    The range on `field` is merged into any existing condition (e.g. a date
+    filter) so the index on (field, _id) bounds the scan. Only ties on `field`
+    need the extra _id check.
+    """
+    if not cursor:
+        return query
+
+    value, last_id = decode_cursor(cursor)
+    query[field] = {**query.get(field, {}), '$lte': value}
+    query['$nor'] = [{field: value, '_id': {'$gte': last_id}}]
+    return query
+
+
+def next_cursor(docs, limit: int, field: str = 'created_at') -> Optional[str]:
+    """Cursor for the following page, or None when this page is the last one"""
+    if len(docs) < limit or not docs or not docs[-1].get(field):
+        return None
+    return encode_cursor(docs[-1], field)
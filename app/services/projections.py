@@ -0,0 +1,50 @@
+import re
+from typing import Dict, Optional
+
+# Large per-job bodies that card/list UIs never render
+SUMMARY_EXCLUDED_FIELDS = ('description', 'job_highlights', 'required_skills')
+
+# Always returned with an explicit `fields` list: identity plus what keyset paging needs
+ALWAYS_INCLUDED_FIELDS = ('_id', 'job_id', 'created_at')
+
+VIEWS = ('full', 'summary')
+
+# Plain (dotted) field paths; anything else could be read as an operator or expression
+FIELD_NAME = re.compile(r'^[A-Za-z_][\w.]*$')
+
+
+def build_projection(view: str = "full", fields: Optional[str] = None) -> Optional[Dict]:
+    """
+    Mongo projection for a list response
+
+    Args:
+        view: 'full' (every field) or 'summary' (drops description, highlights and skills)
+        fields: Comma-separated field names to return; takes precedence over `view`
+
+    Returns:
+        Projection dict, or None for full documents
+
+    Raises:
+        ValueError on an unknown view, an invalid field name, or fields that
+        overlap (a field and one of its subfields, e.g. `company,company.name`)
+    """
+    if fields:
+        names = {name.strip() for name in fields.split(',') if name.strip()}
+        for name in names:
+            if not FIELD_NAME.match(name) or '' in name.split('.'):
+                raise ValueError(f"Invalid field name '{name}'")
+        names.update(ALWAYS_INCLUDED_FIELDS)
+        for name in names:
+            parts = name.split('.')
+            for i in range(1, len(parts)):
+                parent = '.'.join(parts[:i])
+                if parent in names:
+                    raise ValueError(f"Field '{name}' overlaps with '{parent}'")
+        return {name: 1 for name in sorted(names)}
+
+    if view not in VIEWS:
+        raise ValueError(f"Unknown view '{view}', expected one of: {', '.join(VIEWS)}")
+
+    if view == "summary":
+        return {name: 0 for name in SUMMARY_EXCLUDED_FIELDS}
+    return None
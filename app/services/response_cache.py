@@ -0,0 +1,85 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache for hot read responses (categories, companies, first job page)
+
+    Entries are keyed by (data version, endpoint, parameters). Anything that
+    writes jobs calls `invalidate`, which bumps the version so every older
+    entry - and any query already in flight against the old data - stops
+    being served. Concurrent misses for the same key share one load.
+    """
+
+    def __init__(self, ttl_seconds: float = None, max_entries: int = None):
+        self.ttl_seconds = settings.response_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or settings.response_cache_max_entries
+        self.version = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_load(self, endpoint: str, params: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Cached response for (endpoint, params), calling `loader` on a miss
+
+        The cached object is shared between requests, so callers must not mutate it.
+        """
+        key = (self.version, endpoint, params)
+
+        entry = self._entries.get(key)
+        if entry and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        pending = self._in_flight.get(key)
+        if pending:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e)
+            # Nobody may be waiting; don't log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(value)
+        if key[0] == self.version:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self):
+        """Bump the data version and drop cached responses (call after jobs change)"""
+        self.version += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            'version': self.version,
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'hit_rate': round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0
+        }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,144 @@
+"""
+Salary normalization
+
+Turns the display strings the scrapers store in `salary` (e.g.
+"$120,000 - $150,000/year", "$55.00/hr - $70.00/hr", "£40K/yr") into
+`salary_min` / `salary_max`: whole annual amounts in USD, so salary range
+filters can run as indexed numeric queries.
+"""
+
+import re
+from typing import Dict, Optional
+
+# Approximate, deliberately static conversion rates to USD. Good enough for
+# range filtering; update occasionally rather than fetching at ingest time.
+USD_RATES = {
+    'USD': 1.0,
+    'EUR': 1.08,
+    'GBP': 1.27,
+    'CAD': 0.73,
+    'AUD': 0.66,
+    'NZD': 0.60,
+    'CHF': 1.13,
+    'SGD': 0.74,
+    'INR': 0.012,
+    'JPY': 0.0067,
+}
+
+# Longest symbols first so "CA$" wins over "A$" and "$"
+CURRENCY_SYMBOLS = [
+    ('CA$', 'CAD'), ('AU$', 'AUD'), ('NZ$', 'NZD'), ('US$', 'USD'),
+    ('C$', 'CAD'), ('A$', 'AUD'), ('S$', 'SGD'),
+    ('£', 'GBP'), ('€', 'EUR'), ('₹', 'INR'), ('¥', 'JPY'), ('$', 'USD'),
+]
+
+PERIOD_MULTIPLIERS = {
+    'HOUR': 2080,
+    'DAY': 260,
+    'WEEK': 52,
+    'MONTH': 12,
+    'YEAR': 1,
+}
+
+PERIOD_PATTERNS = [
+    ('HOUR', re.compile(r'/\s*h(ou)?r\b|\bhourly\b|\bper hour\b|\ban hour\b', re.I)),
+    ('DAY', re.compile(r'/\s*day\b|\bdaily\b|\bper day\b|\ba day\b', re.I)),
+    ('WEEK', re.compile(r'/\s*w(ee)?k\b|\bweekly\b|\bper week\b|\ba week\b', re.I)),
+    ('MONTH', re.compile(r'/\s*mo(nth)?\b|\bmonthly\b|\bper month\b|\ba month\b', re.I)),
+    ('YEAR', re.compile(r'/\s*y(ea)?r\b|\byearly\b|\bannual(ly)?\b|\bper (year|annum)\b|\ba year\b|\bp\.?a\.?\b', re.I)),
+]
+
+CURRENCY_CODE_RE = re.compile(r'\b(' + '|'.join(USD_RATES) + r')\b')
+AMOUNT_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([kKmM])?\b')
+
+# Annual USD amounts outside this range are parse errors, not salaries
+MIN_ANNUAL_USD = 1_000
+MAX_ANNUAL_USD = 10_000_000
+
+
+def annualize(
+    min_amount: Optional[float],
+    max_amount: Optional[float],
+    period: str = 'YEAR',
+    currency: str = 'USD'
+) -> Dict[str, int]:
+    """
+    Convert a salary range to whole annual USD amounts
+
+    Returns:
+        {'salary_min': ..., 'salary_max': ...} or {} when the range can't be used
+    """
+    if min_amount is None and max_amount is None:
+        return {}
+    min_amount = min_amount if min_amount is not None else max_amount
+    max_amount = max_amount if max_amount is not None else min_amount
+
+    rate = USD_RATES.get((currency or 'USD').upper())
+    multiplier = PERIOD_MULTIPLIERS.get((period or 'YEAR').upper())
+    if rate is None or multiplier is None:
+        return {}
+
+    low, high = sorted((min_amount * multiplier * rate, max_amount * multiplier * rate))
+    if low < MIN_ANNUAL_USD or high > MAX_ANNUAL_USD:
+        return {}
+    return {'salary_min': int(round(low)), 'salary_max': int(round(high))}
+
+
+def parse_salary(text: Optional[str]) -> Dict[str, int]:
+    """
+    Parse a salary display string
+
+    Returns:
+        {'salary_min': ..., 'salary_max': ...} in annual USD, or {} if unparseable
+    """
+    if not text or not isinstance(text, str):
+        return {}
+
+    amounts = []
+    for number, suffix in AMOUNT_RE.findall(text):
+        try:
+            value = float(number.replace(',', ''))
+        except ValueError:
+            continue
+        if suffix in ('k', 'K'):
+            value *= 1_000
+        elif suffix in ('m', 'M'):
+            value *= 1_000_000
+        amounts.append(value)
+        if len(amounts) == 2:
+            break
+    if not amounts:
+        return {}
+
+    currency = None
+    code = CURRENCY_CODE_RE.search(text)
+    if code:
+        currency = code.group(1)
+    else:
+        for symbol, symbol_currency in CURRENCY_SYMBOLS:
+            if symbol in text:
+                currency = symbol_currency
+                break
+
+    period = None
+    for period_name, pattern in PERIOD_PATTERNS:
+        if pattern.search(text):
+            period = period_name
+            break
+
+    # Bare numbers ("401k match") are not salaries
+    if currency is None and period is None:
+        return {}
+    currency = currency or 'USD'
+    if period is None:
+        # Unlabelled small amounts are hourly rates, everything else annual
+        period = 'HOUR' if max(amounts) < 500 else 'YEAR'
+
+    return annualize(amounts[0], amounts[-1], period, currency)
+
+
+def salary_fields(job: Dict) -> Dict[str, int]:
+    """Normalized salary fields for a job dict, keeping values a scraper already set"""
+    if job.get('salary_min') is not None or job.get('salary_max') is not None:
+        return {}
+    return parse_salary(job.get('salary'))
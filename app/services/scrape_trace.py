@@ -0,0 +1,93 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+# (trace, platform, stage) for the code currently running. asyncio tasks copy
+# it when they are created, so description workers and the per-platform
+# gather tasks report into the span that started them.
+_current: ContextVar = ContextVar('scrape_trace', default=None)
+
+
+class ScrapeTrace:
+    """
+    Per-stage timings for one scrape session
+
+    Stages are recorded per platform: fetch (search result pages), parse
+    (HTML/JSON parsing), dedup (known-job lookup), description (detail
+    pages) and store (Mongo writes). Times are wall-clock per span; parse
+    runs inside fetch/description and is reported on its own too, so the
+    stages overlap rather than add up to the session duration. HTTP
+    requests and downloaded bytes are attributed to the stage that made them.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._stages: Dict[tuple, Dict] = {}
+
+    @contextmanager
+    def activate(self, platform: Optional[str] = None):
+        """Make this the trace for the current task (and tasks it creates) within the block"""
+        token = _current.set((self, platform, None))
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def stage(self, platform: str, stage: str) -> Dict:
+        return self._stages.setdefault((platform, stage), {
+            'seconds': 0.0, 'calls': 0, 'requests': 0, 'bytes': 0
+        })
+
+    def summary(self) -> Dict:
+        """Session document form: slowest stage first"""
+        stages = [
+            {'platform': platform, 'stage': stage, **values, 'seconds': round(values['seconds'], 3)}
+            for (platform, stage), values in self._stages.items()
+        ]
+        stages.sort(key=lambda entry: entry['seconds'], reverse=True)
+        return {
+            'duration_seconds': round(time.perf_counter() - self.started, 3),
+            'requests': sum(entry['requests'] for entry in stages),
+            'bytes': sum(entry['bytes'] for entry in stages),
+            'stages': stages
+        }
+
+
+def bind_platform(platform: str):
+    """Attribute the rest of the current task to `platform`"""
+    current = _current.get()
+    if current is not None:
+        _current.set((current[0], platform, current[2]))
+
+
+@contextmanager
+def span(stage: str, platform: Optional[str] = None):
+    """Time a block as `stage` of the active trace (no-op outside a scrape)"""
+    current = _current.get()
+    if current is None:
+        yield
+        return
+
+    trace, bound_platform, _ = current
+    platform = platform or bound_platform or 'all'
+    token = _current.set((trace, platform, stage))
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = trace.stage(platform, stage)
+        entry['seconds'] += time.perf_counter() - start
+        entry['calls'] += 1
+        _current.reset(token)
+
+
+def record_request(num_bytes: int):
+    """Count one HTTP request (and its downloaded bytes) against the current stage"""
+    current = _current.get()
+    if current is None:
+        return
+    trace, platform, stage = current
+    entry = trace.stage(platform or 'all', stage or 'other')
+    entry['requests'] += 1
+    entry['bytes'] += num_bytes
@@ -9,6 +9,7 @@ import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.scrapers.linkedin_scraper import LinkedInScraper
 from app.scrapers.indeed_scraper import IndeedScraper
+from app.services.company_stats import CompanyStatsStore
 from datetime import datetime
 import time
 
@@ -53,6 +54,7 @@ async def backfill_descriptions():
     
     updated_count = 0
     failed_count = 0
+    listed_jobs = []  # now have a description, so they count in company_stats
     
     # Process LinkedIn jobs
     if linkedin_jobs:
@@ -60,13 +62,14 @@ async def backfill_descriptions():
         for idx, job in enumerate(linkedin_jobs, 1):
             try:
                 print(f"  [{idx}/{len(linkedin_jobs)}] Fetching: {job['title'][:50]}...")
-                details = linkedin_scraper.get_job_details(job['url'])
+                details = await linkedin_scraper.get_job_details(job['url'])
                 
                 if details.get('description'):
                     # Update database
                     update_data = {
                         'description': details['description'],
-                        'last_verified': datetime.utcnow()
+                        'last_verified': datetime.utcnow(),
+                        'updated_at': datetime.utcnow()
                     }
                     if details.get('job_type') and not job.get('job_type'):
                         update_data['job_type'] = details['job_type']
@@ -76,6 +79,7 @@ async def backfill_descriptions():
                         {'$set': update_data}
                     )
                     updated_count += 1
+                    listed_jobs.append(job)
                     print(f"    ✅ Updated")
                 else:
                     print(f"    ⚠️  No description found")
@@ -101,7 +105,8 @@ async def backfill_descriptions():
                     # Update database
                     update_data = {
                         'description': details['description'],
-                        'last_verified': datetime.utcnow()
+                        'last_verified': datetime.utcnow(),
+                        'updated_at': datetime.utcnow()
                     }
                     if details.get('job_type') and not job.get('job_type'):
                         update_data['job_type'] = details['job_type']
@@ -111,6 +116,7 @@ async def backfill_descriptions():
                         {'$set': update_data}
                     )
                     updated_count += 1
+                    listed_jobs.append(job)
                     print(f"    ✅ Updated")
                 else:
                     print(f"    ⚠️  No description found")
@@ -127,6 +133,10 @@ async def backfill_descriptions():
     # Cleanup
     indeed_scraper.close()
     
+    # Add the jobs that now have descriptions to the companies view
+    if listed_jobs:
+        await CompanyStatsStore(db).record(listed_jobs)
+    
     # Summary
     print(f"\n{'='*60}")
     print(f"✅ Backfill Complete!")
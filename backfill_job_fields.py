@@ -0,0 +1,95 @@
+"""
+Backfill Normalized Job Fields
+
+Parses fields that the ingest pipeline now normalizes for jobs stored
+before it did:
+- salary -> salary_min / salary_max (annual USD)
+- location -> city / region / country / is_remote / location_keys
+"""
+
+import asyncio
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from app.config import settings
+from app.services.location_parser import parse_location
+from app.services.salary_parser import parse_salary
+
+BATCH_SIZE = 1000
+
+async def flush(collection, operations):
+    """Send pending updates as one bulk_write and return how many documents changed"""
+    if not operations:
+        return 0
+    result = await collection.bulk_write(operations, ordered=False)
+    return result.modified_count
+
+async def backfill_salaries(collection):
+    query = {
+        'salary': {'$type': 'string'},
+        'salary_min': {'$exists': False}
+    }
+    total = await collection.count_documents(query)
+    print(f"💰 Found {total} jobs with an unparsed salary")
+
+    updated_count = 0
+    unparsed_count = 0
+    operations = []
+
+    async for job in collection.find(query, {'salary': 1}).batch_size(BATCH_SIZE):
+        salary_range = parse_salary(job['salary'])
+        if not salary_range:
+            unparsed_count += 1
+            continue
+
+        operations.append(UpdateOne({'_id': job['_id']}, {'$set': {**salary_range, 'updated_at': datetime.utcnow()}}))
+        if len(operations) >= BATCH_SIZE:
+            updated_count += await flush(collection, operations)
+            operations = []
+            print(f"  ✅ Updated {updated_count} salaries...")
+
+    updated_count += await flush(collection, operations)
+    return updated_count, unparsed_count
+
+async def backfill_locations(collection):
+    query = {'location_keys': {'$exists': False}}
+    total = await collection.count_documents(query)
+    print(f"📍 Found {total} jobs without a structured location")
+
+    updated_count = 0
+    operations = []
+
+    async for job in collection.find(query, {'location': 1}).batch_size(BATCH_SIZE):
+        operations.append(UpdateOne({'_id': job['_id']}, {'$set': {**parse_location(job.get('location')), 'updated_at': datetime.utcnow()}}))
+        if len(operations) >= BATCH_SIZE:
+            updated_count += await flush(collection, operations)
+            operations = []
+            print(f"  ✅ Updated {updated_count} locations...")
+
+    updated_count += await flush(collection, operations)
+    return updated_count
+
+async def backfill_job_fields():
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.database_name]
+    collection = db.jobs
+
+    print(f"\n{'='*60}")
+    print(f"🔧 Backfilling normalized job fields")
+    print(f"{'='*60}\n")
+
+    salaries_updated, salaries_unparsed = await backfill_salaries(collection)
+    locations_updated = await backfill_locations(collection)
+
+    print(f"\n{'='*60}")
+    print(f"✅ Backfill Complete!")
+    print(f"{'='*60}")
+    print(f"💰 Salaries normalized: {salaries_updated}")
+    print(f"ℹ️  Unparseable salaries: {salaries_unparsed}")
+    print(f"📍 Locations normalized: {locations_updated}")
+    print(f"{'='*60}\n")
+
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_job_fields())
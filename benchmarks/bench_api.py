@@ -0,0 +1,106 @@
+"""
+API Latency Benchmark
+
+Seeds a local mongod with N synthetic jobs from generate_dataset.py (10k,
+100k and 1M by default), then requests the read endpoints in-process
+through the ASGI app and reports p50/p90/p99 latency per endpoint:
+
+    cold    response and count caches cleared before every request
+            (what a cache miss or a fresh deploy costs)
+    warm    caches left alone (what most page loads see)
+
+Uses the `job_scraper_bench` database, which is regenerated for each size
+and dropped after the run.
+
+Usage:
+    python benchmarks/bench_api.py [--sizes 10000,100000,1000000] [--requests 200] [--mongodb-url URL]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from common import BENCH_DATABASE, latency_summary, write_results
+from generate_dataset import generate
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.main import app
+from app.services.container import ServiceContainer
+from app.services.count_cache import count_cache
+from app.services.response_cache import response_cache
+
+ENDPOINTS = {
+    'jobs': "/api/jobs?limit=100",
+    'jobs_summary': "/api/jobs?limit=100&view=summary",
+    'companies': "/api/companies",
+    'companies_week': "/api/companies?date_filter=week",
+    'companies_role': "/api/companies?search_role=engineer",
+    'filter_salary_remote': "/api/jobs/filter?min_salary=100000&remote_only=true",
+    'filter_location': "/api/jobs/filter?locations=United States&view=summary",
+}
+
+
+async def measure(client: httpx.AsyncClient, url: str, requests: int, cold: bool) -> dict:
+    samples = []
+    for _ in range(requests):
+        if cold:
+            response_cache.invalidate()
+            count_cache.invalidate()
+        start = time.perf_counter()
+        response = await client.get(url)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latency_summary(samples)
+
+
+async def run(mongodb_url: str, sizes, requests: int) -> dict:
+    client = AsyncIOMotorClient(mongodb_url)
+    db = client[BENCH_DATABASE]
+    results = {}
+
+    try:
+        for size in sizes:
+            print(f"\n📊 {size} jobs")
+            await asyncio.to_thread(generate, mongodb_url, BENCH_DATABASE, size, drop=True)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                services = ServiceContainer(db)
+            app.state.services = services
+
+            transport = httpx.ASGITransport(app=app)
+            size_results = {}
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+                for name, url in ENDPOINTS.items():
+                    await http.get(url)  # warm-up (connection pool, query plan cache)
+                    size_results[name] = {
+                        'cold': await measure(http, url, requests, cold=True),
+                        'warm': await measure(http, url, requests, cold=False),
+                    }
+                    cold, warm = size_results[name]['cold'], size_results[name]['warm']
+                    print(f"  {name:<22} cold p50 {cold['p50_ms']:>8.2f}ms p99 {cold['p99_ms']:>8.2f}ms"
+                          f" | warm p50 {warm['p50_ms']:>8.2f}ms p99 {warm['p99_ms']:>8.2f}ms")
+
+            await services.close()
+            results[str(size)] = size_results
+        return results
+    finally:
+        await client.drop_database(BENCH_DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated job counts")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and mode")
+    parser.add_argument("--mongodb-url", default=settings.mongodb_url)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/api-<timestamp>.json)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"\n⏱️  API latency ({args.requests} requests per endpoint)")
+    results = asyncio.run(run(args.mongodb_url, sizes, args.requests))
+    write_results("api", {'requests_per_endpoint': args.requests, 'sizes': results}, args.output)
@@ -0,0 +1,82 @@
+"""
+Bulk Ingest Benchmark
+
+Writes synthetic scraped jobs through JobWriter (the scrape write path:
+batched unordered upserts plus company_stats updates) into a local mongod
+and reports jobs/s for:
+
+    new         every job is inserted
+    duplicate   the same jobs again (all upserts match, nothing inserted)
+
+Uses the `job_scraper_bench` database, which is dropped before and after.
+
+Usage:
+    python benchmarks/bench_ingest.py [--jobs 50000] [--batch-size N] [--mongodb-url URL]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from common import BENCH_DATABASE, write_results
+from synthetic import scraped_job
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.indexes import ensure_indexes
+from app.services.company_stats import CompanyStatsStore
+from app.services.job_writer import JobWriter
+
+CHUNK_SIZE = 1000  # jobs handed to JobWriter.write per call, like a large scrape
+
+
+async def ingest(writer: JobWriter, jobs) -> dict:
+    counts = {'new': 0, 'duplicate': 0}
+    start = time.perf_counter()
+    for i in range(0, len(jobs), CHUNK_SIZE):
+        result = await writer.write(jobs[i:i + CHUNK_SIZE], "Benchmark", "bench")
+        counts['new'] += result['new']
+        counts['duplicate'] += result['duplicate']
+    elapsed = time.perf_counter() - start
+    return {
+        'jobs': len(jobs),
+        'seconds': round(elapsed, 3),
+        'jobs_per_second': round(len(jobs) / elapsed, 1),
+        **counts
+    }
+
+
+async def run(mongodb_url: str, total: int, batch_size: int = None) -> dict:
+    client = AsyncIOMotorClient(mongodb_url)
+    await client.drop_database(BENCH_DATABASE)
+    db = client[BENCH_DATABASE]
+    await ensure_indexes(db)
+
+    rng = random.Random(42)
+    jobs = [scraped_job(i, rng) for i in range(total)]
+    writer = JobWriter(db.jobs, batch_size=batch_size, company_stats=CompanyStatsStore(db))
+
+    try:
+        results = {'batch_size': writer.batch_size}
+        for phase in ('new', 'duplicate'):
+            results[phase] = await ingest(writer, jobs)
+            print(f"  {phase:<10} {results[phase]['jobs_per_second']:>10,.1f} jobs/s "
+                  f"({results[phase]['new']} new, {results[phase]['duplicate']} duplicate)")
+        return results
+    finally:
+        await client.drop_database(BENCH_DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, help="JobWriter batch size (default: settings.job_write_batch_size)")
+    parser.add_argument("--mongodb-url", default=settings.mongodb_url)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/ingest-<timestamp>.json)")
+    args = parser.parse_args()
+
+    print(f"\n⏱️  Bulk ingest of {args.jobs} jobs\n")
+    results = asyncio.run(run(args.mongodb_url, args.jobs, args.batch_size))
+    write_results("ingest", results, args.output)
@@ -0,0 +1,93 @@
+"""
+Parser Throughput Benchmark
+
+Runs the scrapers' parsing code over the recorded responses in
+benchmarks/fixtures/ (no network):
+
+    linkedin_search_cards   LinkedIn search page -> _parse_job_card, cards/s
+    linkedin_job_cards      _parse_job_card alone on pre-parsed cards, cards/s
+    linkedin_job_details    detail page -> _parse_job_details (get_job_details), pages/s
+    jsearch_jobs            JSearchScraper._parse_job, jobs/s
+    arbeitnow_jobs          ArbeitnowScraper._parse_job, jobs/s
+
+Usage:
+    python benchmarks/bench_parsers.py [--seconds 2] [--output results.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+
+from common import read_fixture, throughput, write_results
+
+from bs4 import BeautifulSoup
+from app.scrapers.arbeitnow_scraper import ArbeitnowScraper
+from app.scrapers.jsearch_scraper import JSearchScraper
+from app.scrapers.linkedin_scraper import LinkedInScraper
+
+
+def run(seconds: float) -> dict:
+    # The scraper constructors print API key warnings; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        linkedin = LinkedInScraper()
+        jsearch = JSearchScraper()
+        arbeitnow = ArbeitnowScraper()
+
+    search_page = read_fixture("linkedin_search.html")
+    detail_page = read_fixture("linkedin_detail.html")
+    jsearch_jobs = json.loads(read_fixture("jsearch_search.json"))['data']
+    arbeitnow_jobs = json.loads(read_fixture("arbeitnow_jobs.json"))['data']
+    cards = BeautifulSoup(search_page, 'html.parser').find_all('li')
+
+    # Sanity check: a parser that silently returns nothing would look very fast
+    assert len(linkedin._parse_search_page(search_page)) == len(cards)
+    assert linkedin._parse_job_details(detail_page)['description']
+    assert all(jsearch._parse_job(job) for job in jsearch_jobs)
+    assert all(arbeitnow._parse_job(job) for job in arbeitnow_jobs)
+
+    def search_cards():
+        return len(linkedin._parse_search_page(search_page))
+
+    def job_cards():
+        for card in cards:
+            linkedin._parse_job_card(card)
+        return len(cards)
+
+    def job_details():
+        linkedin._parse_job_details(detail_page)
+        return 1
+
+    def jsearch_parse():
+        for job in jsearch_jobs:
+            jsearch._parse_job(job)
+        return len(jsearch_jobs)
+
+    def arbeitnow_parse():
+        for job in arbeitnow_jobs:
+            arbeitnow._parse_job(job)
+        return len(arbeitnow_jobs)
+
+    cases = {
+        'linkedin_search_cards': search_cards,
+        'linkedin_job_cards': job_cards,
+        'linkedin_job_details': job_details,
+        'jsearch_jobs': jsearch_parse,
+        'arbeitnow_jobs': arbeitnow_parse,
+    }
+
+    results = {}
+    for name, fn in cases.items():
+        results[name] = throughput(fn, min_seconds=seconds)
+        print(f"  {name:<24} {results[name]['items_per_second']:>12,.1f} /s")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="Minimum duration of each round")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/parsers-<timestamp>.json)")
+    args = parser.parse_args()
+
+    print("\n⏱️  Parser throughput\n")
+    write_results("parsers", run(args.seconds), args.output)
@@ -0,0 +1,108 @@
+"""
+Shared helpers for the benchmark scripts: timing, percentiles and result files
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+# Benchmarks never touch the application database
+BENCH_DATABASE = "job_scraper_bench"
+
+# Make `app` importable when a script is run as `python benchmarks/<name>.py`
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+
+def fixture_path(name: str) -> str:
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def read_fixture(name: str, mode: str = "rb"):
+    with open(fixture_path(name), mode) as f:
+        return f.read()
+
+
+def throughput(fn: Callable[[], int], min_seconds: float = 2.0, repeat: int = 5) -> Dict:
+    """
+    Items per second for `fn`, which processes a batch and returns its size
+
+    Each of `repeat` rounds calls `fn` until `min_seconds` have passed; the
+    best round is reported (the others mostly measure noise).
+    """
+    fn()  # warm-up
+    rounds = []
+    for _ in range(repeat):
+        items = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_seconds:
+            items += fn()
+            elapsed = time.perf_counter() - start
+        rounds.append(items / elapsed)
+    return {
+        'items_per_second': round(max(rounds), 1),
+        'median_items_per_second': round(sorted(rounds)[len(rounds) // 2], 1),
+        'rounds': repeat
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples: List[float]) -> Dict:
+    """p50/p90/p99/max in milliseconds"""
+    return {
+        'requests': len(samples),
+        'p50_ms': round(percentile(samples, 50) * 1000, 2),
+        'p90_ms': round(percentile(samples, 90) * 1000, 2),
+        'p99_ms': round(percentile(samples, 99) * 1000, 2),
+        'max_ms': round(max(samples) * 1000, 2),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(benchmark: str, results: Dict, output: str = None) -> str:
+    """
+    Save one run as JSON (benchmarks/results/<benchmark>-<timestamp>.json by default)
+
+    Runs carry the commit and interpreter, so compare.py can line up two of them.
+    """
+    started = datetime.utcnow()
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{benchmark}-{started.strftime('%Y%m%dT%H%M%S')}.json")
+
+    document = {
+        'benchmark': benchmark,
+        'timestamp': started.isoformat(),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+    with open(output, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"💾 Results written to {output}")
+    return output
@@ -0,0 +1,81 @@
+"""
+Compare Two Benchmark Runs
+
+Prints every metric the two result files share with its relative change,
+and flags regressions beyond the threshold (slower latency, lower
+throughput). Exits with status 1 if any were found, so it can gate CI.
+
+Usage:
+    python benchmarks/compare.py BASELINE.json CANDIDATE.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+# Metric name suffix -> True when higher is better
+DIRECTIONS = {
+    'per_second': True,
+    '_ms': False,
+    'seconds': False,
+}
+
+
+def flatten(results: Dict, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, value
+
+
+def higher_is_better(path: str):
+    for suffix, higher in DIRECTIONS.items():
+        if path.endswith(suffix):
+            return higher
+    return None  # counts and settings, not performance
+
+
+def compare(baseline: Dict, candidate: Dict, threshold: float) -> int:
+    before = dict(flatten(baseline['results']))
+    after = dict(flatten(candidate['results']))
+
+    print(f"\n{baseline['benchmark']}: {baseline['git_commit']} ({baseline['timestamp']}) "
+          f"-> {candidate['git_commit']} ({candidate['timestamp']})\n")
+
+    regressions = 0
+    for path in sorted(before.keys() & after.keys()):
+        higher = higher_is_better(path)
+        if higher is None or not before[path]:
+            continue
+        change = (after[path] - before[path]) / before[path] * 100
+        worse = -change if higher else change
+        marker = ""
+        if worse > threshold:
+            marker = "  ❌ regression"
+            regressions += 1
+        elif worse < -threshold:
+            marker = "  ✅ improvement"
+        print(f"  {path:<60} {before[path]:>12,.2f} -> {after[path]:>12,.2f} ({change:+.1f}%){marker}")
+
+    print(f"\n{regressions} regression(s) beyond {threshold:.0f}%")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent change that counts as a regression")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    if baseline['benchmark'] != candidate['benchmark']:
+        sys.exit(f"Cannot compare a '{baseline['benchmark']}' run with a '{candidate['benchmark']}' run")
+
+    sys.exit(1 if compare(baseline, candidate, args.threshold) else 0)
@@ -0,0 +1,283 @@
+"""
+Synthetic Dataset Generator
+
+Fills `jobs`, `scrape_sessions` and `search_metadata` with production-shaped
+data (see synthetic.py for the distributions), so query and aggregation
+scaling can be measured without live scrapes:
+
+- jobs arrive in scrape sessions of 20-100 jobs, one search category per
+  session, spread over the last --days days (denser towards today)
+- jobs older than 30 days are mostly expired, as verify runs would leave them
+- search_metadata totals match the sessions that were generated
+
+Work is split into chunks of CHUNK_SIZE jobs that worker processes generate
+and insert in batches. Only the unique job_id and session_id indexes exist
+during the load (they make re-runs skip what is already there); the rest
+are created after loading (faster than maintaining them during the load),
+then company_stats is rebuilt.
+
+The output is deterministic for a given --seed and --first-id, and
+--first-id lets a later run append to an existing dataset
+(e.g. --jobs 4000000 --first-id 1000000 grows 1M jobs to 5M).
+
+Usage:
+    python benchmarks/generate_dataset.py --jobs 5000000 [--workers 8] [--drop]
+                                          [--database job_scraper_bench] [--mongodb-url URL]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from common import BENCH_DATABASE
+from synthetic import CATEGORY_SAMPLER, stored_job
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+from app.config import settings
+from app.indexes import INDEXES, ensure_indexes
+from app.services.company_stats import CompanyStatsStore
+
+CHUNK_SIZE = 50000  # jobs per worker task
+DEFAULT_BATCH_SIZE = 5000  # documents per insert_many
+DUPLICATE_KEY_ERROR = 11000
+
+SESSION_SIZE = (20, 100)  # jobs found per scrape session
+SEARCH_LOCATIONS = ["", "", "", "", "United States", "Remote", "New York", "London"]
+EXPIRY_AGE = timedelta(days=30)
+EXPIRED_SHARE = 0.7  # of jobs older than EXPIRY_AGE
+
+# Per worker process, opened by _init_worker
+_db = None
+
+
+def _init_worker(mongodb_url: str, database: str):
+    global _db
+    _db = MongoClient(mongodb_url)[database]
+
+
+def _ensure_unique_indexes(db):
+    """
+    The unique job_id and session_id indexes, before loading: _insert relies
+    on them to skip what an earlier (or interrupted) run already wrote
+    """
+    for name in ('jobs', 'scrape_sessions'):
+        db[name].create_indexes([index for index in INDEXES[name] if index.document.get('unique')])
+
+
+def _insert(collection, documents: List[Dict]) -> List[Dict]:
+    """
+    insert_many that skips documents already present (re-runs with the same
+    seed), returning the documents that were actually inserted
+    """
+    try:
+        collection.insert_many(documents, ordered=False)
+        return documents
+    except BulkWriteError as e:
+        errors = e.details.get('writeErrors', [])
+        other_errors = [err for err in errors if err.get('code') != DUPLICATE_KEY_ERROR]
+        if other_errors:
+            raise
+        duplicates = {err['index'] for err in errors}
+        return [document for i, document in enumerate(documents) if i not in duplicates]
+
+
+def _age(job: Dict, rng: random.Random, now: datetime):
+    """Expire old jobs and set last_verified the way verify runs would have"""
+    age = now - job['created_at']
+    if age > EXPIRY_AGE and rng.random() < EXPIRED_SHARE:
+        expired = job['created_at'] + timedelta(seconds=rng.uniform(EXPIRY_AGE.total_seconds(), age.total_seconds()))
+        job['is_active'] = False
+        job['expired_date'] = expired
+        job['last_verified'] = expired
+        job['updated_at'] = expired
+    else:
+        job['last_verified'] = now - timedelta(seconds=rng.randint(0, min(int(age.total_seconds()), 7 * 86400)))
+
+
+def generate_chunk(task: tuple) -> Dict:
+    """Generate and insert jobs [start, end) with their sessions (runs in a worker)"""
+    start, end, seed, days, batch_size, now = task
+    rng = random.Random(f"{seed}-{start}")
+
+    inserted = 0
+    jobs = []
+    sessions = []
+    i = start
+    while i < end:
+        category = CATEGORY_SAMPLER.sample(rng)
+        location = rng.choice(SEARCH_LOCATIONS)
+        scraped_at = now - timedelta(days=days * rng.random() ** 1.5)
+        found = rng.randint(*SESSION_SIZE)
+        new = min(rng.randint(found // 3, found), end - i)
+        session_id = str(uuid.UUID(int=rng.getrandbits(128)))
+
+        for offset in range(new):
+            job = stored_job(i, rng, scraped_at + timedelta(seconds=offset), category, session_id)
+            _age(job, rng, now)
+            jobs.append(job)
+            i += 1
+            if len(jobs) >= batch_size:
+                inserted += len(_insert(_db.jobs, jobs))
+                jobs = []
+
+        sessions.append({
+            "session_id": session_id,
+            "search_query": category,
+            "search_location": location,
+            "platforms": ["linkedin", "jsearch"],
+            "total_jobs": found,
+            "new_jobs": new,
+            "duplicate_jobs": found - new,
+            "scraped_at": scraped_at,
+            "status": "completed"
+        })
+
+    if jobs:
+        inserted += len(_insert(_db.jobs, jobs))
+    new_sessions = _insert(_db.scrape_sessions, sessions)
+
+    # search_metadata totals only grow by sessions this run added
+    searches = {}
+    for session in new_sessions:
+        search_key = f"{session['search_query']}_{session['search_location']}".lower().replace(" ", "_")
+        search = searches.setdefault(search_key, {
+            "search_query": session["search_query"],
+            "search_location": session["search_location"],
+            "total_scraped": 0,
+            "last_scrape_date": session["scraped_at"]
+        })
+        search["total_scraped"] += session["total_jobs"]
+        search["last_scrape_date"] = max(search["last_scrape_date"], session["scraped_at"])
+
+    return {'jobs': end - start, 'inserted': inserted, 'sessions': len(new_sessions), 'searches': searches}
+
+
+def _merge_searches(total: Dict, searches: Dict):
+    for search_key, search in searches.items():
+        merged = total.setdefault(search_key, dict(search, total_scraped=0))
+        merged["total_scraped"] += search["total_scraped"]
+        merged["last_scrape_date"] = max(merged["last_scrape_date"], search["last_scrape_date"])
+
+
+def _write_search_metadata(db, searches: Dict):
+    operations = [
+        UpdateOne(
+            {"search_key": search_key},
+            {
+                "$set": {
+                    "search_query": search["search_query"],
+                    "search_location": search["search_location"],
+                    "platforms_used": ["linkedin", "jsearch"],
+                    "last_scrape_date": search["last_scrape_date"]
+                },
+                "$inc": {"last_offset": search["total_scraped"], "total_scraped": search["total_scraped"]}
+            },
+            upsert=True
+        )
+        for search_key, search in searches.items()
+    ]
+    if operations:
+        db.search_metadata.bulk_write(operations, ordered=False)
+
+
+async def _finish(mongodb_url: str, database: str):
+    """Indexes and the company_stats read model, once all jobs are in"""
+    client = AsyncIOMotorClient(mongodb_url)
+    db = client[database]
+    try:
+        await ensure_indexes(db)
+        await CompanyStatsStore(db).rebuild()
+    finally:
+        client.close()
+
+
+def generate(
+    mongodb_url: str,
+    database: str,
+    total: int,
+    workers: int = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int = 42,
+    days: int = 90,
+    first_id: int = 0,
+    drop: bool = False
+) -> Dict:
+    """Generate `total` jobs (ids first_id..first_id + total - 1) into `database`"""
+    workers = workers or multiprocessing.cpu_count()
+    client = MongoClient(mongodb_url)
+    if drop:
+        client.drop_database(database)
+    _ensure_unique_indexes(client[database])
+
+    now = datetime.utcnow()
+    tasks = [
+        (start, min(start + CHUNK_SIZE, first_id + total), seed, days, batch_size, now)
+        for start in range(first_id, first_id + total, CHUNK_SIZE)
+    ]
+
+    print(f"🌱 Generating {total:,} jobs into {database} with {workers} workers...")
+    started = time.perf_counter()
+    counts = {'jobs': 0, 'inserted': 0, 'sessions': 0}
+    searches = {}
+    # spawn rather than fork: callers (bench_api.py) may have Mongo clients and threads running
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers, initializer=_init_worker, initargs=(mongodb_url, database)) as pool:
+        for result in pool.imap_unordered(generate_chunk, tasks):
+            for key in counts:
+                counts[key] += result[key]
+            _merge_searches(searches, result['searches'])
+            elapsed = time.perf_counter() - started
+            print(f"  ✅ {counts['jobs']:,}/{total:,} jobs ({counts['jobs'] / elapsed:,.0f} jobs/s)")
+
+    _write_search_metadata(client[database], searches)
+    load_seconds = time.perf_counter() - started
+    client.close()
+
+    print("🗂️  Building indexes and company stats...")
+    asyncio.run(_finish(mongodb_url, database))
+
+    return {
+        **counts,
+        'searches': len(searches),
+        'load_seconds': round(load_seconds, 1),
+        'total_seconds': round(time.perf_counter() - started, 1)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, required=True, help="Number of jobs to generate")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Documents per insert_many")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=90, help="Spread created_at over this many days")
+    parser.add_argument("--first-id", type=int, default=0, help="First job number (to append to an existing dataset)")
+    parser.add_argument("--database", default=BENCH_DATABASE)
+    parser.add_argument("--mongodb-url", default=settings.mongodb_url)
+    parser.add_argument("--drop", action="store_true", help="Drop the database first")
+    parser.add_argument("--force", action="store_true", help="Allow writing into the application database")
+    args = parser.parse_args()
+
+    if args.database == settings.database_name and not args.force:
+        parser.error(f"'{args.database}' is the application database; pass --force to write synthetic jobs into it")
+
+    summary = generate(
+        args.mongodb_url, args.database, args.jobs, args.workers, args.batch_size,
+        args.seed, args.days, args.first_id, args.drop
+    )
+
+    print(f"\n{'='*60}")
+    print(f"✅ Dataset Generated!")
+    print(f"{'='*60}")
+    print(f"📄 Jobs inserted: {summary['inserted']:,} of {summary['jobs']:,}")
+    print(f"🆔 Scrape sessions: {summary['sessions']:,}")
+    print(f"🔎 Searches: {summary['searches']}")
+    print(f"⏱️  Load: {summary['load_seconds']}s, total: {summary['total_seconds']}s")
+    print(f"{'='*60}\n")
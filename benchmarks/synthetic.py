@@ -0,0 +1,238 @@
+"""
+Synthetic jobs shaped like scraped ones
+
+Distributions follow what live scrapes look like: a few companies and search
+categories account for most jobs (Zipfian), descriptions are a few thousand
+characters with a long tail (log-normal), about a third of jobs carry a
+salary in the format their source uses, and locations lean towards large
+US metros and "Remote".
+
+`scraped_job` returns what a scraper hands to JobWriter. `stored_job` is the
+same job normalized the way JobWriter stores it, for seeding collections
+directly with insert_many (see generate_dataset.py).
+"""
+
+import math
+import random
+from bisect import bisect
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Sequence
+
+from app.services.location_parser import location_fields
+from app.services.salary_parser import salary_fields
+
+NUM_COMPANIES = 5000
+
+# Search category -> titles scraped for it, most searched first
+CATEGORY_TITLES = {
+    "Software Engineer": ["Software Engineer", "Senior Software Engineer", "Software Engineer II", "Staff Software Engineer"],
+    "Python Developer": ["Python Developer", "Senior Python Developer", "Backend Engineer (Python)", "Python Engineer"],
+    "Data Scientist": ["Data Scientist", "Senior Data Scientist", "Applied Scientist", "Data Scientist, Product Analytics"],
+    "Frontend Developer": ["Frontend Developer", "React Developer", "Senior Frontend Engineer", "UI Engineer"],
+    "Data Engineer": ["Data Engineer", "Senior Data Engineer", "Analytics Engineer", "Big Data Engineer"],
+    "Devops Engineer": ["DevOps Engineer", "Site Reliability Engineer", "Platform Engineer", "Cloud Engineer"],
+    "Java Developer": ["Java Developer", "Senior Java Engineer", "Java Backend Developer", "Spring Boot Developer"],
+    "Machine Learning Engineer": ["Machine Learning Engineer", "ML Engineer", "MLOps Engineer", "AI Engineer"],
+    "Full Stack Developer": ["Full Stack Developer", "Full Stack Engineer", "Senior Full Stack Engineer"],
+    "Product Manager": ["Product Manager", "Senior Product Manager", "Technical Product Manager"],
+    "Spring Boot": ["Spring Boot Developer", "Java Spring Developer", "Backend Developer (Spring)"],
+    "Qa Engineer": ["QA Engineer", "Software Engineer in Test", "Test Automation Engineer"],
+    "Mobile Developer": ["iOS Developer", "Android Developer", "React Native Developer", "Mobile Engineer"],
+    "Data Analyst": ["Data Analyst", "Business Intelligence Analyst", "Senior Data Analyst"],
+    "Security Engineer": ["Security Engineer", "Application Security Engineer", "Cloud Security Engineer"],
+    "Golang Developer": ["Go Developer", "Backend Engineer (Go)", "Senior Golang Engineer"],
+    "Engineering Manager": ["Engineering Manager", "Senior Engineering Manager", "Director of Engineering"],
+    "Ux Designer": ["UX Designer", "Product Designer", "Senior UX/UI Designer"],
+    "Rust Developer": ["Rust Engineer", "Systems Engineer (Rust)"],
+    "Embedded Engineer": ["Embedded Software Engineer", "Firmware Engineer"],
+}
+CATEGORIES = list(CATEGORY_TITLES)
+
+# (location, weight)
+LOCATIONS = [
+    ("United States", 14), ("Remote", 12), ("New York, NY", 10), ("San Francisco, CA", 9),
+    ("Seattle, WA", 6), ("Austin, TX", 5), ("Boston, MA", 4), ("Chicago, IL", 4),
+    ("Los Angeles, CA", 3), ("Denver, CO", 2), ("Atlanta, GA", 2), ("San Jose, CA", 2),
+    ("Greater Seattle Area", 1), ("New York City Metropolitan Area", 2), ("Remote, US", 3),
+    ("Austin, Texas, United States", 1), ("Dallas, TX (Hybrid)", 1), ("Raleigh, NC", 1),
+    ("London, England, United Kingdom", 4), ("Berlin, Germany", 3), ("Munich", 1),
+    ("Amsterdam, North Holland, Netherlands", 2), ("Paris, Île-de-France, France", 1),
+    ("Toronto, Ontario, Canada", 3), ("Vancouver, BC", 1), ("Bengaluru, Karnataka, India", 4),
+    ("Hyderabad, Telangana, India", 2), ("Sydney, NSW", 1), ("Singapore", 1), ("Dublin, Ireland", 1),
+]
+
+# (source, weight, salary share)
+SOURCES = [("linkedin", 55, 0.25), ("jsearch", 40, 0.45), ("arbeitnow", 5, 0.0)]
+
+JOB_TYPES = [("Full-time", 70), ("Contract", 12), ("Remote", 8), ("Part-time", 5), ("Internship", 3), ("Temporary", 2)]
+
+# Country code -> (currency symbol, typical annual range)
+SALARY_BANDS = {
+    'US': ("$", 70_000, 240_000),
+    'GB': ("£", 40_000, 120_000),
+    'DE': ("€", 50_000, 110_000),
+    'NL': ("€", 45_000, 100_000),
+    'FR': ("€", 40_000, 90_000),
+    'IE': ("€", 50_000, 110_000),
+    'CA': ("CA$", 70_000, 180_000),
+    'IN': ("₹", 800_000, 4_500_000),
+    'AU': ("A$", 90_000, 200_000),
+    'SG': ("S$", 60_000, 180_000),
+}
+
+SENTENCES = [
+    "We are looking for an engineer to join a team that owns services used by millions of people every day.",
+    "You will design, build and operate systems end to end, from the first design document to production monitoring.",
+    "You will work closely with product managers, designers and other engineers to decide what to build next.",
+    "Our stack includes Python, Go, TypeScript, PostgreSQL, Kafka and Kubernetes running on AWS.",
+    "Experience with any of these is a plus, but we care more about fundamentals than specific tools.",
+    "You have shipped and maintained production software and know how to debug it when it breaks.",
+    "You write clear code and clear documents, and you review other people's work with care.",
+    "You are comfortable with ambiguity and can break a large problem into pieces a team can deliver.",
+    "Familiarity with distributed systems, caching and data modelling will help you from day one.",
+    "We value ownership: the people who build a service are the people who run it.",
+    "The role includes a share of the on-call rotation, with compensation and a blameless review culture.",
+    "We offer competitive salary and equity, medical, dental and vision coverage, and a learning budget.",
+    "Our team is distributed across several time zones and works mostly asynchronously.",
+    "We are an equal opportunity employer and welcome applicants from every background.",
+    "You will mentor other engineers and help shape our hiring and onboarding process.",
+    "Bonus points for open source contributions, conference talks or a technical blog.",
+    "In your first months you will ship a feature to production and take part in architecture reviews.",
+    "We care about accessibility, performance and security, and treat them as features rather than afterthoughts.",
+    "Our customers range from small startups to some of the largest companies in the world.",
+    "Relocation assistance and visa sponsorship are available for this position.",
+]
+
+_NAME_PARTS = (
+    ["North", "Blue", "Bright", "Cloud", "Data", "Quantum", "Vertex", "Silver", "Apex", "Nova", "Open", "Iron",
+     "Pixel", "Signal", "Harbor", "Summit", "Pine", "Atlas", "Lumen", "Echo", "Cobalt", "Stellar", "Granite", "Orbit"],
+    ["forge", "stack", "wave", "bridge", "works", "logic", "line", "scale", "path", "grid", "core", "field",
+     "point", "loop", "shift", "base", "mind", "craft", "labs", "stream"],
+    ["", " Inc", " Labs", " Technologies", " Systems", " Health", " Software", " AI", " Group", " Analytics", " Cloud", " Robotics"],
+)
+
+
+class ZipfSampler:
+    """Draws from `population` with weight 1 / rank**exponent (first item is rank 1)"""
+
+    def __init__(self, population: Sequence, exponent: float = 1.1):
+        self.population = list(population)
+        self.cum_weights = list(accumulate(1 / rank ** exponent for rank in range(1, len(self.population) + 1)))
+        self.total = self.cum_weights[-1]
+
+    def sample(self, rng: random.Random):
+        return self.population[bisect(self.cum_weights, rng.random() * self.total)]
+
+
+class WeightedSampler:
+    def __init__(self, weighted: Sequence[tuple]):
+        self.population = [item[0] for item in weighted]
+        self.cum_weights = list(accumulate(item[1] for item in weighted))
+        self.total = self.cum_weights[-1]
+
+    def sample(self, rng: random.Random):
+        return self.population[bisect(self.cum_weights, rng.random() * self.total)]
+
+
+def company_names(count: int) -> List[str]:
+    """`count` distinct, deterministic company names (at most 5760)"""
+    prefixes, stems, suffixes = _NAME_PARTS
+    names = [prefix + stem + suffix for suffix in suffixes for stem in stems for prefix in prefixes]
+    return names[:count]
+
+
+# Shuffled so the most common companies don't all share a name stem
+_COMPANY_NAMES = company_names(NUM_COMPANIES)
+random.Random(0).shuffle(_COMPANY_NAMES)
+COMPANIES = ZipfSampler(_COMPANY_NAMES, exponent=1.07)
+CATEGORY_SAMPLER = ZipfSampler(CATEGORIES, exponent=1.2)
+LOCATION_SAMPLER = WeightedSampler(LOCATIONS)
+SOURCE_SAMPLER = WeightedSampler([(source, weight) for source, weight, _ in SOURCES])
+SALARY_SHARE = {source: share for source, _, share in SOURCES}
+JOB_TYPE_SAMPLER = WeightedSampler(JOB_TYPES)
+
+# One long text to cut descriptions from (cheaper than joining sentences per job)
+_CORPUS_RNG = random.Random(0)
+_CORPUS = "\n\n".join(
+    " ".join(_CORPUS_RNG.sample(SENTENCES, 5)) for _ in range(120)
+)
+_PARAGRAPH_STARTS = [0] + [i + 1 for i, char in enumerate(_CORPUS[:-15000]) if char == "\n"]
+
+
+def description(rng: random.Random) -> str:
+    """Log-normal length around 2.6k characters, 400 to 15k"""
+    length = int(min(15000, max(400, rng.lognormvariate(math.log(2600), 0.55))))
+    start = rng.choice(_PARAGRAPH_STARTS)
+    return _CORPUS[start:start + length]
+
+
+def salary(rng: random.Random, source: str, country: str) -> str:
+    """Display string as the source formats it, or None"""
+    if rng.random() >= SALARY_SHARE[source]:
+        return None
+    symbol, low, high = SALARY_BANDS.get(country or 'US', SALARY_BANDS['US'])
+    minimum = rng.uniform(low, high * 0.8)
+    maximum = minimum * rng.uniform(1.1, 1.5)
+    if source == "jsearch" and rng.random() < 0.2:
+        # Hourly contract rates
+        return f"{symbol}{minimum / 2080:.0f} - {symbol}{maximum / 2080:.0f} per hour"
+    if source == "jsearch":
+        return f"{symbol}{minimum / 1000:.0f}K - {symbol}{maximum / 1000:.0f}K/yr"
+    return f"{symbol}{round(minimum, -3):,.2f} - {symbol}{round(maximum, -3):,.2f}/yr"
+
+
+@lru_cache(maxsize=None)
+def _location_fields(location: str) -> Dict:
+    return location_fields({'location': location})
+
+
+def _job_id(i: int, source: str) -> str:
+    if source == "linkedin":
+        return f"linkedin_{3_700_000_000 + i}"
+    if source == "jsearch":
+        return f"jsearch_{i:012x}AAAAAAAAAA=="
+    return f"arbeitnow_job-{i}"
+
+
+def scraped_job(i: int, rng: random.Random, created_at: datetime = None, category: str = None) -> Dict:
+    """Job `i` as a scraper returns it"""
+    now = datetime.utcnow()
+    created_at = created_at or now - timedelta(seconds=rng.randint(0, 30 * 86400))
+    category = category or CATEGORY_SAMPLER.sample(rng)
+    source = SOURCE_SAMPLER.sample(rng)
+    location = LOCATION_SAMPLER.sample(rng)
+    return {
+        'job_id': _job_id(i, source),
+        'title': rng.choice(CATEGORY_TITLES[category]),
+        'company': COMPANIES.sample(rng),
+        'location': location,
+        'url': f"https://example.com/{source}/jobs/{i}",
+        'description': description(rng),
+        'source': source,
+        'job_type': JOB_TYPE_SAMPLER.sample(rng),
+        'salary': salary(rng, source, _location_fields(location).get('country')),
+        'posted_date': created_at - timedelta(hours=rng.randint(0, 14 * 24)),
+        'is_active': True,
+        'created_at': created_at,
+        'last_verified': now,
+    }
+
+
+def stored_job(
+    i: int,
+    rng: random.Random,
+    created_at: datetime = None,
+    category: str = None,
+    session_id: str = "bench"
+) -> Dict:
+    """Job `i` as JobWriter stores it (normalized salary/location, category, session)"""
+    category = category or CATEGORY_SAMPLER.sample(rng)
+    job = scraped_job(i, rng, created_at, category)
+    job.update(salary_fields(job))
+    job.update(_location_fields(job['location']))
+    job['search_category'] = category
+    job['scrape_session_id'] = session_id
+    job['updated_at'] = job['created_at']
+    return job
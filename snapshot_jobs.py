@@ -0,0 +1,201 @@
+"""
+Parquet Snapshot of the Jobs Collection
+
+Writes jobs to Hive-partitioned Parquet files for analytics:
+
+    <snapshot_dir>/created_day=2024-05-01/source=linkedin/part-<run>-<n>.parquet
+
+Runs are incremental. Each run only appends documents whose `updated_at` moved
+past the watermark saved by the previous run (the first run exports
+everything). A job that changed is therefore written again: readers should
+keep the row with the latest `updated_at` per `job_id`.
+
+Salary and location are exported as the normalized columns (salary_min /
+salary_max in annual USD, city / region / country / is_remote), so nothing
+has to re-parse display strings.
+
+Requires pyarrow (pip install pyarrow), which the API itself does not need.
+
+Usage:
+    python snapshot_jobs.py [--full]
+"""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+
+BATCH_SIZE = 50000
+WATERMARK_FILE = "_watermark.json"
+
+# Writes are stamped before they commit, so re-read a little behind the
+# previous watermark rather than risk missing one (duplicates are harmless)
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+COLUMNS = [
+    ('job_id', 'string'),
+    ('title', 'string'),
+    ('company', 'string'),
+    ('search_category', 'string'),
+    ('job_type', 'string'),
+    ('location', 'string'),
+    ('city', 'string'),
+    ('region', 'string'),
+    ('country', 'string'),
+    ('is_remote', 'bool'),
+    ('salary', 'string'),
+    ('salary_min', 'int64'),
+    ('salary_max', 'int64'),
+    ('url', 'string'),
+    ('description', 'string'),
+    ('scrape_session_id', 'string'),
+    ('is_active', 'bool'),
+    ('posted_date', 'timestamp'),
+    ('created_at', 'timestamp'),
+    ('updated_at', 'timestamp'),
+    ('last_verified', 'timestamp'),
+    ('expired_date', 'timestamp'),
+]
+
+PARTITION_COLUMNS = [('created_day', 'string'), ('source', 'string')]
+
+
+def arrow_type(name):
+    return {
+        'string': pa.string(),
+        'bool': pa.bool_(),
+        'int64': pa.int64(),
+        'timestamp': pa.timestamp('ms'),
+    }[name]
+
+
+def column_value(job, field, kind):
+    value = job.get(field)
+    if value is None:
+        return None
+    if kind == 'string':
+        return value if isinstance(value, str) else str(value)
+    if kind == 'timestamp':
+        return value if isinstance(value, datetime) else None
+    if kind == 'int64':
+        return int(value) if isinstance(value, (int, float)) else None
+    return bool(value)
+
+
+def to_table(jobs, schema):
+    """Build an Arrow table (columns + partition keys) from raw job documents"""
+    data = {
+        field: [column_value(job, field, kind) for job in jobs]
+        for field, kind in COLUMNS
+    }
+    data['created_day'] = [
+        job['created_at'].strftime('%Y-%m-%d') if isinstance(job.get('created_at'), datetime) else 'unknown'
+        for job in jobs
+    ]
+    data['source'] = [job.get('source') or 'unknown' for job in jobs]
+    return pa.table(data, schema=schema)
+
+
+def read_watermark(snapshot_dir):
+    path = os.path.join(snapshot_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return datetime.fromisoformat(json.load(f)['updated_at'])
+
+
+def write_watermark(snapshot_dir, watermark, exported):
+    path = os.path.join(snapshot_dir, WATERMARK_FILE)
+    with open(path + ".tmp", "w") as f:
+        json.dump({'updated_at': watermark.isoformat(), 'exported': exported}, f)
+    os.replace(path + ".tmp", path)
+
+
+async def snapshot_jobs(full: bool = False):
+    if pa is None:
+        print("❌ pyarrow is not installed. Run: pip install pyarrow")
+        return
+
+    snapshot_dir = settings.snapshot_dir
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.database_name]
+    collection = db.jobs
+
+    schema = pa.schema(
+        [(field, arrow_type(kind)) for field, kind in COLUMNS]
+        + [(field, arrow_type(kind)) for field, kind in PARTITION_COLUMNS]
+    )
+    partitioning = ds.partitioning(
+        pa.schema([(field, arrow_type(kind)) for field, kind in PARTITION_COLUMNS]),
+        flavor="hive"
+    )
+
+    # Everything stamped up to now belongs to this run
+    run_started = datetime.utcnow()
+    watermark = None if full else read_watermark(snapshot_dir)
+    if watermark:
+        query = {'updated_at': {'$gt': watermark - WATERMARK_OVERLAP, '$lte': run_started}}
+    else:
+        query = {}
+
+    print(f"\n{'='*60}")
+    print(f"📦 Snapshotting jobs to {snapshot_dir}")
+    print(f"🕒 Changes since: {watermark.isoformat() if watermark else 'beginning (full export)'}")
+    print(f"{'='*60}\n")
+
+    run_id = run_started.strftime('%Y%m%dT%H%M%S%f')
+    exported = 0
+    batch_number = 0
+    batch = []
+
+    def flush(jobs):
+        nonlocal batch_number
+        ds.write_dataset(
+            to_table(jobs, schema),
+            snapshot_dir,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template=f"part-{run_id}-{batch_number}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+        batch_number += 1
+
+    projection = {field: 1 for field, _ in COLUMNS}
+    projection['source'] = 1
+    async for job in collection.find(query, projection).batch_size(5000):
+        batch.append(job)
+        if len(batch) >= BATCH_SIZE:
+            flush(batch)
+            exported += len(batch)
+            batch = []
+            print(f"  ✅ Exported {exported} jobs...")
+
+    if batch:
+        flush(batch)
+        exported += len(batch)
+
+    write_watermark(snapshot_dir, run_started, exported)
+
+    print(f"\n{'='*60}")
+    print(f"✅ Snapshot Complete!")
+    print(f"{'='*60}")
+    print(f"📄 Jobs exported: {exported}")
+    print(f"🕒 New watermark: {run_started.isoformat()}")
+    print(f"{'='*60}\n")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(snapshot_jobs(full="--full" in sys.argv))